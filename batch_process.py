@@ -3,7 +3,15 @@
 Batch Process Pairing Files
 
 This script processes all .DAT and .PDF files in a specified folder,
-parses them into JSON, and imports them into MongoDB.
+parses them into JSON, and imports them into MongoDB. Parsing and import run
+in this process with one parser config and one MongoDB connection.
+
+Runs are incremental: a manifest in the output directory records each
+input's content hash, parser version and config hash, so files unchanged
+since the last run are neither re-parsed nor re-imported (--force redoes
+everything). Imports are applied as a pairing-level delta (see
+mongodb_import.py --delta), so a reissued file only writes its added and
+changed pairings.
 
 Output files are named with parent folder prefix by default:
     "February 2026/ORDDSL.DAT" -> "February_2026_ORDDSL.json"
@@ -13,16 +21,27 @@ Usage:
     python3 batch_process.py --folder "Pairing Source Docs/February 2026" --no-import
     python3 batch_process.py --folder "Pairing Source Docs" --recursive
     python3 batch_process.py --folder "Pairing Source Docs/February 2026" --no-parent-folder
+    python3 batch_process.py --folder "Pairing Source Docs/February 2026" --pipeline
+    python3 batch_process.py --folder "Pairing Source Docs" --recursive --force
 """
 
 import argparse
+import hashlib
 import sys
+import time
+import queue
+import threading
 from pathlib import Path
-import subprocess
-import json
 from datetime import datetime
 
 
+# Phases reported in the timing breakdown
+TIMING_PHASES = ('startup', 'parse', 'validate', 'serialize', 'import')
+
+# Incremental run manifest, kept in the output directory
+MANIFEST_NAME = '.batch_manifest.json'
+
+
 def find_pairing_files(folder: Path, recursive: bool = False) -> list:
     """Find all .DAT and .PDF files in the specified folder."""
     files = []
@@ -44,14 +63,8 @@ def find_pairing_files(folder: Path, recursive: bool = False) -> list:
     return files
 
 
-def parse_file(input_file: Path, output_dir: Path, include_parent_folder: bool = True) -> tuple:
-    """
-    Parse a pairing file to JSON.
-
-    Returns:
-        tuple: (success: bool, output_file: Path, error_message: str)
-    """
-    # Generate output filename with parent folder name
+def get_output_path(input_file: Path, output_dir: Path, include_parent_folder: bool = True) -> Path:
+    """Get the JSON output path for a pairing file."""
     if include_parent_folder and input_file.parent.name:
         # Include parent folder name in output filename
         # e.g., "February 2026/ORDDSL.DAT" -> "February_2026_ORDDSL.json"
@@ -60,88 +73,318 @@ def parse_file(input_file: Path, output_dir: Path, include_parent_folder: bool =
     else:
         output_filename = input_file.stem + '.json'
 
-    output_path = output_dir / output_filename
+    return output_dir / output_filename
 
-    # Build parser command
-    cmd = [
-        'python3', '-m', 'src.main',
-        '-i', str(input_file),
-        '-o', str(output_path)
-    ]
 
-    try:
-        print(f"\n{'='*80}")
-        print(f"Parsing: {input_file.name}")
-        print(f"Output:  {output_path.name}")
-        print(f"{'='*80}")
+class BatchPipeline:
+    """
+    Parse and import pairing files in one process.
+
+    The parser config, logger and MongoDB client (with its indexes) are set
+    up once and reused for every file instead of per-file subprocesses.
+    """
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+    def __init__(
+        self,
+        output_dir: Path,
+        include_parent_folder: bool = True,
+        do_import: bool = True,
+        connection_string: str = None,
+        config_path: str = None,
+        verbose: bool = False,
+        no_cache: bool = False,
+        rebuild_cache: bool = False,
+        style: str = None,
+        force: bool = False
+    ):
+        """
+        Initialize pipeline and pay all one-time startup costs.
+
+        Args:
+            output_dir: Output directory for JSON files
+            include_parent_folder: Prefix output names with the parent folder
+            do_import: Import parsed files into MongoDB
+            connection_string: MongoDB connection string (default: secrets.toml or localhost)
+            config_path: Parser configuration YAML (default: config/parser_config.yaml)
+            verbose: Show parser log output on the console
+            no_cache: Always extract PDF text (ignore the text cache)
+            rebuild_cache: Re-extract PDF text and overwrite cached entries
+            style: JSON output style, 'pretty' or 'compact' (default: output.style)
+            force: Parse and import every file, even if unchanged since the last run
+        """
+        start = time.perf_counter()
+
+        self.output_dir = output_dir
+        self.include_parent_folder = include_parent_folder
+        self.force = force
+        self.timings = dict.fromkeys(TIMING_PHASES, 0.0)
+        self.results = {
+            'total': 0,
+            'parsed': 0,
+            'parse_failed': 0,
+            'parse_skipped': 0,
+            'imported': 0,
+            'import_failed': 0,
+            'import_skipped': 0,
+            'errors': []
+        }
+
+        from src.main import load_config, process_single_file, apply_cache_options
+        from src.utils import get_logger
+        from src.utils.manifest import ProcessingManifest, get_parser_version, get_config_hash
+
+        self._process_single_file = process_single_file
+        self.config = load_config(config_path)
+        apply_cache_options(self.config, no_cache, rebuild_cache)
+        if style:
+            self.config['output']['style'] = style
+
+        log_config = dict(self.config['logging'])
+        if not verbose:
+            # Per-file progress is printed by the pipeline itself
+            log_config['level'] = 'WARNING'
+        self.logger = get_logger("PairingParser", log_config)
+
+        self.manifest = ProcessingManifest(
+            output_dir / MANIFEST_NAME, get_parser_version(), get_config_hash(self.config)
         )
 
-        if result.returncode == 0:
-            print(f"✓ Successfully parsed {input_file.name}")
-            return (True, output_path, None)
-        else:
-            error_msg = result.stderr or result.stdout
-            print(f"✗ Failed to parse {input_file.name}")
-            print(f"Error: {error_msg}")
-            return (False, None, error_msg)
+        self.importer = None
+        self.import_target = None
+        if do_import:
+            self.importer, self.import_target = self._connect(connection_string)
 
-    except subprocess.TimeoutExpired:
-        error_msg = "Parsing timeout (5 minutes exceeded)"
-        print(f"✗ {error_msg}")
-        return (False, None, error_msg)
-    except Exception as e:
-        error_msg = str(e)
-        print(f"✗ Unexpected error: {error_msg}")
-        return (False, None, error_msg)
+        self.timings['startup'] = time.perf_counter() - start
 
+    @staticmethod
+    def _connect(connection_string: str = None) -> tuple:
+        """
+        Connect to MongoDB and create indexes once for the whole batch.
 
-def import_to_mongodb(json_file: Path) -> tuple:
-    """
-    Import a JSON file to MongoDB.
+        Returns:
+            tuple: (importer, import target id recorded in the manifest)
+        """
+        # Imported here so --no-import runs do not need pymongo
+        from mongodb_import import MongoDBImporter, get_connection_from_secrets
 
-    Returns:
-        tuple: (success: bool, error_message: str)
-    """
-    cmd = [
-        'python3', 'mongodb_import.py',
-        '--file', str(json_file)
-    ]
+        if not connection_string:
+            connection_string = get_connection_from_secrets() or "mongodb://localhost:27017/"
+
+        print("Connecting to MongoDB...")
+        importer = MongoDBImporter(connection_string)
+        if not importer.test_connection():
+            raise ConnectionError("MongoDB connection failed")
+
+        importer.create_indexes()
+
+        # Identifies the database without storing credentials in the manifest
+        server = hashlib.sha256(connection_string.encode()).hexdigest()[:16]
+        return importer, f"{server}/{importer.db.name}"
+
+    def parse_file(self, input_file: Path) -> tuple:
+        """
+        Parse a pairing file to JSON.
+
+        Returns:
+            tuple: (success: bool, output_file: Path, error_message: str)
+        """
+        output_path = get_output_path(input_file, self.output_dir, self.include_parent_folder)
 
-    try:
         print(f"\n{'='*80}")
-        print(f"Importing to MongoDB: {json_file.name}")
+        print(f"Parsing: {input_file.name}")
+        print(f"Output:  {output_path.name}")
         print(f"{'='*80}")
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+        stats = {}
+        success = self._process_single_file(
+            str(input_file),
+            str(output_path),
+            self.config,
+            self.logger,
+            show_progress=False,
+            stats_out=stats
         )
 
-        if result.returncode == 0:
-            print(f"✓ Successfully imported {json_file.name}")
+        for phase, seconds in stats.get('timings', {}).items():
+            self.timings[phase] += seconds
+
+        if success:
+            print(f"✓ Successfully parsed {input_file.name} "
+                  f"({stats.get('pairings_parsed', 0)} pairings, "
+                  f"{stats.get('output_bytes', 0) / (1024 * 1024):.2f} MB JSON "
+                  f"serialized in {stats['timings']['serialize']:.2f}s)")
+            self.manifest.record_parse(input_file, output_path, stats.get('output_files'))
+            return (True, output_path, None)
+
+        error_msg = stats.get('error', 'see log for details')
+        print(f"✗ Failed to parse {input_file.name}")
+        print(f"Error: {error_msg}")
+        return (False, None, error_msg)
+
+    def unchanged_output(self, input_file: Path):
+        """
+        Check the manifest for a current parse of an input file.
+
+        Returns:
+            Output file to reuse, or None if the file must be parsed
+        """
+        if self.force:
+            return None
+
+        output_path = get_output_path(input_file, self.output_dir, self.include_parent_folder)
+        if not self.manifest.is_parsed(input_file, output_path):
+            return None
+
+        print(f"↷ Unchanged: {input_file.name} (reusing {output_path.name})")
+        self.results['parse_skipped'] += 1
+        return output_path
+
+    def needs_import(self, input_file: Path) -> bool:
+        """Whether an input's current output still has to be imported."""
+        if self.importer is None:
+            return False
+        if not self.force and self.manifest.is_imported(input_file, self.import_target):
+            print(f"↷ Already imported: {input_file.name}")
+            self.results['import_skipped'] += 1
+            return False
+        return True
+
+    def import_to_mongodb(self, json_file: Path) -> tuple:
+        """
+        Import a JSON file to MongoDB using the shared client.
+
+        Returns:
+            tuple: (success: bool, error_message: str)
+        """
+        start = time.perf_counter()
+        try:
+            # Reissued files only write their added and changed pairings
+            stats = self.importer.import_file(json_file, delta=True)
+            if stats['write_errors']:
+                error_msg = f"{stats['write_errors']} documents not written"
+                print(f"✗ Failed to import {json_file.name}: {error_msg}")
+                return (False, error_msg)
+            print(f"✓ Successfully imported {json_file.name} "
+                  f"({stats['pairings']} pairings, {stats['legs']} legs written, "
+                  f"{stats['pairings_unchanged']} pairings unchanged)")
             return (True, None)
-        else:
-            error_msg = result.stderr or result.stdout
+        except Exception as e:
+            error_msg = str(e)
             print(f"✗ Failed to import {json_file.name}")
             print(f"Error: {error_msg}")
             return (False, error_msg)
+        finally:
+            self.timings['import'] += time.perf_counter() - start
 
-    except subprocess.TimeoutExpired:
-        error_msg = "Import timeout (5 minutes exceeded)"
-        print(f"✗ {error_msg}")
-        return (False, error_msg)
-    except Exception as e:
-        error_msg = str(e)
-        print(f"✗ Unexpected error: {error_msg}")
-        return (False, error_msg)
+    def _record_parse(self, input_file: Path, success: bool, error: str):
+        if success:
+            self.results['parsed'] += 1
+        else:
+            self.results['parse_failed'] += 1
+            self.results['errors'].append({
+                'file': input_file.name,
+                'stage': 'parse',
+                'error': error
+            })
+
+    def _record_import(self, input_file: Path, success: bool, error: str):
+        if success:
+            self.results['imported'] += 1
+            self.manifest.record_import(input_file, self.import_target)
+        else:
+            self.results['import_failed'] += 1
+            self.results['errors'].append({
+                'file': input_file.name,
+                'stage': 'import',
+                'error': error
+            })
+
+    def run(self, files: list) -> dict:
+        """
+        Parse then import each file in turn.
+
+        Args:
+            files: Pairing files to process
+
+        Returns:
+            Results dictionary
+        """
+        self.results['total'] += len(files)
+
+        for input_file in files:
+            output_file = self.unchanged_output(input_file)
+            if output_file is None:
+                success, output_file, error = self.parse_file(input_file)
+                self._record_parse(input_file, success, error)
+                if not success:
+                    continue
+
+            if self.needs_import(input_file):
+                self._record_import(input_file, *self.import_to_mongodb(output_file))
+
+        return self.results
+
+    def run_pipelined(self, files: list, queue_size: int = 2) -> dict:
+        """
+        Parse and import concurrently.
+
+        Parsing (CPU) runs on the calling thread while a single import thread
+        (network I/O) drains a bounded queue, so at most queue_size parsed
+        files wait for import at any time.
+
+        Args:
+            files: Pairing files to process
+            queue_size: Maximum number of parsed files waiting for import
+
+        Returns:
+            Results dictionary
+        """
+        if self.importer is None:
+            return self.run(files)
+
+        self.results['total'] += len(files)
+        pending = queue.Queue(maxsize=queue_size)
+        lock = threading.Lock()
+
+        def import_worker():
+            while True:
+                item = pending.get()
+                if item is None:
+                    break
+                input_file, output_file = item
+                success, error = self.import_to_mongodb(output_file)
+                with lock:
+                    self._record_import(input_file, success, error)
+
+        worker = threading.Thread(target=import_worker, name="mongodb-import", daemon=True)
+        worker.start()
+
+        try:
+            for input_file in files:
+                output_file = self.unchanged_output(input_file)
+                if output_file is None:
+                    success, output_file, error = self.parse_file(input_file)
+                    with lock:
+                        self._record_parse(input_file, success, error)
+                    if not success:
+                        continue
+
+                with lock:
+                    import_needed = self.needs_import(input_file)
+                if import_needed:
+                    # Blocks while the importer is queue_size files behind
+                    pending.put((input_file, output_file))
+        finally:
+            pending.put(None)
+            worker.join()
+
+        return self.results
+
+    def close(self):
+        """Save the manifest and close the MongoDB connection."""
+        self.manifest.save()
+        if self.importer is not None:
+            self.importer.close()
 
 
 def main():
@@ -161,6 +404,12 @@ Examples:
 
   # Custom output directory
   python3 batch_process.py --folder "Pairing Source Docs/February 2026" --output "output/feb2026"
+
+  # Import each file while the next one is being parsed
+  python3 batch_process.py --folder "Pairing Source Docs/February 2026" --pipeline
+
+  # Re-parse and re-import every file, even ones unchanged since the last run
+  python3 batch_process.py --folder "Pairing Source Docs" --recursive --force
         """
     )
 
@@ -196,6 +445,61 @@ Examples:
         help='Do not include parent folder name in output filenames'
     )
 
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Import parsed files while the next file is being parsed'
+    )
+
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=2,
+        help='Maximum parsed files waiting for import with --pipeline (default: 2)'
+    )
+
+    parser.add_argument(
+        '--connection',
+        type=str,
+        help='MongoDB connection string (or use .streamlit/secrets.toml)'
+    )
+
+    parser.add_argument(
+        '--config',
+        type=str,
+        help='Parser configuration YAML (default: config/parser_config.yaml)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always extract PDF text with pdfplumber (ignore the text cache)'
+    )
+
+    parser.add_argument(
+        '--rebuild-cache',
+        action='store_true',
+        help='Re-extract PDF text and overwrite cached entries'
+    )
+
+    parser.add_argument(
+        '--style',
+        choices=['pretty', 'compact'],
+        help='JSON output style: indented for QA or compact for production (default: output.style)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Parse and import every file, even if unchanged since the last run'
+    )
+
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Show parser log output'
+    )
+
     args = parser.parse_args()
 
     # Validate input folder
@@ -227,46 +531,32 @@ Examples:
     for f in files:
         print(f"  - {f.relative_to(input_folder.parent)}")
 
-    # Process each file
-    results = {
-        'total': len(files),
-        'parsed': 0,
-        'parse_failed': 0,
-        'imported': 0,
-        'import_failed': 0,
-        'errors': []
-    }
-
     start_time = datetime.now()
 
-    for input_file in files:
-        # Parse file (include parent folder name unless --no-parent-folder is set)
-        include_parent = not args.no_parent_folder
-        success, output_file, error = parse_file(input_file, output_dir, include_parent)
+    try:
+        pipeline = BatchPipeline(
+            output_dir,
+            include_parent_folder=not args.no_parent_folder,
+            do_import=not args.no_import,
+            connection_string=args.connection,
+            config_path=args.config,
+            verbose=args.verbose,
+            no_cache=args.no_cache,
+            rebuild_cache=args.rebuild_cache,
+            style=args.style,
+            force=args.force
+        )
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
 
-        if success:
-            results['parsed'] += 1
-
-            # Import to MongoDB (unless --no-import)
-            if not args.no_import:
-                import_success, import_error = import_to_mongodb(output_file)
-
-                if import_success:
-                    results['imported'] += 1
-                else:
-                    results['import_failed'] += 1
-                    results['errors'].append({
-                        'file': input_file.name,
-                        'stage': 'import',
-                        'error': import_error
-                    })
+    try:
+        if args.pipeline:
+            results = pipeline.run_pipelined(files, queue_size=max(1, args.queue_size))
         else:
-            results['parse_failed'] += 1
-            results['errors'].append({
-                'file': input_file.name,
-                'stage': 'parse',
-                'error': error
-            })
+            results = pipeline.run(files)
+    finally:
+        pipeline.close()
 
     # Print summary
     end_time = datetime.now()
@@ -277,15 +567,24 @@ Examples:
     print(f"{'='*80}")
     print(f"Total files:           {results['total']}")
     print(f"Successfully parsed:   {results['parsed']}")
+    print(f"Unchanged (skipped):   {results['parse_skipped']}")
     print(f"Parse failures:        {results['parse_failed']}")
 
     if not args.no_import:
         print(f"Successfully imported: {results['imported']}")
+        print(f"Already imported:      {results['import_skipped']}")
         print(f"Import failures:       {results['import_failed']}")
     else:
         print(f"Import:                Skipped (--no-import)")
 
     print(f"\nDuration: {duration:.1f} seconds")
+    print("Timing breakdown:")
+    for phase in TIMING_PHASES:
+        if phase == 'import' and args.no_import:
+            continue
+        print(f"  {phase.capitalize() + ':':<12} {pipeline.timings[phase]:7.2f}s")
+    if args.pipeline and not args.no_import:
+        print("  (parse and import overlap with --pipeline)")
     print(f"Output directory: {output_dir.absolute()}")
 
     # Print errors if any
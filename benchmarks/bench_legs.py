@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark fixed-width vs token leg decoding.
+
+Collects every leg line from the .DAT files in a folder and times
+PairingParser._decode_leg_columns against _decode_leg_tokens, plus the cost
+of building Leg models from the decoded values. The token path is timed
+with the *_minutes conversion _parse_leg adds after it, which the column
+decoder already does.
+
+Usage:
+    python3 benchmarks/bench_legs.py
+    python3 benchmarks/bench_legs.py --folder "Pairing Source Docs/February 2026" --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.main import load_config
+from src.parsers import PairingParser
+from src.parsers.line_classifier import LineClassifier, LineType
+from src.models import Leg
+from src.utils import StreamingTextReader
+
+
+def collect_leg_lines(folder: Path) -> list:
+    """Return all leg lines from the .DAT files in a folder."""
+    classifier = LineClassifier()
+    legs = []
+    for dat_file in sorted(folder.glob('*.DAT')):
+        for line in StreamingTextReader(str(dat_file)).read_all_lines():
+            if classifier.classify(line) == LineType.LEG:
+                legs.append(line)
+    return legs
+
+
+def bench(decode, lines: list, repeat: int) -> tuple:
+    """Time a decoder over all lines. Returns (best seconds, lines decoded)."""
+    best = float('inf')
+    decoded = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoded = sum(1 for line in lines if decode(line) is not None)
+        best = min(best, time.perf_counter() - start)
+    return best, decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fixed-width vs token leg decoding')
+    parser.add_argument(
+        '--folder',
+        type=str,
+        default='Pairing Source Docs/February 2026',
+        help='Folder containing .DAT files'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per decoder (best is reported)')
+    args = parser.parse_args()
+
+    legs = collect_leg_lines(Path(args.folder))
+    if not legs:
+        print(f"No leg lines found in {args.folder}")
+        sys.exit(1)
+
+    pairing_parser = PairingParser(load_config())
+
+    def decode_tokens(line):
+        values = pairing_parser._decode_leg_tokens(line)
+        if values is not None:
+            pairing_parser._set_duration_minutes(values)
+        return values
+
+    print(f"Leg lines: {len(legs)}\n")
+    print(f"{'Decoder':<14}{'Seconds':>10}{'Legs/s':>14}{'Decoded':>10}")
+    print('-' * 48)
+
+    results = {}
+    for name, decode in (
+        ('fixed-width', pairing_parser._decode_leg_columns),
+        ('tokens', decode_tokens),
+    ):
+        seconds, decoded = bench(decode, legs, args.repeat)
+        results[name] = seconds
+        print(f"{name:<14}{seconds:>10.3f}{len(legs) / seconds:>14,.0f}{decoded:>10}")
+
+    print(f"\nDecode speedup: {results['tokens'] / results['fixed-width']:.2f}x")
+
+    decoded_values = [pairing_parser._decode_leg_columns(line) for line in legs]
+    seconds, _ = bench(lambda values: Leg(**values), decoded_values, args.repeat)
+    print(f"Leg model build: {seconds:.3f}s ({len(legs) / seconds:,.0f} legs/s)")
+
+
+if __name__ == '__main__':
+    main()
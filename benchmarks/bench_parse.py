@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark line classification and full parsing of pairing files.
+
+Reports classifier throughput, lines per record type and end-to-end parse
+time for every .DAT file in a folder, optionally with per-regex timing.
+--stream parses into records the way src.main does with
+write_mode: streaming; the default builds pydantic models (buffered).
+
+Usage:
+    python3 benchmarks/bench_parse.py
+    python3 benchmarks/bench_parse.py --folder "Pairing Source Docs/February 2026" --repeat 5
+    python3 benchmarks/bench_parse.py --pattern-timing
+    python3 benchmarks/bench_parse.py --stream
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.main import load_config
+from src.parsers import PairingParser
+from src.parsers.line_classifier import LineClassifier, LineType
+from src.utils import StreamingTextReader
+
+
+def load_lines(dat_file: Path) -> list:
+    """Read all lines of a DAT file up front so I/O is not timed."""
+    return StreamingTextReader(str(dat_file)).read_all_lines()
+
+
+def bench_classifier(lines: list, repeat: int) -> tuple:
+    """Time classification only. Returns (best seconds, per-type counts)."""
+    best = float('inf')
+    counts = {}
+    for _ in range(repeat):
+        classifier = LineClassifier()
+        start = time.perf_counter()
+        for line in lines:
+            classifier.classify(line)
+        best = min(best, time.perf_counter() - start)
+        counts = classifier.get_counts()
+    return best, counts
+
+
+def bench_parse(lines: list, config: dict, repeat: int, stream: bool = False) -> tuple:
+    """Time a full parse (classification + handlers + finalize).
+
+    Returns (best seconds, pattern timings of the last run).
+    """
+    best = float('inf')
+    timings = {}
+    for _ in range(repeat):
+        parser = PairingParser(config, stream_output=stream)
+        start = time.perf_counter()
+        for line_number, line in enumerate(lines, 1):
+            parser.parse_line(line, line_number)
+        parser.finalize()
+        if stream:
+            parser.pop_finished()
+        best = min(best, time.perf_counter() - start)
+        timings = parser.get_pattern_timings()
+    return best, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pairing line classification and parsing')
+    parser.add_argument(
+        '--folder',
+        type=str,
+        default='Pairing Source Docs/February 2026',
+        help='Folder containing .DAT files'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per file (best is reported)')
+    parser.add_argument(
+        '--pattern-timing',
+        action='store_true',
+        help='Report time spent in each registry regex (adds wrapper overhead to parse time)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse into streamed records (src.main default) instead of pydantic models'
+    )
+    args = parser.parse_args()
+
+    dat_files = sorted(Path(args.folder).glob('*.DAT'))
+    if not dat_files:
+        print(f"No .DAT files found in {args.folder}")
+        sys.exit(1)
+
+    config = load_config()
+    config['logging']['level'] = 'WARNING'
+    config['parser']['pattern_timing'] = args.pattern_timing
+
+    total_lines = 0
+    total_classify = 0.0
+    total_parse = 0.0
+    total_counts = dict.fromkeys(LineType.ALL, 0)
+    total_timings = {}
+
+    print(f"{'File':<14}{'Lines':>9}{'Classify s':>12}{'Lines/s':>12}{'Parse s':>10}")
+    print('-' * 57)
+
+    for dat_file in dat_files:
+        lines = load_lines(dat_file)
+        classify_time, counts = bench_classifier(lines, args.repeat)
+        parse_time, timings = bench_parse(lines, config, args.repeat, args.stream)
+
+        total_lines += len(lines)
+        total_classify += classify_time
+        total_parse += parse_time
+        for line_type, count in counts.items():
+            total_counts[line_type] += count
+        for name, timing in timings.items():
+            total = total_timings.setdefault(name, {'calls': 0, 'seconds': 0.0})
+            total['calls'] += timing['calls']
+            total['seconds'] += timing['seconds']
+
+        print(f"{dat_file.name:<14}{len(lines):>9}{classify_time:>12.3f}"
+              f"{len(lines) / classify_time:>12,.0f}{parse_time:>10.3f}")
+
+    print('-' * 57)
+    print(f"{'TOTAL':<14}{total_lines:>9}{total_classify:>12.3f}"
+          f"{total_lines / total_classify:>12,.0f}{total_parse:>10.3f}")
+
+    print("\nLines per record type:")
+    for line_type, count in sorted(total_counts.items(), key=lambda x: -x[1]):
+        print(f"  {line_type:<18}{count:>9}")
+
+    if total_timings:
+        print("\nTime per regex pattern (last run of each file):")
+        for name, timing in sorted(total_timings.items(), key=lambda x: -x[1]['seconds']):
+            if timing['calls']:
+                print(f"  {name:<36}{timing['calls']:>9} calls{timing['seconds']:>9.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark DAT readers: line-decoding StreamingTextReader vs byte-level MappedDATReader.
+
+Times reading alone and reading plus parsing (the loop process_single_file
+runs) for one .DAT file. MappedDATReader is timed decoding every line
+(mmap-all) and skipping separator, column header, blank and calendar-only
+lines without decoding them (mmap). The machine-noise floor is high, so
+best-of-N is reported.
+
+Usage:
+    python3 benchmarks/bench_reader.py
+    python3 benchmarks/bench_reader.py --file "Pairing Source Docs/February 2026/EWRDSL.DAT" --repeat 10
+"""
+
+import argparse
+import gc
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.main import load_config
+from src.parsers import PairingParser
+from src.parsers.line_classifier import DAT_IGNORED_LINE_STARTS
+from src.utils import StreamingTextReader, MappedDATReader
+
+
+def make_readers(dat_file: str) -> dict:
+    """Reader factories by name."""
+    return {
+        'text': lambda: StreamingTextReader(dat_file),
+        'mmap-all': lambda: MappedDATReader(dat_file),
+        'mmap': lambda: MappedDATReader(dat_file, skip_starts=DAT_IGNORED_LINE_STARTS),
+    }
+
+
+def bench_read(make_reader, repeat: int) -> tuple:
+    """Time reading only. Returns (best seconds, lines, decoded lines)."""
+    best = float('inf')
+    lines = decoded = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        lines = decoded = 0
+        for chunk_lines, _ in make_reader().read_chunks():
+            lines += len(chunk_lines)
+            decoded += len(chunk_lines) - chunk_lines.count(None)
+        best = min(best, time.perf_counter() - start)
+    return best, lines, decoded
+
+
+def bench_read_parse(make_reader, config: dict, repeat: int) -> float:
+    """Time reading plus parsing. Returns best seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        parser = PairingParser(config)
+        start = time.perf_counter()
+        line_number = 0
+        for chunk_lines, _ in make_reader().read_chunks():
+            for line in chunk_lines:
+                line_number += 1
+                if line is not None:
+                    parser.parse_line(line, line_number)
+        parser.finalize()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DAT file readers')
+    parser.add_argument(
+        '--file',
+        type=str,
+        default='Pairing Source Docs/February 2026/DENDSL.DAT',
+        help='.DAT file to read'
+    )
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per reader (best is reported)')
+    args = parser.parse_args()
+
+    dat_file = Path(args.file)
+    if not dat_file.exists():
+        print(f"File not found: {args.file}")
+        sys.exit(1)
+
+    config = load_config()
+    config['logging']['level'] = 'WARNING'
+
+    size_mb = dat_file.stat().st_size / (1024 * 1024)
+    print(f"{dat_file.name}: {size_mb:.2f} MB\n")
+    print(f"{'Reader':<10}{'Lines':>9}{'Decoded':>10}{'Read s':>10}{'MB/s':>9}{'Read+parse s':>15}")
+    print('-' * 63)
+
+    results = {}
+    for name, make_reader in make_readers(str(dat_file)).items():
+        read_time, lines, decoded = bench_read(make_reader, args.repeat)
+        parse_time = bench_read_parse(make_reader, config, args.repeat)
+        results[name] = (read_time, parse_time)
+        print(f"{name:<10}{lines:>9}{decoded:>10}{read_time:>10.4f}"
+              f"{size_mb / read_time:>9.1f}{parse_time:>15.3f}")
+
+    read_speedup = results['text'][0] / results['mmap'][0]
+    parse_speedup = results['text'][1] / results['mmap'][1]
+    print(f"\nRead speedup: {read_speedup:.2f}x, read+parse speedup: {parse_speedup:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
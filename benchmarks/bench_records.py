@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark parse-phase records against building pydantic models.
+
+With stream_output, PairingParser fills slotted dataclass records
+(src/models/records.py) that are serialized directly, without building the
+models. The previous behaviour, building and mutating Leg/DutyPeriod/
+Pairing/BidPeriod models field by field, is reproduced by giving the
+parser the model classes. Reports best-of-N time of a streaming parse that
+serializes each finished pairing, and the memory held by one file's worth
+of finished parse-phase objects.
+
+Usage:
+    python3 benchmarks/bench_records.py
+    python3 benchmarks/bench_records.py --file "Pairing Source Docs/February 2026/EWRDSL.DAT" --repeat 5
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.main import load_config
+from src.models import Leg, DutyPeriod, Pairing, BidPeriod
+from src.parsers import BidPeriodStart, PairingParser
+from src.utils import StreamingTextReader, JSONSerializer
+
+
+MODEL_TYPES = (Leg, DutyPeriod, Pairing, BidPeriod)
+
+
+def make_parser(variant: str, config: dict) -> PairingParser:
+    """Streaming parser building records, or models for the 'models' variant."""
+    parser = PairingParser(config, stream_output=True)
+    if variant == 'models':
+        (parser._leg_type, parser._duty_period_type,
+         parser._pairing_type, parser._bid_period_type) = MODEL_TYPES
+    return parser
+
+
+def parse_items(variant: str, lines: list, config: dict, serializer=None) -> list:
+    """
+    Parse all lines, serializing each finished item when a serializer is given.
+
+    Returns:
+        Finished items (only kept when not serializing)
+    """
+    parser = make_parser(variant, config)
+    items = []
+    for line_number, line in enumerate(lines, 1):
+        parser.parse_line(line, line_number)
+        if parser._finished:
+            finished = [
+                item for item in parser.pop_finished() if not isinstance(item, BidPeriodStart)
+            ]
+            if serializer is None:
+                items.extend(finished)
+            else:
+                for item in finished:
+                    serializer.dumps(item, exclude={'pairings'})
+    parser.finalize()
+    for item in parser.pop_finished():
+        if isinstance(item, BidPeriodStart):
+            continue
+        if serializer is None:
+            items.append(item)
+        else:
+            serializer.dumps(item, exclude={'pairings'})
+    return items
+
+
+def best_of(repeat: int, func, *args) -> float:
+    """Best-of-N time of func(*args) in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(variant: str, lines: list, config: dict) -> int:
+    """Bytes held by one file's worth of finished pairings and bid periods."""
+    gc.collect()
+    tracemalloc.start()
+    items = parse_items(variant, lines, config)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parse-phase records vs pydantic models')
+    parser.add_argument(
+        '--file',
+        type=str,
+        default='Pairing Source Docs/February 2026/DENDSL.DAT',
+        help='.DAT file to parse'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    dat_file = Path(args.file)
+    if not dat_file.exists():
+        print(f"File not found: {args.file}")
+        sys.exit(1)
+
+    config = load_config()
+    config['logging']['level'] = 'WARNING'
+    lines = StreamingTextReader(str(dat_file)).read_all_lines()
+
+    serializer = JSONSerializer(indent=None)
+
+    print(f"{dat_file.name}: {len(lines)} lines\n")
+    print(f"{'Variant':<10}{'Parse+serialize s':>19}{'Held MB':>10}")
+    print('-' * 39)
+
+    results = {}
+    for variant in ('models', 'records'):
+        elapsed = best_of(args.repeat, parse_items, variant, lines, config, serializer)
+        held = measure_memory(variant, lines, config)
+        results[variant] = (elapsed, held)
+        print(f"{variant:<10}{elapsed:>19.3f}{held / 1e6:>10.1f}")
+
+    models, records = results['models'], results['records']
+    print(f"\nParse+serialize speedup: {models[0] / records[0]:.2f}x")
+    print(f"Held memory: models {models[1] / records[1]:.1f}x records")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the time codec against the string parsing it replaced.
+
+Collects the clock times and durations of every leg line in the .DAT files
+of a folder and times each src/models/time_codec.py conversion against the
+per-call parsing previously done by BaseParser.convert_time, Leg's
+minute/formatted properties and Pairing._decimal_time_to_minutes (kept here
+as legacy_* reference copies). Reports best-of-N nanoseconds per call.
+
+Usage:
+    python3 benchmarks/bench_time_codec.py
+    python3 benchmarks/bench_time_codec.py --folder "Pairing Source Docs/February 2026" --repeat 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.main import load_config
+from src.models import time_codec
+from src.parsers import PairingParser
+from src.parsers.line_classifier import LineClassifier, LineType
+from src.utils import StreamingTextReader
+
+
+def legacy_convert_time(time_str):
+    if not time_str or time_str == ".00":
+        return "0"
+    if '.' in time_str:
+        return time_str.replace('.', ':')
+    return time_str
+
+
+def legacy_time_to_minutes(time_str):
+    if not time_str or time_str == "0":
+        return 0
+    try:
+        if ':' in time_str:
+            parts = time_str.split(':')
+            return int(parts[0]) * 60 + int(parts[1])
+        return 0
+    except (ValueError, IndexError):
+        return 0
+
+
+def legacy_decimal_time_to_minutes(time_str):
+    if not time_str:
+        return 0
+    try:
+        parts = time_str.split('.')
+        if len(parts) == 2:
+            hours = int(parts[0]) if parts[0] else 0
+            return hours * 60 + int(parts[1])
+        return 0
+    except (ValueError, IndexError, AttributeError):
+        return 0
+
+
+def legacy_clock_to_minutes(time_str):
+    if not time_str or len(time_str) != 4:
+        return None
+    try:
+        return int(time_str[:2]) * 60 + int(time_str[2:])
+    except ValueError:
+        return None
+
+
+def legacy_format_clock(time_str):
+    if not time_str or len(time_str) != 4:
+        return None
+    return f"{time_str[:2]}:{time_str[2:]}"
+
+
+def collect_values(folder: Path, config: dict) -> tuple:
+    """Return (clock times, source H.MM durations, stored H:MM durations) from leg lines."""
+    parser = PairingParser(config)
+    classifier = LineClassifier()
+    clocks, durations = [], []
+    for dat_file in sorted(folder.glob('*.DAT')):
+        for line in StreamingTextReader(str(dat_file)).read_all_lines():
+            if classifier.classify(line) != LineType.LEG:
+                continue
+            if parser._decode_leg_columns(line) is None:
+                continue
+            leg_columns = parser._leg_columns
+            columns = dict(zip(leg_columns.fields, map(str.strip, leg_columns.slices(line))))
+            clocks += [columns['departure_time'], columns['arrival_time']]
+            durations += [
+                columns[field] for field in
+                ('ground_time', 'flight_time', 'accumulated_flight_time', 'duty_time', 'd_c')
+                if columns.get(field)
+            ]
+    stored = [legacy_convert_time(value) for value in durations]
+    return clocks, durations, stored
+
+
+def bench(func, values: list, repeat: int) -> float:
+    """Best-of-N nanoseconds per call of func over values."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+    return best / len(values) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark time codec vs per-call string parsing')
+    parser.add_argument(
+        '--folder',
+        type=str,
+        default='Pairing Source Docs/February 2026',
+        help='Folder containing .DAT files'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per conversion (best is reported)')
+    args = parser.parse_args()
+
+    folder = Path(args.folder)
+    if not folder.is_dir():
+        print(f"Folder not found: {args.folder}")
+        sys.exit(1)
+
+    config = load_config()
+    config['logging']['level'] = 'WARNING'
+    clocks, durations, stored = collect_values(folder, config)
+    print(f"{len(clocks)} clock times, {len(durations)} durations\n")
+
+    cases = [
+        ('HHMM -> minutes', clocks, legacy_clock_to_minutes, time_codec.clock_to_minutes),
+        ('HHMM -> HH:MM', clocks, legacy_format_clock, time_codec.format_clock),
+        ('H.MM -> H:MM', durations, legacy_convert_time, time_codec.duration_text),
+        ('H.MM -> minutes', durations, legacy_decimal_time_to_minutes, time_codec.duration_to_minutes),
+        ('H:MM -> minutes', stored, legacy_time_to_minutes, time_codec.duration_to_minutes),
+    ]
+
+    print(f"{'Conversion':<18}{'Legacy ns':>11}{'Codec ns':>10}{'Speedup':>9}")
+    print('-' * 48)
+    for name, values, legacy, codec in cases:
+        legacy_ns = bench(legacy, values, args.repeat)
+        codec_ns = bench(codec, values, args.repeat)
+        print(f"{name:<18}{legacy_ns:>11.0f}{codec_ns:>10.0f}{legacy_ns / codec_ns:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
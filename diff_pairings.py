@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Diff the pairings of a reissued bid period against an earlier revision.
+
+Compares two parsed JSON outputs, or one output against what is stored in
+MongoDB, and lists the pairings added, removed and changed (by content
+hash). `mongodb_import.py --delta` applies the same diff.
+
+Usage:
+    python3 diff_pairings.py output/old/ORDDSL.json output/ORDDSL.json
+    python3 diff_pairings.py output/ORDDSL.json --mongo
+    python3 diff_pairings.py output/ORDDSL.json --mongo --connection "mongodb://localhost:27017/" --list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.utils.pairing_diff import (
+    PairingDiff, diff_hashes, diff_outputs, load_output_hashes
+)
+
+
+def diff_against_mongo(json_file: Path, connection_string: str = None) -> PairingDiff:
+    """
+    Diff a parsed output against the pairings imported for its bid periods.
+
+    Args:
+        json_file: Parser JSON output
+        connection_string: MongoDB connection string (default: .streamlit/secrets.toml)
+
+    Returns:
+        PairingDiff keyed by (bid period key, pairing key)
+    """
+    # Imported here so file-to-file diffs do not need pymongo
+    from mongodb_import import MongoDBImporter, get_connection_from_secrets
+
+    if not connection_string:
+        connection_string = get_connection_from_secrets() or "mongodb://localhost:27017/"
+
+    importer = MongoDBImporter(connection_string)
+    if not importer.test_connection():
+        sys.exit(1)
+
+    new = load_output_hashes(json_file)
+    old = {}
+    try:
+        for period in sorted({period for period, _ in new}, key=str):
+            month, fleet, base = period
+            stored = importer.bid_periods.find_one(
+                {'bid_month_year': month, 'fleet': fleet, 'base': base}, {'_id': 1}
+            )
+            if stored:
+                for key, digest in importer.existing_pairing_hashes(stored['_id']).items():
+                    old[(period, key)] = digest
+    finally:
+        importer.close()
+
+    return diff_hashes(old, new)
+
+
+def print_keys(label: str, keys: list):
+    for (month, fleet, base), (pairing_id, effective_date) in keys:
+        print(f"  {label} {month} {fleet} {base} {pairing_id} eff {effective_date}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Diff pairings between two parsed outputs, or an output and MongoDB"
+    )
+    parser.add_argument('files', nargs='+', help="OLD.json NEW.json, or NEW.json with --mongo")
+    parser.add_argument('--mongo', action='store_true',
+                        help="Compare NEW.json with the pairings stored in MongoDB")
+    parser.add_argument('--connection', type=str,
+                        help="MongoDB connection string (or use .streamlit/secrets.toml)")
+    parser.add_argument('--list', action='store_true',
+                        help="List every added, removed and changed pairing")
+
+    args = parser.parse_args()
+
+    expected = 1 if args.mongo else 2
+    if len(args.files) != expected:
+        parser.error("expected NEW.json with --mongo" if args.mongo else "expected OLD.json NEW.json")
+
+    for file_name in args.files:
+        if not Path(file_name).exists():
+            print(f"Error: File not found: {file_name}")
+            sys.exit(1)
+
+    if args.mongo:
+        diff = diff_against_mongo(Path(args.files[0]), args.connection)
+    else:
+        diff = diff_outputs(Path(args.files[0]), Path(args.files[1]))
+
+    print(diff.summary())
+    if args.list:
+        print_keys('+', diff.added)
+        print_keys('-', diff.removed)
+        print_keys('~', diff.changed)
+
+
+if __name__ == '__main__':
+    main()
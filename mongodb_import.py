@@ -5,31 +5,64 @@ Import parsed pairing JSON files into MongoDB.
 Usage:
     python3 mongodb_import.py --file output/ORD.json
     python3 mongodb_import.py --dir output/
+    python3 mongodb_import.py --file output/ORD.json --delta   # reissued file
+
+Pairings and legs are written with bulk upserts keyed by bid period, pairing
+id and effective date (plus duty period and leg index for legs), backed by
+unique indexes, so importing a file again replaces its documents instead of
+duplicating them. Files are read incrementally (src/utils/json_reader.py)
+and written batch by batch, so memory stays flat regardless of file size.
+
+Each overnight away from base is also written to a layover_facts document
+carrying the pairing's filter fields, so layover statistics are a single
+indexed $group instead of a legs-to-pairings $lookup. The dashboard's
+sidebar values (fleets, bases, categories, layover stations, credit range)
+are kept in one facets document per bid month.
 
 Requirements:
     pip install pymongo
 """
 
 import argparse
-import json
 import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
 try:
-    from pymongo import MongoClient, ASCENDING, DESCENDING
-    from pymongo.errors import ConnectionFailure, BulkWriteError
+    from pymongo import MongoClient, ReplaceOne, UpdateOne, ReturnDocument, ASCENDING, DESCENDING
+    from pymongo.errors import ConnectionFailure, BulkWriteError, OperationFailure
 except ImportError:
     print("Error: pymongo not installed. Run: pip install pymongo")
     sys.exit(1)
 
+from src.utils.json_reader import StreamingJSONReader, BID_PERIOD_START, PAIRING
+from src.utils.pairing_diff import diff_hashes, pairing_hash, pairing_key, pairing_key_conditions
+
 try:
     import toml
 except ImportError:
     toml = None  # Optional dependency
 
 
+BID_PERIOD_KEY = ('bid_month_year', 'fleet', 'base')
+
+# Upsert keys: a re-import replaces documents instead of duplicating them
+PAIRING_KEY = ('bid_period_id', 'id', 'effective_date')
+LEG_KEY = (
+    'bid_period_id', 'pairing_id', 'pairing_effective_date', 'duty_period_index', 'leg_index'
+)
+LAYOVER_FACT_KEY = ('bid_period_id', 'pairing_id', 'pairing_effective_date', 'duty_period_index')
+
+# Pairing fields copied onto each layover fact (the dashboard's filters)
+LAYOVER_FACT_FIELDS = ('pairing_category', 'days', 'credit_minutes')
+
+# Documents per bulk_write round trip
+PAIRING_BATCH_SIZE = 500
+LEG_BATCH_SIZE = 2000
+
+
 def get_connection_from_secrets() -> str:
     """
     Read MongoDB connection string from .streamlit/secrets.toml
@@ -66,8 +99,23 @@ def get_connection_from_secrets() -> str:
 class MongoDBImporter:
     """Import pairing data into MongoDB."""
 
-    def __init__(self, connection_string: str = "mongodb://localhost:27017/"):
-        """Initialize MongoDB connection."""
+    def __init__(
+        self,
+        connection_string: str = "mongodb://localhost:27017/",
+        pairing_batch_size: int = PAIRING_BATCH_SIZE,
+        leg_batch_size: int = LEG_BATCH_SIZE
+    ):
+        """
+        Initialize MongoDB connection.
+
+        Args:
+            connection_string: MongoDB connection string
+            pairing_batch_size: Pairings per bulk write
+            leg_batch_size: Legs per bulk write
+        """
+        self.pairing_batch_size = pairing_batch_size
+        self.leg_batch_size = leg_batch_size
+
         try:
             import certifi
             self.client = MongoClient(connection_string, tlsCAFile=certifi.where())
@@ -81,6 +129,8 @@ class MongoDBImporter:
         self.bid_periods = self.db['bid_periods']
         self.pairings = self.db['pairings']
         self.legs = self.db['legs']
+        self.layover_facts = self.db['layover_facts']
+        self.facets = self.db['facets']
 
     def test_connection(self) -> bool:
         """Test MongoDB connection."""
@@ -104,6 +154,21 @@ class MongoDBImporter:
         ], unique=True, name="bid_period_unique")
 
         self.bid_periods.create_index([("effective_date_iso", ASCENDING)])
+        self.bid_periods.create_index([("imported_at", DESCENDING)])  # Dashboard catalog version
+
+        # Upsert keys (fails on duplicates left by earlier imports: re-import with --clear)
+        for collection, key, name in (
+            (self.pairings, PAIRING_KEY, "pairing_unique"),
+            (self.legs, LEG_KEY, "leg_unique"),
+            (self.layover_facts, LAYOVER_FACT_KEY, "layover_fact_unique"),
+        ):
+            try:
+                collection.create_index(
+                    [(field, ASCENDING) for field in key], unique=True, name=name
+                )
+            except OperationFailure as e:
+                print(f"  Warning: could not create unique index {name}: {e}")
+                print("  Duplicate documents from earlier imports; re-import with --clear")
 
         # Pairing indexes
         self.pairings.create_index([("id", ASCENDING)], name="pairing_id")
@@ -112,6 +177,16 @@ class MongoDBImporter:
         self.pairings.create_index([("bid_period_id", ASCENDING)])
         self.pairings.create_index([("credit_minutes", DESCENDING)])
         self.pairings.create_index([("flight_time_minutes", DESCENDING)])
+        # Pairing Explorer pages: keyset on (credit_minutes, _id) within bid periods
+        self.pairings.create_index([
+            ("bid_period_id", ASCENDING),
+            ("credit_minutes", DESCENDING),
+            ("_id", DESCENDING)
+        ], name="pairing_explorer")
+        # For the overnight duration filter
+        self.pairings.create_index([("min_overnight_minutes", ASCENDING)])
+        self.pairings.create_index([("max_overnight_minutes", ASCENDING)])
+        self.pairings.create_index([("duty_periods.overnight_minutes", ASCENDING)])
 
         # Leg indexes
         self.legs.create_index([("pairing_id", ASCENDING)])
@@ -123,130 +198,582 @@ class MongoDBImporter:
         self.legs.create_index([("layover_station", ASCENDING)])  # For overnight queries
         self.legs.create_index([("origin_station", ASCENDING)])   # For duty period origin
 
+        # Layover fact indexes: equality filters first, credit range last and
+        # the grouped station at the end so the $group reads only the index
+        self.layover_facts.create_index([
+            ("bid_period_id", ASCENDING),
+            ("away_from_base", ASCENDING),
+            ("fleet", ASCENDING),
+            ("pairing_category", ASCENDING),
+            ("credit_minutes", ASCENDING),
+            ("layover_station", ASCENDING)
+        ], name="layover_fact_bid_period")
+        self.layover_facts.create_index([
+            ("away_from_base", ASCENDING),
+            ("fleet", ASCENDING),
+            ("pairing_category", ASCENDING),
+            ("credit_minutes", ASCENDING),
+            ("layover_station", ASCENDING)
+        ], name="layover_fact_fleet")
+
         print("✓ Indexes created")
 
-    def import_file(self, json_file: Path, clear_existing: bool = False) -> Dict[str, int]:
+    def existing_pairing_hashes(self, bid_period_id) -> Dict[tuple, Any]:
+        """
+        Content hashes of the pairings stored for a bid period.
+
+        Pairings imported before content hashes were added, and keys stored
+        more than once, map to None so the diff treats them as changed.
+
+        Args:
+            bid_period_id: _id of the bid period document
+
+        Returns:
+            Dictionary of (id, effective_date) -> content hash or None
+        """
+        hashes = {}
+        cursor = self.pairings.find(
+            {'bid_period_id': bid_period_id},
+            {'_id': 0, 'id': 1, 'effective_date': 1, 'content_hash': 1}
+        )
+        for doc in cursor:
+            key = pairing_key(doc)
+            hashes[key] = None if key in hashes else doc.get('content_hash')
+        return hashes
+
+    @staticmethod
+    def _bulk_replace(collection, ops: List[ReplaceOne]) -> Tuple[int, int]:
+        """
+        Write one batch of upserts in a single round trip.
+
+        Returns:
+            (documents written (replaced or inserted), documents that failed)
+        """
+        if not ops:
+            return 0, 0
+
+        try:
+            result = collection.bulk_write(ops, ordered=False)
+            return result.matched_count + result.upserted_count, 0
+        except BulkWriteError as e:
+            failed = len(e.details['writeErrors'])
+            print(f"  Error: {failed} {collection.name} not written: "
+                  f"{e.details['writeErrors'][0].get('errmsg')}")
+            return e.details['nMatched'] + e.details['nUpserted'], failed
+
+    def _delete_pairings(self, bid_period_id, keys: List[tuple]) -> int:
+        """Delete pairings (and their legs and layover facts) of a bid period by (id, effective_date)."""
+        if not keys:
+            return 0
+
+        result = self.pairings.delete_many({
+            'bid_period_id': bid_period_id,
+            '$or': pairing_key_conditions(keys)
+        })
+        # Children of the same pairing id under another effective date stay
+        children = {
+            'bid_period_id': bid_period_id,
+            '$or': pairing_key_conditions(keys, 'pairing_id', 'pairing_effective_date')
+        }
+        self.legs.delete_many(children)
+        self.layover_facts.delete_many(children)
+        return result.deleted_count
+
+    def rebuild_layover_facts(self, bid_period_id) -> None:
+        """
+        Rebuild the layover facts of a bid period from its stored pairings.
+
+        Runs server-side ($merge), for bid periods imported before layover
+        facts (or their base_station) existed; imports keep the facts up to
+        date afterwards.
+
+        Args:
+            bid_period_id: _id of the bid period document
+        """
+        self.layover_facts.delete_many({'bid_period_id': bid_period_id})
+        # Same rule as _base_station: first duty period's origin, else its first departure
+        base_station = {'$ifNull': [
+            {'$arrayElemAt': ['$duty_periods.origin_station', 0]},
+            {'$arrayElemAt': [{'$arrayElemAt': ['$duty_periods.legs.departure_station', 0]}, 0]}
+        ]}
+        fact = {
+            '_id': 0,
+            'bid_period_id': 1,
+            'pairing_id': '$id',
+            'pairing_effective_date': '$effective_date',
+            'duty_period_index': 1,
+            'layover_station': '$duty_periods.layover_station',
+            'base_station': 1,
+            'away_from_base': {'$ne': ['$duty_periods.layover_station', '$base_station']},
+            'fleet': 1,
+            'base': 1,
+            'imported_at': 1,
+        }
+        fact.update({field: 1 for field in LAYOVER_FACT_FIELDS})
+        self.pairings.aggregate([
+            {'$match': {'bid_period_id': bid_period_id}},
+            {'$addFields': {'base_station': base_station}},
+            {'$unwind': {'path': '$duty_periods', 'includeArrayIndex': 'duty_period_index'}},
+            {'$match': {'duty_periods.layover_station': {'$ne': None}}},
+            {'$project': fact},
+            {'$merge': {
+                'into': self.layover_facts.name,
+                'on': list(LAYOVER_FACT_KEY),
+                'whenMatched': 'replace',
+                'whenNotMatched': 'insert'
+            }}
+        ])
+
+    def _bid_period_facets(self, bid_period_id) -> Dict[str, Any]:
+        """Summarize the facets of a bid period imported before they were stored."""
+        result = list(self.pairings.aggregate([
+            {'$match': {'bid_period_id': bid_period_id}},
+            {'$group': {
+                '_id': None,
+                'categories': {'$addToSet': '$pairing_category'},
+                'layover_stations': {'$addToSet': '$duty_periods.layover_station'},
+                'credit_min_minutes': {'$min': '$credit_minutes'},
+                'credit_max_minutes': {'$max': '$credit_minutes'}
+            }}
+        ]))
+        summary = result[0] if result else {}
+        facets = {
+            'categories': sorted(c for c in summary.get('categories', []) if c is not None),
+            # One array of stations per pairing
+            'layover_stations': sorted({
+                station for stations in summary.get('layover_stations', [])
+                for station in stations if station is not None
+            }),
+            'credit_min_minutes': summary.get('credit_min_minutes'),
+            'credit_max_minutes': summary.get('credit_max_minutes'),
+        }
+        self.bid_periods.update_one({'_id': bid_period_id}, {'$set': {'facets': facets}})
+        return facets
+
+    def update_facets(self, bid_month_year: str) -> Dict[str, Any]:
+        """
+        Rebuild the facets document of a bid month from its bid periods.
+
+        Each bid period stores the facets of its last import, so this reads
+        only the month's bid period documents.
+
+        Args:
+            bid_month_year: Bid month (e.g. "FEB 2026")
+
+        Returns:
+            The facets document
+        """
+        fleets, bases, categories, layover_stations = set(), set(), set(), set()
+        credit_minutes = []
+        cursor = self.bid_periods.find(
+            {'bid_month_year': bid_month_year}, {'fleet': 1, 'base': 1, 'facets': 1}
+        )
+        for bid_period in cursor:
+            facets = bid_period.get('facets') or self._bid_period_facets(bid_period['_id'])
+            fleets.add(bid_period.get('fleet'))
+            bases.add(bid_period.get('base'))
+            categories.update(facets['categories'])
+            layover_stations.update(facets['layover_stations'])
+            credit_minutes += [facets[key] for key in ('credit_min_minutes', 'credit_max_minutes')
+                               if facets[key] is not None]
+
+        document = {
+            '_id': bid_month_year,
+            'fleets': sorted(fleet for fleet in fleets if fleet is not None),
+            'bases': sorted(base for base in bases if base is not None),
+            'categories': sorted(categories),
+            'layover_stations': sorted(layover_stations),
+            'credit_min_minutes': min(credit_minutes) if credit_minutes else None,
+            'credit_max_minutes': max(credit_minutes) if credit_minutes else None,
+            'updated_at': datetime.utcnow(),
+        }
+        self.facets.replace_one({'_id': bid_month_year}, document, upsert=True)
+        return document
+
+    def rebuild_facets(self) -> int:
+        """Rebuild the facets documents of every bid month; returns the number of months."""
+        months = [month for month in self.bid_periods.distinct('bid_month_year') if month]
+        for month in months:
+            self.update_facets(month)
+        self.facets.delete_many({'_id': {'$nin': months}})
+        return len(months)
+
+    def backfill_overnights(self) -> int:
+        """
+        Set overnight rest fields on pairings imported before they were stored.
+
+        The dashboard filters overnights on max_overnight_minutes, which such
+        pairings lack. Rest is computed from the stored release/report times
+        with the parser's rule (time_codec.rest_minutes).
+
+        Returns:
+            Number of pairings updated
+        """
+        # Loaded here: the importer does not otherwise need the models package
+        from src.models.time_codec import rest_minutes
+
+        cursor = self.pairings.find(
+            {'max_overnight_minutes': {'$exists': False}},
+            {'duty_periods.release_time_minutes': 1, 'duty_periods.report_time_minutes': 1}
+        )
+        ops = []
+        updated = 0
+        for pairing in cursor:
+            duty_periods = pairing.get('duty_periods') or []
+            fields = {}
+            overnights = []
+            for i, duty_period in enumerate(duty_periods):
+                overnight = None
+                if i < len(duty_periods) - 1:
+                    overnight = rest_minutes(
+                        duty_period.get('release_time_minutes'),
+                        duty_periods[i + 1].get('report_time_minutes')
+                    )
+                if overnight is not None:
+                    overnights.append(overnight)
+                fields[f'duty_periods.{i}.overnight_minutes'] = overnight
+            fields['min_overnight_minutes'] = min(overnights) if overnights else None
+            fields['max_overnight_minutes'] = max(overnights) if overnights else None
+
+            ops.append(UpdateOne({'_id': pairing['_id']}, {'$set': fields}))
+            if len(ops) >= self.pairing_batch_size:
+                updated += self.pairings.bulk_write(ops, ordered=False).modified_count
+                ops = []
+        if ops:
+            updated += self.pairings.bulk_write(ops, ordered=False).modified_count
+        return updated
+
+    def import_file(
+        self,
+        json_file: Path,
+        clear_existing: bool = False,
+        delta: bool = False
+    ) -> Dict[str, int]:
         """
         Import a single JSON file.
 
+        The file is read one pairing at a time and written in batches, so
+        memory does not grow with the file size. Files streamed before bid
+        periods led with their key fields hold each bid period's pairings
+        until its header is read.
+
+        Args:
+            json_file: Parsed JSON output
+            clear_existing: Delete the bid periods' pairings and legs first
+                (otherwise a full import replaces them by key and then
+                deletes the ones the file no longer has)
+            delta: Only write pairings that were added or changed since the
+                last import (by content hash) and delete removed ones, so a
+                reissued file costs writes for its changes only
+
         Returns:
             Dictionary with counts of imported records
         """
         print(f"\nImporting: {json_file.name}")
-
-        with open(json_file) as f:
-            data = json.load(f)
+        start = time.perf_counter()
 
         stats = {
             'bid_periods': 0,
             'pairings': 0,
             'legs': 0,
-            'duty_periods': 0
+            'layover_facts': 0,
+            'duty_periods': 0,
+            'pairings_unchanged': 0,
+            'pairings_removed': 0,
+            'write_errors': 0
         }
 
-        # Process each bid period
-        for bid_period_data in data['data']:
-            # Extract pairings before inserting bid period
-            pairings_data = bid_period_data.pop('pairings', [])
+        # One timestamp per file: a full import then removes whatever of its
+        # bid periods it did not write (truncated to the millisecond MongoDB
+        # stores, so it compares equal on the way back)
+        imported_at = datetime.utcnow()
+        imported_at = imported_at.replace(microsecond=imported_at.microsecond // 1000 * 1000)
+        options = {
+            'source_file': json_file.name,
+            'imported_at': imported_at,
+            'clear_existing': clear_existing,
+            'delta': delta,
+        }
 
-            # Insert or update bid period
-            bid_period_key = {
-                'bid_month_year': bid_period_data['bid_month_year'],
-                'fleet': bid_period_data['fleet'],
-                'base': bid_period_data['base']
-            }
+        bid_period = None
+        pending = []
+        with StreamingJSONReader(json_file) as reader:
+            for event, value in reader.events():
+                if event == PAIRING:
+                    if bid_period is None:
+                        pending.append(value)
+                    else:
+                        self._add_pairing(bid_period, value, stats)
+                elif event == BID_PERIOD_START:
+                    if all(value.get(key) for key in BID_PERIOD_KEY):
+                        bid_period = self._open_bid_period(value, options, stats)
+                else:
+                    if bid_period is None:
+                        # Header came after the pairings
+                        bid_period = self._open_bid_period(value, options, stats)
+                        for pairing_data in pending:
+                            self._add_pairing(bid_period, pairing_data, stats)
+                        pending = []
+                    self._close_bid_period(bid_period, value, stats)
+                    bid_period = None
+
+        elapsed = time.perf_counter() - start
+        documents = stats['pairings'] + stats['legs'] + stats['layover_facts']
+        print(f"  {documents} documents written in {elapsed:.1f}s "
+              f"({documents / elapsed if elapsed else 0:.0f} docs/s)")
+        return stats
 
-            # Add metadata
-            bid_period_data['imported_at'] = datetime.utcnow()
-            bid_period_data['source_file'] = json_file.name
-
-            result = self.bid_periods.update_one(
-                bid_period_key,
-                {'$set': bid_period_data},
-                upsert=True
-            )
-
-            if result.upserted_id or result.modified_count:
-                stats['bid_periods'] += 1
-
-            # Get bid period ID for reference
-            bid_period_record = self.bid_periods.find_one(bid_period_key)
-            bid_period_id = bid_period_record['_id']
-
-            # Process pairings
-            pairing_docs = []
-            leg_docs = []
-
-            for pairing_data in pairings_data:
-                # Extract duty periods
-                duty_periods = pairing_data.pop('duty_periods', [])
-
-                # Add references
-                pairing_data['bid_period_id'] = bid_period_id
-                pairing_data['fleet'] = bid_period_data['fleet']
-                pairing_data['base'] = bid_period_data['base']
-                pairing_data['imported_at'] = datetime.utcnow()
-
-                # Count duty periods
-                pairing_data['duty_period_count'] = len(duty_periods)
-                stats['duty_periods'] += len(duty_periods)
-
-                # Extract all legs from duty periods
-                all_legs = []
-                for dp_idx, duty_period in enumerate(duty_periods):
-                    legs = duty_period.get('legs', [])
-
-                    # Get duty period layover and origin stations
-                    dp_layover = duty_period.get('layover_station')
-                    dp_origin = duty_period.get('origin_station')
-
-                    for leg_idx, leg in enumerate(legs):
-                        leg['pairing_id'] = pairing_data['id']
-                        leg['bid_period_id'] = bid_period_id
-                        leg['duty_period_index'] = dp_idx
-                        leg['leg_index'] = leg_idx
-                        leg['fleet'] = bid_period_data['fleet']
-                        leg['base'] = bid_period_data['base']
-                        leg['layover_station'] = dp_layover  # Overnight destination
-                        leg['origin_station'] = dp_origin    # Duty period start
-                        leg['imported_at'] = datetime.utcnow()
-                        all_legs.append(leg)
-
-                # Store duty periods as embedded documents
-                pairing_data['duty_periods'] = duty_periods
-                pairing_data['leg_count'] = len(all_legs)
-
-                pairing_docs.append(pairing_data)
-                leg_docs.extend(all_legs)
-
-            # Bulk insert pairings
-            if pairing_docs:
-                if clear_existing:
-                    self.pairings.delete_many({'bid_period_id': bid_period_id})
-
-                try:
-                    self.pairings.insert_many(pairing_docs, ordered=False)
-                    stats['pairings'] += len(pairing_docs)
-                except BulkWriteError as e:
-                    # Count successful inserts
-                    stats['pairings'] += e.details['nInserted']
-                    print(f"  Warning: {len(e.details['writeErrors'])} duplicate pairings skipped")
-
-            # Bulk insert legs
-            if leg_docs:
-                if clear_existing:
-                    self.legs.delete_many({'bid_period_id': bid_period_id})
-
-                try:
-                    self.legs.insert_many(leg_docs, ordered=False)
-                    stats['legs'] += len(leg_docs)
-                except BulkWriteError as e:
-                    stats['legs'] += e.details['nInserted']
-                    print(f"  Warning: {len(e.details['writeErrors'])} duplicate legs skipped")
+    def _open_bid_period(
+        self,
+        header: Dict[str, Any],
+        options: Dict[str, Any],
+        stats: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Upsert a bid period from its header fields and start importing its pairings.
 
-        return stats
+        Returns:
+            Import state of the bid period (see _add_pairing)
+        """
+        bid_period_key = {key: header[key] for key in BID_PERIOD_KEY}
+        bid_period_data = dict(header)
+        bid_period_data['imported_at'] = options['imported_at']
+        bid_period_data['source_file'] = options['source_file']
+
+        # Upsert and fetch the _id for references in one round trip
+        bid_period_record = self.bid_periods.find_one_and_update(
+            bid_period_key,
+            {'$set': bid_period_data},
+            projection={'_id': 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        bid_period_id = bid_period_record['_id']
+        stats['bid_periods'] += 1
+
+        existing = None
+        if options['clear_existing']:
+            self.pairings.delete_many({'bid_period_id': bid_period_id})
+            self.legs.delete_many({'bid_period_id': bid_period_id})
+            self.layover_facts.delete_many({'bid_period_id': bid_period_id})
+        elif options['delta']:
+            existing = self.existing_pairing_hashes(bid_period_id)
+
+        # Unchanged pairings of a delta import are not rewritten, so bid
+        # periods imported before layover facts (or their base_station)
+        # existed are backfilled
+        backfill = bool(existing) and self.layover_facts.find_one(
+            {'bid_period_id': bid_period_id, 'base_station': {'$exists': True}}, {'_id': 1}
+        ) is None
+
+        return {
+            'id': bid_period_id,
+            'key': bid_period_key,
+            'imported_at': options['imported_at'],
+            'existing': existing,
+            'backfill_layover_facts': backfill,
+            'facets': {'categories': set(), 'layover_stations': set(), 'credit_minutes': []},
+            'new_hashes': {},
+            'changed': [],
+            'pairing_ops': [],
+            'leg_ops': [],
+            'fact_ops': [],
+            'write_errors': 0,
+        }
 
-    def import_directory(self, directory: Path, clear_existing: bool = False) -> Dict[str, int]:
+    def _add_pairing(
+        self,
+        bid_period: Dict[str, Any],
+        pairing_data: Dict[str, Any],
+        stats: Dict[str, int]
+    ):
+        """Queue the writes for one pairing, its legs and layover facts, flushing full batches."""
+        # Hashed before the duty periods are moved (files parsed before
+        # hashes were added have none)
+        pairing_data['content_hash'] = pairing_hash(pairing_data)
+        self._collect_facets(bid_period['facets'], pairing_data)
+
+        existing = bid_period['existing']
+        if existing is not None:
+            key = pairing_key(pairing_data)
+            bid_period['new_hashes'][key] = pairing_data['content_hash']
+            if key in existing:
+                if existing[key] is not None and existing[key] == pairing_data['content_hash']:
+                    return
+                # Changed pairings may have lost legs, so their old legs go too
+                bid_period['changed'].append(key)
+
+        fleet = bid_period['key']['fleet']
+        base = bid_period['key']['base']
+        bid_period_id = bid_period['id']
+        imported_at = bid_period['imported_at']
+
+        # Extract duty periods
+        duty_periods = pairing_data.pop('duty_periods', [])
+        base_station = self._base_station(duty_periods)
+
+        # Add references
+        pairing_data['bid_period_id'] = bid_period_id
+        pairing_data['fleet'] = fleet
+        pairing_data['base'] = base
+        pairing_data['imported_at'] = imported_at
+
+        # Count duty periods
+        pairing_data['duty_period_count'] = len(duty_periods)
+        stats['duty_periods'] += len(duty_periods)
+
+        # Extract all legs from duty periods
+        leg_ops = bid_period['leg_ops']
+        fact_ops = bid_period['fact_ops']
+        leg_count = 0
+        for dp_idx, duty_period in enumerate(duty_periods):
+            legs = duty_period.get('legs', [])
+
+            # Get duty period layover and origin stations
+            dp_layover = duty_period.get('layover_station')
+            dp_origin = duty_period.get('origin_station')
+
+            for leg_idx, leg in enumerate(legs):
+                leg['pairing_id'] = pairing_data['id']
+                leg['pairing_effective_date'] = pairing_data['effective_date']
+                leg['bid_period_id'] = bid_period_id
+                leg['duty_period_index'] = dp_idx
+                leg['leg_index'] = leg_idx
+                leg['fleet'] = fleet
+                leg['base'] = base
+                leg['layover_station'] = dp_layover  # Overnight destination
+                leg['origin_station'] = dp_origin    # Duty period start
+                leg['imported_at'] = imported_at
+                leg_ops.append(ReplaceOne({key: leg[key] for key in LEG_KEY}, leg, upsert=True))
+            leg_count += len(legs)
+
+            # One layover fact per overnight
+            if dp_layover is not None:
+                fact = {
+                    'bid_period_id': bid_period_id,
+                    'pairing_id': pairing_data['id'],
+                    'pairing_effective_date': pairing_data['effective_date'],
+                    'duty_period_index': dp_idx,
+                    'layover_station': dp_layover,
+                    'base_station': base_station,
+                    'away_from_base': dp_layover != base_station,
+                    'fleet': fleet,
+                    'base': base,
+                    'imported_at': imported_at,
+                }
+                for field in LAYOVER_FACT_FIELDS:
+                    fact[field] = pairing_data.get(field)
+                fact_ops.append(ReplaceOne(
+                    {key: fact[key] for key in LAYOVER_FACT_KEY}, fact, upsert=True
+                ))
+
+        # Store duty periods as embedded documents
+        pairing_data['duty_periods'] = duty_periods
+        pairing_data['leg_count'] = leg_count
+
+        bid_period['pairing_ops'].append(ReplaceOne(
+            {key: pairing_data[key] for key in PAIRING_KEY}, pairing_data, upsert=True
+        ))
+
+        if (len(bid_period['pairing_ops']) >= self.pairing_batch_size
+                or len(leg_ops) >= self.leg_batch_size):
+            self._flush(bid_period, stats)
+
+    @staticmethod
+    def _base_station(duty_periods: List[Dict[str, Any]]):
+        """Station code of the pairing's base: where its first duty period starts.
+
+        The bid period's base is a city name ("DENVER"), which never equals a
+        layover station code.
+        """
+        if not duty_periods:
+            return None
+        first = duty_periods[0]
+        legs = first.get('legs') or []
+        return first.get('origin_station') or (legs[0].get('departure_station') if legs else None)
+
+    @staticmethod
+    def _collect_facets(facets: Dict[str, Any], pairing_data: Dict[str, Any]):
+        """Note a pairing's sidebar filter values (unchanged pairings included)."""
+        if pairing_data.get('pairing_category') is not None:
+            facets['categories'].add(pairing_data['pairing_category'])
+        for duty_period in pairing_data.get('duty_periods') or ():
+            if duty_period.get('layover_station') is not None:
+                facets['layover_stations'].add(duty_period['layover_station'])
+        if pairing_data.get('credit_minutes') is not None:
+            facets['credit_minutes'].append(pairing_data['credit_minutes'])
+
+    def _flush(self, bid_period: Dict[str, Any], stats: Dict[str, int]):
+        """Write the queued pairings, legs and layover facts (after deleting changed pairings)."""
+        self._delete_pairings(bid_period['id'], bid_period['changed'])
+        for stat, collection, ops in (
+            ('pairings', self.pairings, bid_period['pairing_ops']),
+            ('legs', self.legs, bid_period['leg_ops']),
+            ('layover_facts', self.layover_facts, bid_period['fact_ops']),
+        ):
+            written, failed = self._bulk_replace(collection, ops)
+            stats[stat] += written
+            stats['write_errors'] += failed
+            bid_period['write_errors'] += failed
+        bid_period['changed'] = []
+        bid_period['pairing_ops'] = []
+        bid_period['leg_ops'] = []
+        bid_period['fact_ops'] = []
+
+    def _close_bid_period(
+        self,
+        bid_period: Dict[str, Any],
+        header: Dict[str, Any],
+        stats: Dict[str, int]
+    ):
+        """Flush the last batch, store the remaining header fields and facets, and clean up."""
+        self._flush(bid_period, stats)
+        bid_period_id = bid_period['id']
+
+        # Totals (and, in older streamed files, every header field) follow the pairings
+        collected = bid_period['facets']
+        credit_minutes = collected['credit_minutes']
+        update = dict(header)
+        update['facets'] = {
+            'categories': sorted(collected['categories']),
+            'layover_stations': sorted(collected['layover_stations']),
+            'credit_min_minutes': min(credit_minutes) if credit_minutes else None,
+            'credit_max_minutes': max(credit_minutes) if credit_minutes else None,
+        }
+        self.bid_periods.update_one({'_id': bid_period_id}, {'$set': update})
+
+        existing = bid_period['existing']
+        if existing is not None:
+            diff = diff_hashes(existing, bid_period['new_hashes'])
+            print(f"  {header.get('base')} {header.get('fleet')}: {diff.summary()}")
+            stats['pairings_removed'] += self._delete_pairings(bid_period_id, diff.removed)
+            stats['pairings_unchanged'] += diff.unchanged
+            if bid_period['backfill_layover_facts']:
+                self.rebuild_layover_facts(bid_period_id)
+        elif bid_period['write_errors']:
+            # Documents whose upsert failed still carry the old imported_at;
+            # sweeping would delete their last good copy
+            print(f"  {header.get('base')} {header.get('fleet')}: "
+                  f"{bid_period['write_errors']} write errors, stale documents kept")
+        else:
+            # Pairings and legs this import no longer has (dropped from a
+            # reissue, or legs of a pairing that got shorter)
+            stale = {
+                'bid_period_id': bid_period_id,
+                'imported_at': {'$ne': bid_period['imported_at']}
+            }
+            stats['pairings_removed'] += self.pairings.delete_many(stale).deleted_count
+            self.legs.delete_many(stale)
+            self.layover_facts.delete_many(stale)
+
+        self.update_facets(bid_period['key']['bid_month_year'])
+
+    def import_directory(
+        self,
+        directory: Path,
+        clear_existing: bool = False,
+        delta: bool = False
+    ) -> Dict[str, int]:
         """Import all JSON files from a directory."""
         json_files = list(directory.glob("*.json"))
 
@@ -260,11 +787,15 @@ class MongoDBImporter:
             'bid_periods': 0,
             'pairings': 0,
             'legs': 0,
-            'duty_periods': 0
+            'layover_facts': 0,
+            'duty_periods': 0,
+            'pairings_unchanged': 0,
+            'pairings_removed': 0,
+            'write_errors': 0
         }
 
         for json_file in json_files:
-            stats = self.import_file(json_file, clear_existing)
+            stats = self.import_file(json_file, clear_existing, delta)
             for key in total_stats:
                 total_stats[key] += stats[key]
 
@@ -279,6 +810,7 @@ class MongoDBImporter:
         print(f"Bid Periods: {self.bid_periods.count_documents({})}")
         print(f"Pairings: {self.pairings.count_documents({})}")
         print(f"Legs: {self.legs.count_documents({})}")
+        print(f"Layover facts: {self.layover_facts.count_documents({})}")
 
         print("\nBy Fleet:")
         pipeline = [
@@ -313,15 +845,35 @@ def main():
     parser.add_argument('--connection', type=str,
                        help="MongoDB connection string (or use .streamlit/secrets.toml)")
     parser.add_argument('--clear', action='store_true',
-                       help="Clear existing data before import")
+                       help="Clear existing data before import (re-imports replace "
+                            "documents by key, so this is only needed once for data "
+                            "imported before the unique indexes)")
+    parser.add_argument('--delta', action='store_true',
+                       help="Only write added/changed pairings and delete removed ones "
+                            "(for reissued files)")
+    parser.add_argument('--rebuild-facets', action='store_true',
+                       help="Rebuild the dashboard facets of every bid month "
+                            "(alone, or after an import)")
+    parser.add_argument('--backfill-overnights', action='store_true',
+                       help="Set overnight rest fields on pairings imported before "
+                            "they were stored (needed once for the dashboard's "
+                            "overnight filter)")
     parser.add_argument('--skip-indexes', action='store_true',
                        help="Skip index creation")
+    parser.add_argument('--pairing-batch-size', type=int, default=PAIRING_BATCH_SIZE,
+                       help=f"Pairings per bulk write (default: {PAIRING_BATCH_SIZE})")
+    parser.add_argument('--leg-batch-size', type=int, default=LEG_BATCH_SIZE,
+                       help=f"Legs per bulk write (default: {LEG_BATCH_SIZE})")
 
     args = parser.parse_args()
 
-    if not args.file and not args.dir:
+    if not args.file and not args.dir and not args.rebuild_facets and not args.backfill_overnights:
         parser.print_help()
-        print("\nError: Must specify --file or --dir")
+        print("\nError: Must specify --file, --dir, --rebuild-facets or --backfill-overnights")
+        sys.exit(1)
+
+    if args.clear and args.delta:
+        print("Error: --clear and --delta cannot be combined")
         sys.exit(1)
 
     # Determine connection string
@@ -341,7 +893,11 @@ def main():
 
     # Initialize importer
     print("Connecting to MongoDB...")
-    importer = MongoDBImporter(connection_string)
+    importer = MongoDBImporter(
+        connection_string,
+        pairing_batch_size=args.pairing_batch_size,
+        leg_batch_size=args.leg_batch_size
+    )
 
     if not importer.test_connection():
         sys.exit(1)
@@ -350,11 +906,22 @@ def main():
     if not args.skip_indexes:
         importer.create_indexes()
 
+    if args.backfill_overnights:
+        print(f"\n✓ Backfilled overnight rest on {importer.backfill_overnights()} pairings")
+
+    if not args.file and not args.dir:
+        if args.rebuild_facets:
+            print(f"\n✓ Rebuilt facets of {importer.rebuild_facets()} bid months")
+        importer.close()
+        return
+
     # Import data
+    start = time.perf_counter()
     if args.file:
-        stats = importer.import_file(Path(args.file), args.clear)
+        stats = importer.import_file(Path(args.file), args.clear, args.delta)
     else:
-        stats = importer.import_directory(Path(args.dir), args.clear)
+        stats = importer.import_directory(Path(args.dir), args.clear, args.delta)
+    elapsed = time.perf_counter() - start
 
     # Print results
     print("\n" + "=" * 60)
@@ -364,12 +931,27 @@ def main():
     print(f"Pairings: {stats['pairings']}")
     print(f"Duty Periods: {stats['duty_periods']}")
     print(f"Legs: {stats['legs']}")
+    print(f"Layover Facts: {stats['layover_facts']}")
+    if args.delta:
+        print(f"Unchanged Pairings: {stats['pairings_unchanged']}")
+    print(f"Removed Pairings: {stats['pairings_removed']}")
+    if stats.get('write_errors'):
+        print(f"Write Errors: {stats['write_errors']}")
+    documents = stats.get('pairings', 0) + stats.get('legs', 0) + stats.get('layover_facts', 0)
+    print(f"Throughput: {documents / elapsed if elapsed else 0:.0f} documents/s "
+          f"({documents} in {elapsed:.1f}s)")
+
+    if args.rebuild_facets:
+        print(f"\n✓ Rebuilt facets of {importer.rebuild_facets()} bid months")
 
     # Show database stats
     importer.print_stats()
 
     importer.close()
 
+    if stats.get('write_errors'):
+        sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
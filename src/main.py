@@ -5,15 +5,24 @@ Processes airline pairing PDF files into structured JSON.
 """
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import yaml
 import click
 from tqdm import tqdm
 
-from .utils import get_logger, StreamingPDFReader, PDFInfo, StreamingTextReader, TextFileInfo, JSONFileWriter
-from .parsers import PairingParser, PairingValidator
-from .models import MasterData
+from .utils import (
+    get_logger, StreamingPDFReader, PDFTextCache, StreamingTextReader, MappedDATReader,
+    JSONFileWriter, StreamingJSONWriter, JSONSerializer, ColumnarWriter
+)
+from .parsers import BidPeriodStart, PairingParser, PairingValidator
+from .parsers.line_classifier import DAT_IGNORED_LINE_STARTS
+from .models import BidPeriodRecord, MasterData
+
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.dat')
 
 
 def load_config(config_path: Optional[str] = None) -> dict:
@@ -35,17 +44,28 @@ def get_default_config() -> dict:
     return {
         'processing': {
             'page_chunk_size': 10,
+            'workers': 1,
+            'page_workers': 1,
+            'dat_reader': 'text',
             'skip_on_error': True
         },
         'output': {
             'format': 'json',
             'indent': 2,
+            'write_mode': 'streaming',
+            'serializer': 'pydantic',
+            'style': 'pretty',
             'create_backup': True
         },
         'validation': {
             'enabled': True,
             'strict_mode': False
         },
+        'cache': {
+            'enabled': True,
+            'dir': '.cache/pdf_text',
+            'max_size_mb': 200
+        },
         'logging': {
             'level': 'INFO',
             'console_output': True,
@@ -54,16 +74,70 @@ def get_default_config() -> dict:
         },
         'parser': {
             'leg_columns': {},
-            'patterns': {}
+            'patterns': {},
+            'pattern_timing': False
         }
     }
 
 
+def apply_cache_options(config: dict, no_cache: bool = False, rebuild_cache: bool = False):
+    """
+    Apply --no-cache / --rebuild-cache to the configuration.
+
+    Args:
+        config: Configuration dictionary (modified in place)
+        no_cache: Disable the PDF text cache
+        rebuild_cache: Ignore cached text and overwrite it
+    """
+    cache_config = config.setdefault('cache', {})
+    if no_cache:
+        cache_config['enabled'] = False
+    if rebuild_cache:
+        cache_config['rebuild'] = True
+
+
+def open_reader(input_path: str, config: dict):
+    """
+    Create the streaming reader for a PDF or DAT file.
+
+    Readers are sessions: metadata, page/line counts and content all come
+    from one read of the file, and read_chunks() reports progress. With
+    processing.dat_reader set to "mmap", DAT lines the parser has no use for
+    are skipped undecoded and yielded as None.
+
+    Args:
+        input_path: Path to input PDF or DAT file
+        config: Configuration dictionary
+
+    Returns:
+        StreamingPDFReader, StreamingTextReader or MappedDATReader, or None
+        for other file types
+    """
+    file_ext = Path(input_path).suffix.lower()
+
+    if file_ext == '.dat':
+        if config['processing'].get('dat_reader', 'text') == 'mmap':
+            return MappedDATReader(input_path, skip_starts=DAT_IGNORED_LINE_STARTS)
+        return StreamingTextReader(input_path, chunk_size=1000)  # Lines per chunk
+
+    if file_ext == '.pdf':
+        return StreamingPDFReader(
+            input_path,
+            chunk_size=config['processing']['page_chunk_size'],
+            workers=config['processing'].get('page_workers', 1),
+            cache=PDFTextCache.from_config(config)
+        )
+
+    return None
+
+
 def process_single_file(
     input_path: str,
     output_path: str,
     config: dict,
-    logger
+    logger,
+    show_progress: bool = True,
+    stats_out: Optional[dict] = None
 ) -> bool:
     """
     Process a single PDF or DAT file.
@@ -73,6 +147,10 @@ def process_single_file(
         output_path: Path to output JSON
         config: Configuration dictionary
         logger: Logger instance
+        show_progress: Show the per-file progress bar
+        stats_out: Optional dict updated with parser statistics, per-phase
+            'timings' (parse, validate, serialize seconds), 'output_bytes',
+            'output_files' (paths written) and 'error' on failure
 
     Returns:
         True if successful
@@ -80,114 +158,185 @@ def process_single_file(
     start_time = time.time()
 
     try:
-        # Detect file type and get info
-        input_file = Path(input_path)
-        file_ext = input_file.suffix.lower()
-
-        if file_ext == '.dat':
-            # Process .DAT text file
-            file_info = TextFileInfo.get_info(input_path)
-            logger.info(f"Processing DAT file: {file_info['filename']}")
-            logger.info(f"  Size: {file_info['size_mb']:.2f} MB")
-            logger.info(f"  Lines: {file_info.get('line_count', 'unknown')}")
-
-            # Initialize parser
-            parser = PairingParser(config)
-
-            # Read and parse text file in chunks
-            text_reader = StreamingTextReader(
-                input_path,
-                chunk_size=1000  # Lines per chunk
+        # Detect file type and open a single read session
+        reader = open_reader(input_path, config)
+        if reader is None:
+            logger.error(
+                f"Unsupported file type: {Path(input_path).suffix.lower()}. "
+                f"Supported types: .pdf, .dat"
             )
+            return False
 
-            total_chunks = text_reader.get_page_count()
-            line_number = 0
-
-            # Create progress bar
-            with tqdm(total=total_chunks, desc="Processing chunks", unit="chunk") as pbar:
-                for chunk_lines in text_reader.read_pages_chunked():
-                    for line in chunk_lines:
-                        line_number += 1
-                        parser.parse_line(line, line_number)
-
-                    pbar.update(1)
-
-        elif file_ext == '.pdf':
-            # Process PDF file
-            file_info = PDFInfo.get_info(input_path)
-            logger.info(f"Processing PDF: {file_info['filename']}")
-            logger.info(f"  Size: {file_info['size_mb']:.2f} MB")
-            logger.info(f"  Pages: {file_info.get('page_count', 'unknown')}")
-
-            # Initialize parser
-            parser = PairingParser(config)
-
-            # Read and parse PDF in chunks
-            pdf_reader = StreamingPDFReader(
-                input_path,
-                chunk_size=config['processing']['page_chunk_size']
+        validator = None
+        if config['validation']['enabled']:
+            validator = PairingValidator(strict_mode=config['validation']['strict_mode'])
+
+        # Streaming mode writes each pairing as it is finalized; buffered mode
+        # builds the whole MasterData and dumps it at the end. Parquet tables
+        # are always written incrementally.
+        serializer = JSONSerializer.from_config(config)
+        output_format = config['output'].get('format', 'json')
+        streaming = (
+            output_format == 'parquet'
+            or config['output'].get('write_mode', 'buffered') == 'streaming'
+        )
+        stream_writer = None
+        if output_format == 'parquet':
+            stream_writer = ColumnarWriter(output_path)
+        elif streaming:
+            stream_writer = StreamingJSONWriter(
+                output_path,
+                create_backup=config['output']['create_backup'],
+                serializer=serializer
             )
+        stream_seconds = {'validate': 0.0, 'serialize': 0.0}
+
+        def write_finished(parser: PairingParser):
+            """Validate and write the pairings/bid periods finalized so far."""
+            for item in parser.pop_finished():
+                if isinstance(item, BidPeriodStart):
+                    stream_writer.start_bid_period(item.bid_period)
+                    continue
+                validate_start = time.time()
+                if validator:
+                    if isinstance(item, BidPeriodRecord):
+                        validator.validate_bid_period(item)
+                    else:
+                        validator.validate_pairing(item)
+                serialize_start = time.time()
+                if isinstance(item, BidPeriodRecord):
+                    stream_writer.end_bid_period(item)
+                else:
+                    stream_writer.write_pairing(item)
+                stream_seconds['validate'] += serialize_start - validate_start
+                stream_seconds['serialize'] += time.time() - serialize_start
+
+        with reader, stream_writer or nullcontext():
+            file_info = reader.get_info()
+            if file_info['file_type'] == 'pdf':
+                logger.info(f"Processing PDF: {file_info['filename']}")
+                logger.info(f"  Size: {file_info['size_mb']:.2f} MB")
+                logger.info(f"  Pages: {file_info['page_count']}")
+                if reader.from_cache:
+                    logger.info("  Text: cached (skipping extraction)")
+            else:
+                logger.info(f"Processing DAT file: {file_info['filename']}")
+                logger.info(f"  Size: {file_info['size_mb']:.2f} MB")
+            if streaming:
+                logger.info(f"Streaming output to: {output_path}")
 
-            total_pages = pdf_reader.get_page_count()
+            # Initialize parser
+            parser = PairingParser(config, stream_output=streaming)
             line_number = 0
 
-            # Create progress bar
-            with tqdm(total=total_pages, desc="Processing pages", unit="page") as pbar:
-                for chunk_lines in pdf_reader.read_pages_chunked():
+            # Progress is pages for PDFs and bytes for DAT files
+            with tqdm(
+                total=reader.progress_total, desc="Processing", unit=reader.progress_unit,
+                unit_scale=reader.progress_unit == 'B', disable=not show_progress
+            ) as pbar:
+                for chunk_lines, progress in reader.read_chunks():
                     for line in chunk_lines:
                         line_number += 1
-                        parser.parse_line(line, line_number)
-
-                    pbar.update(config['processing']['page_chunk_size'])
-
+                        if line is not None:
+                            parser.parse_line(line, line_number)
+                            if streaming:
+                                write_finished(parser)
+
+                    pbar.update(progress)
+
+            # Line count is only known once the whole file has been read
+            file_info = reader.get_info()
+            if file_info.get('line_count') is not None:
+                skipped = file_info.get('skipped_lines')
+                logger.info(
+                    f"  Lines: {file_info['line_count']}"
+                    + (f" ({skipped} skipped undecoded)" if skipped is not None else '')
+                )
+
+            # Finalize parsing
+            master_data = parser.finalize()
+            page_count = file_info.get('page_count', file_info.get('line_count', 0))
+
+            if streaming:
+                write_finished(parser)
+                processing_time = time.time() - start_time
+                stream_writer.write_metadata(MasterData.build_metadata(
+                    source_file=file_info['filename'],
+                    page_count=page_count,
+                    processing_time=processing_time,
+                    total_bid_periods=stream_writer.items_written,
+                    total_pairings=stream_writer.pairings_written
+                ))
+
+        if output_format == 'parquet':
+            output_files = list(stream_writer.output_paths.values())
         else:
-            logger.error(f"Unsupported file type: {file_ext}. Supported types: .pdf, .dat")
-            return False
-
-        # Finalize parsing
-        master_data = parser.finalize()
-
-        # Add metadata
-        processing_time = time.time() - start_time
-        master_data.add_metadata(
-            source_file=file_info['filename'],
-            page_count=file_info.get('page_count', file_info.get('line_count', 0)),
-            processing_time=processing_time
-        )
-
-        # Validate if enabled
-        if config['validation']['enabled']:
-            logger.info("Validating parsed data...")
-            validator = PairingValidator(
-                strict_mode=config['validation']['strict_mode']
+            output_files = [Path(output_path)]
+
+        if streaming:
+            output_bytes = stream_writer.bytes_written
+            timings = {
+                'parse': processing_time - sum(stream_seconds.values()),
+                'validate': stream_seconds['validate'],
+                'serialize': stream_seconds['serialize']
+            }
+        else:
+            # Add metadata
+            processing_time = time.time() - start_time
+            master_data.add_metadata(
+                source_file=file_info['filename'],
+                page_count=page_count,
+                processing_time=processing_time
             )
 
-            for bid_period in master_data.data:
-                validator.validate_bid_period(bid_period)
-
-        # Write output
-        logger.info(f"Writing output to: {output_path}")
-        writer = JSONFileWriter(
-            create_backup=config['output']['create_backup']
-        )
-
-        # Convert to dict for JSON serialization
-        output_data = master_data.model_dump()
-
-        writer.write(
-            output_data,
-            output_path,
-            indent=config['output']['indent']
-        )
+            # Validate if enabled
+            validate_start = time.time()
+            if validator:
+                logger.info("Validating parsed data...")
+                for bid_period in master_data.data:
+                    validator.validate_bid_period(bid_period)
+
+            # Write output
+            serialize_start = time.time()
+            logger.info(f"Writing output to: {output_path}")
+            writer = JSONFileWriter(
+                create_backup=config['output']['create_backup'],
+                serializer=serializer
+            )
+            output_bytes = writer.write(master_data, output_path)
+            timings = {
+                'parse': processing_time,
+                'validate': serialize_start - validate_start,
+                'serialize': time.time() - serialize_start
+            }
 
         # Print statistics
         stats = parser.get_stats()
+        if stats_out is not None:
+            stats_out.update(stats)
+            stats_out['timings'] = timings
+            stats_out['output_bytes'] = output_bytes
+            stats_out['output_files'] = output_files
         logger.info("=" * 60)
         logger.info("Processing Complete!")
         logger.info(f"  Total lines processed: {stats['total_lines']}")
         logger.info(f"  Pairings parsed: {stats['pairings_parsed']}")
+        logger.debug(
+            f"  Legs: {stats['legs_fixed_width']} fixed-width, {stats['legs_tokenized']} tokenized"
+        )
         logger.info(f"  Errors: {stats['errors']}")
+        logger.debug(f"  Line types: {parser.get_line_type_counts()}")
+        for name, timing in parser.get_pattern_timings().items():
+            logger.debug(f"  Pattern {name}: {timing['calls']} calls, {timing['seconds']:.4f}s")
         logger.info(f"  Processing time: {processing_time:.2f}s")
+        output_kind = (
+            'Parquet' if output_format == 'parquet'
+            else f"{serializer.style} JSON ({serializer.engine})"
+        )
+        logger.info(
+            f"  Output: {output_bytes / (1024 * 1024):.2f} MB {output_kind}, "
+            f"serialized in {timings['serialize']:.2f}s"
+        )
         logger.info(f"  Output file: {output_path}")
         logger.info("=" * 60)
 
@@ -195,62 +344,204 @@ def process_single_file(
 
     except Exception as e:
         logger.error(f"Failed to process {input_path}: {e}", exc_info=True)
+        if stats_out is not None:
+            stats_out['error'] = str(e)
         return False
 
 
+def find_input_files(input_dir: str) -> List[Path]:
+    """
+    Find all PDF and DAT files in a directory.
+
+    Args:
+        input_dir: Input directory path
+
+    Returns:
+        Matching files (any extension case), sorted by name
+    """
+    return sorted(
+        path for path in Path(input_dir).iterdir()
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def get_output_file(input_file: Path, output_dir: Path, input_files: List[Path]) -> Path:
+    """
+    Get the JSON output path for an input file.
+
+    The PDF and DAT copies of a base share a stem, so the extension is kept
+    in the name when both are present.
+
+    Args:
+        input_file: Input PDF or DAT file
+        output_dir: Output directory
+        input_files: All files being processed
+
+    Returns:
+        Output JSON path
+    """
+    stem_count = sum(1 for path in input_files if path.stem == input_file.stem)
+    if stem_count > 1:
+        return output_dir / f"{input_file.stem}_{input_file.suffix.lstrip('.').lower()}.json"
+    return output_dir / f"{input_file.stem}.json"
+
+
+def _process_file_worker(input_path: str, output_path: str, config: dict) -> dict:
+    """
+    Parse one file in a worker process.
+
+    Workers log to the console only (the parent owns the log file) and at
+    WARNING unless DEBUG is configured, so per-file output does not
+    interleave with the parent's progress bar.
+
+    Args:
+        input_path: Path to input PDF or DAT file
+        output_path: Path to output JSON
+        config: Configuration dictionary
+
+    Returns:
+        Per-file result dictionary
+    """
+    # Files are already spread over processes; extract each PDF's pages serially
+    config = dict(config, processing=dict(config['processing'], page_workers=1))
+
+    log_config = dict(config['logging'], file_output=False)
+    if log_config.get('level', 'INFO').upper() != 'DEBUG':
+        log_config['level'] = 'WARNING'
+    logger = get_logger(f"PairingParser.{Path(input_path).name}", log_config)
+
+    start_time = time.time()
+    stats = {}
+    try:
+        success = process_single_file(
+            input_path, output_path, config, logger,
+            show_progress=False, stats_out=stats
+        )
+    except Exception as e:
+        # process_single_file already catches parse errors; this covers the rest
+        logger.error(f"Worker failed on {input_path}: {e}", exc_info=True)
+        success = False
+
+    return _file_result(input_path, output_path, success, stats, time.time() - start_time)
+
+
+def _file_result(
+    input_path: str,
+    output_path: str,
+    success: bool,
+    stats: dict,
+    seconds: float
+) -> dict:
+    """Build the per-file entry of the process_directory results."""
+    return {
+        'input': input_path,
+        'output': output_path,
+        'success': success,
+        'pairings': stats.get('pairings_parsed', 0),
+        'lines': stats.get('total_lines', 0),
+        'errors': stats.get('errors', 0),
+        'output_bytes': stats.get('output_bytes', 0),
+        'seconds': seconds
+    }
+
+
 def process_directory(
     input_dir: str,
     output_dir: str,
     config: dict,
-    logger
+    logger,
+    workers: Optional[int] = None
 ) -> dict:
     """
-    Process all PDF files in a directory.
+    Process all PDF and DAT files in a directory.
+
+    With more than one worker each file is parsed in its own process. Files
+    are submitted largest first so the longest base starts immediately and
+    the batch takes about as long as that base. A failure in one file never
+    stops the others.
 
     Args:
         input_dir: Input directory path
         output_dir: Output directory path
         config: Configuration dictionary
         logger: Logger instance
+        workers: Number of worker processes (default: processing.workers)
 
     Returns:
         Dictionary with processing results
     """
-    input_path = Path(input_dir)
     output_path = Path(output_dir)
 
-    # Find all PDF files
-    pdf_files = list(input_path.glob("*.pdf"))
+    input_files = find_input_files(input_dir)
+
+    if not input_files:
+        logger.warning(f"No PDF or DAT files found in {input_dir}")
+        return {'success': 0, 'failed': 0, 'files': []}
 
-    if not pdf_files:
-        logger.warning(f"No PDF files found in {input_dir}")
-        return {'success': 0, 'failed': 0}
+    if workers is None:
+        workers = config['processing'].get('workers', 1)
+    workers = max(1, min(workers, len(input_files)))
 
-    logger.info(f"Found {len(pdf_files)} PDF files to process")
+    logger.info(f"Found {len(input_files)} files to process ({workers} workers)")
 
     results = {'success': 0, 'failed': 0, 'files': []}
+    jobs = [
+        (str(input_file), str(get_output_file(input_file, output_path, input_files)))
+        for input_file in input_files
+    ]
+    start_time = time.time()
 
-    for pdf_file in pdf_files:
-        output_file = output_path / f"{pdf_file.stem}.json"
+    if workers == 1:
+        for input_file, output_file in jobs:
+            logger.info(f"\n{'=' * 60}")
+            file_start = time.time()
+            stats = {}
+            success = process_single_file(
+                input_file, output_file, config, logger, stats_out=stats
+            )
+            results['files'].append(
+                _file_result(input_file, output_file, success, stats, time.time() - file_start)
+            )
+    else:
+        jobs.sort(key=lambda job: Path(job[0]).stat().st_size, reverse=True)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_process_file_worker, input_file, output_file, config):
+                    (input_file, output_file)
+                for input_file, output_file in jobs
+            }
+
+            with tqdm(total=len(futures), desc="Processing files", unit="file") as pbar:
+                for future in as_completed(futures):
+                    input_file, output_file = futures[future]
+                    try:
+                        file_result = future.result()
+                    except Exception as e:
+                        # Worker process died (e.g. killed or out of memory)
+                        logger.error(f"Worker failed on {input_file}: {e}")
+                        file_result = _file_result(input_file, output_file, False, {}, 0.0)
+
+                    status = "OK" if file_result['success'] else "FAILED"
+                    logger.info(
+                        f"{Path(input_file).name}: {status} "
+                        f"({file_result['pairings']} pairings, {file_result['seconds']:.2f}s)"
+                    )
+                    results['files'].append(file_result)
+                    pbar.update(1)
 
-        logger.info(f"\n{'=' * 60}")
-        success = process_single_file(
-            str(pdf_file),
-            str(output_file),
-            config,
-            logger
-        )
+        results['files'].sort(key=lambda file_result: file_result['input'])
 
-        if success:
+    for file_result in results['files']:
+        if file_result['success']:
             results['success'] += 1
         else:
             results['failed'] += 1
 
-        results['files'].append({
-            'input': str(pdf_file),
-            'output': str(output_file),
-            'success': success
-        })
+    results['pairings'] = sum(file_result['pairings'] for file_result in results['files'])
+    results['errors'] = sum(file_result['errors'] for file_result in results['files'])
+    results['wall_time'] = time.time() - start_time
+    results['cpu_time'] = sum(file_result['seconds'] for file_result in results['files'])
 
     return results
 
@@ -280,6 +571,36 @@ def process_directory(
     type=click.Path(),
     help='Output directory for JSON files'
 )
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Parallel worker processes for --input-dir (default: processing.workers)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Always extract PDF text with pdfplumber (ignore the text cache)'
+)
+@click.option(
+    '--rebuild-cache',
+    is_flag=True,
+    help='Re-extract PDF text and overwrite cached entries'
+)
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(['json', 'parquet']),
+    default=None,
+    help='Write nested JSON or pairings/duty_periods/legs Parquet tables (default: output.format)'
+)
+@click.option(
+    '--style',
+    type=click.Choice(['pretty', 'compact']),
+    default=None,
+    help='JSON output style: indented for QA or compact for production (default: output.style)'
+)
 @click.option(
     '--config',
     '-c',
@@ -292,7 +613,8 @@ def process_directory(
     is_flag=True,
     help='Enable verbose logging'
 )
-def main(input_file, output_file, input_dir, output_dir, config, verbose):
+def main(input_file, output_file, input_dir, output_dir, workers, no_cache, rebuild_cache,
+         output_format, style, config, verbose):
     """
     Airline Pairing Parser - Convert pairing PDFs to structured JSON.
 
@@ -304,6 +626,9 @@ def main(input_file, output_file, input_dir, output_dir, config, verbose):
         # Process entire directory
         python main.py --input-dir "Pairing Source Docs" --output-dir "output"
 
+        # Process a directory with 8 worker processes
+        python main.py --input-dir "Pairing Source Docs/February 2026" --output-dir "output" -w 8
+
         # Use custom config
         python main.py -i input.pdf -o output.json -c custom_config.yaml
     """
@@ -314,6 +639,12 @@ def main(input_file, output_file, input_dir, output_dir, config, verbose):
     if verbose:
         cfg['logging']['level'] = 'DEBUG'
 
+    apply_cache_options(cfg, no_cache, rebuild_cache)
+    if output_format:
+        cfg['output']['format'] = output_format
+    if style:
+        cfg['output']['style'] = style
+
     # Setup logger
     logger = get_logger("PairingParser", cfg['logging'])
 
@@ -327,12 +658,22 @@ def main(input_file, output_file, input_dir, output_dir, config, verbose):
 
     elif input_dir and output_dir:
         # Directory mode
-        results = process_directory(input_dir, output_dir, cfg, logger)
+        results = process_directory(input_dir, output_dir, cfg, logger, workers=workers)
 
         logger.info("\n" + "=" * 60)
         logger.info("Batch Processing Complete!")
         logger.info(f"  Successful: {results['success']}")
         logger.info(f"  Failed: {results['failed']}")
+        if results['files']:
+            logger.info(f"  Pairings parsed: {results['pairings']}")
+            logger.info(f"  Errors: {results['errors']}")
+            logger.info(
+                f"  Wall time: {results['wall_time']:.2f}s "
+                f"(sum of files: {results['cpu_time']:.2f}s)"
+            )
+        for file_result in results['files']:
+            if not file_result['success']:
+                logger.info(f"  FAILED: {file_result['input']}")
         logger.info("=" * 60)
 
         sys.exit(0 if results['failed'] == 0 else 1)
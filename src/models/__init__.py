@@ -1,4 +1,8 @@
 """Data models for pairing parser."""
 from .schemas import Leg, DutyPeriod, Pairing, BidPeriod, MasterData
+from .records import LegRecord, DutyPeriodRecord, PairingRecord, BidPeriodRecord
 
-__all__ = ['Leg', 'DutyPeriod', 'Pairing', 'BidPeriod', 'MasterData']
+__all__ = [
+    'Leg', 'DutyPeriod', 'Pairing', 'BidPeriod', 'MasterData',
+    'LegRecord', 'DutyPeriodRecord', 'PairingRecord', 'BidPeriodRecord'
+]
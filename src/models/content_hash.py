@@ -0,0 +1,99 @@
+"""
+Content hash of a pairing, used to diff bid-period revisions.
+
+The hash covers every stored field of the pairing, its duty periods and
+their legs (including the derived *_minutes fields and layover stations),
+so a reissued pairing hashes the same unless something in it changed, and
+a parser fix that changes derived values changes the hash too. Computed
+fields are left out: they are functions of the stored ones.
+
+Pairings, PairingRecords and their parsed JSON dicts all hash the same, so
+a file written before hashes were added, or a MongoDB document, can be
+compared with a fresh parse.
+"""
+import hashlib
+import marshal
+from operator import attrgetter
+from typing import Any, Dict, Tuple
+
+from .schemas import Leg, DutyPeriod, Pairing
+
+
+# Bump when the hashed representation changes
+CONTENT_HASH_VERSION = 1
+
+# Nested lists are hashed separately; the hash does not cover itself
+_NESTED = {'date_instances', 'duty_periods', 'legs', 'content_hash'}
+
+
+def _scalar_fields(model: type) -> Tuple[str, ...]:
+    return tuple(name for name in model.model_fields if name not in _NESTED)
+
+
+PAIRING_FIELDS = _scalar_fields(Pairing)
+DUTY_PERIOD_FIELDS = _scalar_fields(DutyPeriod)
+LEG_FIELDS = _scalar_fields(Leg)
+
+_get_pairing = attrgetter(*PAIRING_FIELDS)
+_get_duty_period = attrgetter(*DUTY_PERIOD_FIELDS)
+_get_leg = attrgetter(*LEG_FIELDS)
+
+
+# marshal format 0 has no back-references or interned strings, so equal
+# tuples of str/int/bool/None encode to the same bytes whatever their object
+# identity (and about 7x faster than repr())
+MARSHAL_VERSION = 0
+
+
+def _digest(content: tuple) -> str:
+    encoded = marshal.dumps((CONTENT_HASH_VERSION, content), MARSHAL_VERSION)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def pairing_content_hash(pairing) -> str:
+    """
+    Hash a Pairing or PairingRecord.
+
+    Args:
+        pairing: Parsed pairing (model or record)
+
+    Returns:
+        32-character hex digest
+    """
+    return _digest((
+        _get_pairing(pairing),
+        tuple(pairing.date_instances),
+        tuple(
+            (_get_duty_period(duty_period), tuple(_get_leg(leg) for leg in duty_period.legs))
+            for duty_period in pairing.duty_periods
+        ),
+    ))
+
+
+def _values(data: Dict[str, Any], fields: Tuple[str, ...]) -> tuple:
+    return tuple(data.get(name) for name in fields)
+
+
+def pairing_dict_content_hash(data: Dict[str, Any]) -> str:
+    """
+    Hash a pairing as loaded from parsed JSON (or a MongoDB document).
+
+    Extra keys, such as computed fields or import metadata, are ignored.
+
+    Args:
+        data: Pairing dictionary with embedded duty periods and legs
+
+    Returns:
+        32-character hex digest (equal to pairing_content_hash of the parsed pairing)
+    """
+    return _digest((
+        _values(data, PAIRING_FIELDS),
+        tuple(data.get('date_instances') or ()),
+        tuple(
+            (
+                _values(duty_period, DUTY_PERIOD_FIELDS),
+                tuple(_values(leg, LEG_FIELDS) for leg in duty_period.get('legs') or ())
+            )
+            for duty_period in data.get('duty_periods') or ()
+        ),
+    ))
@@ -0,0 +1,148 @@
+"""
+Lightweight mutable records used while a pairing is being parsed.
+
+The parser fills in legs, duty periods and pairings a field at a time.
+Doing that on pydantic models pays validation on every construction and
+validate-on-assignment bookkeeping on every attribute set. These slotted
+dataclasses hold the same fields with plain attribute access, and carry
+the models' computed fields, so pydantic-core serializes a record to the
+same JSON as the model would (see JSONSerializer). Records do not run the
+models' validators, so the parser sets the *_minutes fields itself.
+PairingParser builds them for streaming output, which never builds the
+models; to_model() validates a record into them where a real model is
+needed.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from pydantic import TypeAdapter, computed_field
+
+from .schemas import Leg, DutyPeriod, Pairing, BidPeriod
+
+
+def _model_output(model: type):
+    """
+    Class decorator giving a record the computed fields of a model.
+
+    The model's properties (and the private static helpers they call) are
+    reused as-is, so record and model output cannot drift apart.
+
+    Args:
+        model: Pydantic model the record stands in for
+    """
+    def decorate(cls):
+        for name, value in vars(model).items():
+            if isinstance(value, staticmethod) and name.startswith('_'):
+                setattr(cls, name, value)
+        for name, info in model.model_computed_fields.items():
+            setattr(cls, name, computed_field(info.wrapped_property))
+        return cls
+    return decorate
+
+
+@_model_output(Leg)
+@dataclass(slots=True)
+class LegRecord:
+    """Leg fields (see Leg)."""
+    equipment: Optional[str] = None
+    deadhead: bool = False
+    flight_number: Optional[str] = None
+    departure_station: Optional[str] = None
+    arrival_station: Optional[str] = None
+    departure_time: Optional[str] = None
+    arrival_time: Optional[str] = None
+    ground_time: Optional[str] = "0"
+    meal_code: Optional[str] = None
+    flight_time: Optional[str] = "0"
+    accumulated_flight_time: Optional[str] = "0"
+    duty_time: Optional[str] = "0"
+    d_c: Optional[str] = "0"
+    departure_time_minutes: Optional[int] = None
+    arrival_time_minutes: Optional[int] = None
+    ground_time_minutes: int = 0
+    flight_time_minutes: int = 0
+    accumulated_flight_time_minutes: int = 0
+    duty_time_minutes: int = 0
+    d_c_minutes: int = 0
+
+
+@_model_output(DutyPeriod)
+@dataclass(slots=True)
+class DutyPeriodRecord:
+    """Duty period fields (see DutyPeriod)."""
+    report_time: Optional[str] = None
+    legs: List[LegRecord] = field(default_factory=list)
+    release_time: Optional[str] = None
+    hotel: Optional[str] = None
+    hotel_phone: Optional[str] = None
+    ground_transport: Optional[str] = None
+    layover_station: Optional[str] = None
+    report_time_minutes: Optional[int] = None
+    release_time_minutes: Optional[int] = None
+    overnight_minutes: Optional[int] = None
+
+
+@_model_output(Pairing)
+@dataclass(slots=True)
+class PairingRecord:
+    """Pairing fields (see Pairing)."""
+    id: Optional[str] = None
+    pairing_category: Optional[str] = None
+    is_first_officer: bool = False
+    effective_date: Optional[str] = None
+    through_date: Optional[str] = None
+    date_instances: List[str] = field(default_factory=list)
+    duty_periods: List[DutyPeriodRecord] = field(default_factory=list)
+    days: Optional[str] = None
+    credit: Optional[str] = None
+    flight_time: Optional[str] = None
+    time_away_from_base: Optional[str] = None
+    international_flight_time: Optional[str] = None
+    nte: Optional[str] = None
+    meal_money: Optional[str] = None
+    t_c: Optional[str] = None
+    credit_minutes: int = 0
+    flight_time_minutes: int = 0
+    time_away_from_base_minutes: int = 0
+    international_flight_time_minutes: int = 0
+    min_overnight_minutes: Optional[int] = None
+    max_overnight_minutes: Optional[int] = None
+    content_hash: Optional[str] = None
+
+    def to_model(self) -> Pairing:
+        """Build the validated Pairing (with its duty periods and legs)."""
+        return Pairing.model_validate(self, from_attributes=True)
+
+
+@_model_output(BidPeriod)
+@dataclass(slots=True)
+class BidPeriodRecord:
+    """Bid period fields (see BidPeriod)."""
+    bid_month_year: Optional[str] = None
+    fleet: Optional[str] = None
+    base: Optional[str] = None
+    effective_date: Optional[str] = None
+    through_date: Optional[str] = None
+    pairings: List[PairingRecord] = field(default_factory=list)
+    ftm: Optional[str] = None
+    ttl: Optional[str] = None
+
+    def to_model(self) -> BidPeriod:
+        """Build the validated BidPeriod (with its pairings)."""
+        return BidPeriod.model_validate(self, from_attributes=True)
+
+
+# Serializers are built while the computed fields are still pydantic
+# descriptors (that is how they are discovered); the descriptors are then
+# replaced by the plain properties so attribute access costs what it does
+# on the models.
+RECORD_ADAPTERS = {
+    cls: TypeAdapter(cls)
+    for cls in (LegRecord, DutyPeriodRecord, PairingRecord, BidPeriodRecord)
+}
+for _cls, _model in (
+    (LegRecord, Leg), (DutyPeriodRecord, DutyPeriod), (PairingRecord, Pairing),
+    (BidPeriodRecord, BidPeriod)
+):
+    for _name, _info in _model.model_computed_fields.items():
+        setattr(_cls, _name, _info.wrapped_property)
@@ -2,8 +2,9 @@
 Data models using Pydantic for validation and serialization.
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, computed_field
+from pydantic import BaseModel, Field, field_validator, model_validator, computed_field
 from datetime import datetime
+from .time_codec import clock_to_minutes, duration_to_minutes, format_clock, total_to_minutes
 
 
 class Leg(BaseModel):
@@ -22,6 +23,16 @@ class Leg(BaseModel):
     duty_time: Optional[str] = "0"
     d_c: Optional[str] = "0"
 
+    # Times in minutes, set by the parser together with the strings above
+    # (derived from them when a Leg is built directly)
+    departure_time_minutes: Optional[int] = None
+    arrival_time_minutes: Optional[int] = None
+    ground_time_minutes: int = 0
+    flight_time_minutes: int = 0
+    accumulated_flight_time_minutes: int = 0
+    duty_time_minutes: int = 0
+    d_c_minutes: int = 0
+
     @field_validator('ground_time', 'flight_time', 'accumulated_flight_time', 'duty_time', 'd_c')
     @classmethod
     def validate_time_format(cls, v):
@@ -30,92 +41,29 @@ class Leg(BaseModel):
             return "0"
         return v
 
+    @model_validator(mode='after')
+    def derive_minutes(self):
+        """Fill *_minutes from the time strings when they were not given."""
+        for field in ('departure_time', 'arrival_time'):
+            if getattr(self, f"{field}_minutes") is None:
+                setattr(self, f"{field}_minutes", clock_to_minutes(getattr(self, field)))
+        for field in ('ground_time', 'flight_time', 'accumulated_flight_time', 'duty_time', 'd_c'):
+            value = getattr(self, field)
+            if value != "0" and not getattr(self, f"{field}_minutes"):
+                setattr(self, f"{field}_minutes", duration_to_minutes(value))
+        return self
+
     @computed_field
     @property
     def departure_time_formatted(self) -> Optional[str]:
         """Convert HHMM to HH:MM format."""
-        if not self.departure_time or len(self.departure_time) != 4:
-            return None
-        return f"{self.departure_time[:2]}:{self.departure_time[2:]}"
+        return format_clock(self.departure_time)
 
     @computed_field
     @property
     def arrival_time_formatted(self) -> Optional[str]:
         """Convert HHMM to HH:MM format."""
-        if not self.arrival_time or len(self.arrival_time) != 4:
-            return None
-        return f"{self.arrival_time[:2]}:{self.arrival_time[2:]}"
-
-    @computed_field
-    @property
-    def departure_time_minutes(self) -> Optional[int]:
-        """Convert departure time to minutes since midnight."""
-        if not self.departure_time or len(self.departure_time) != 4:
-            return None
-        try:
-            hours = int(self.departure_time[:2])
-            minutes = int(self.departure_time[2:])
-            return hours * 60 + minutes
-        except ValueError:
-            return None
-
-    @computed_field
-    @property
-    def arrival_time_minutes(self) -> Optional[int]:
-        """Convert arrival time to minutes since midnight."""
-        if not self.arrival_time or len(self.arrival_time) != 4:
-            return None
-        try:
-            hours = int(self.arrival_time[:2])
-            minutes = int(self.arrival_time[2:])
-            return hours * 60 + minutes
-        except ValueError:
-            return None
-
-    @computed_field
-    @property
-    def ground_time_minutes(self) -> int:
-        """Convert ground time to total minutes."""
-        return self._time_to_minutes(self.ground_time)
-
-    @computed_field
-    @property
-    def flight_time_minutes(self) -> int:
-        """Convert flight time to total minutes."""
-        return self._time_to_minutes(self.flight_time)
-
-    @computed_field
-    @property
-    def accumulated_flight_time_minutes(self) -> int:
-        """Convert accumulated flight time to total minutes."""
-        return self._time_to_minutes(self.accumulated_flight_time)
-
-    @computed_field
-    @property
-    def duty_time_minutes(self) -> int:
-        """Convert duty time to total minutes."""
-        return self._time_to_minutes(self.duty_time)
-
-    @computed_field
-    @property
-    def d_c_minutes(self) -> int:
-        """Convert D/C time to total minutes."""
-        return self._time_to_minutes(self.d_c)
-
-    @staticmethod
-    def _time_to_minutes(time_str: Optional[str]) -> int:
-        """Convert H:MM or HH:MM format to total minutes."""
-        if not time_str or time_str == "0":
-            return 0
-        try:
-            if ':' in time_str:
-                parts = time_str.split(':')
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                return hours * 60 + minutes
-            return 0
-        except (ValueError, IndexError):
-            return 0
+        return format_clock(self.arrival_time)
 
 
 class DutyPeriod(BaseModel):
@@ -128,47 +76,35 @@ class DutyPeriod(BaseModel):
     ground_transport: Optional[str] = None
     layover_station: Optional[str] = None  # Set by Pairing.model_post_init()
 
+    # Report/release in minutes since midnight, set by the parser together
+    # with the HHMM strings (derived from them when built directly)
+    report_time_minutes: Optional[int] = None
+    release_time_minutes: Optional[int] = None
+
+    # Rest from release to the next duty period's report, set by the parser
+    # (None for the last duty period)
+    overnight_minutes: Optional[int] = None
+
+    @model_validator(mode='after')
+    def derive_minutes(self):
+        """Fill report/release minutes from the HHMM strings when they were not given."""
+        if self.report_time_minutes is None:
+            self.report_time_minutes = clock_to_minutes(self.report_time)
+        if self.release_time_minutes is None:
+            self.release_time_minutes = clock_to_minutes(self.release_time)
+        return self
+
     @computed_field
     @property
     def report_time_formatted(self) -> Optional[str]:
         """Convert HHMM to HH:MM format."""
-        if not self.report_time or len(self.report_time) != 4:
-            return None
-        return f"{self.report_time[:2]}:{self.report_time[2:]}"
+        return format_clock(self.report_time)
 
     @computed_field
     @property
     def release_time_formatted(self) -> Optional[str]:
         """Convert HHMM to HH:MM format."""
-        if not self.release_time or len(self.release_time) != 4:
-            return None
-        return f"{self.release_time[:2]}:{self.release_time[2:]}"
-
-    @computed_field
-    @property
-    def report_time_minutes(self) -> Optional[int]:
-        """Convert report time to minutes since midnight."""
-        if not self.report_time or len(self.report_time) != 4:
-            return None
-        try:
-            hours = int(self.report_time[:2])
-            minutes = int(self.report_time[2:])
-            return hours * 60 + minutes
-        except ValueError:
-            return None
-
-    @computed_field
-    @property
-    def release_time_minutes(self) -> Optional[int]:
-        """Convert release time to minutes since midnight."""
-        if not self.release_time or len(self.release_time) != 4:
-            return None
-        try:
-            hours = int(self.release_time[:2])
-            minutes = int(self.release_time[2:])
-            return hours * 60 + minutes
-        except ValueError:
-            return None
+        return format_clock(self.release_time)
 
     @computed_field
     @property
@@ -199,6 +135,31 @@ class Pairing(BaseModel):
     meal_money: Optional[str] = None
     t_c: Optional[str] = None
 
+    # Summary metrics in minutes, set by the parser together with the strings
+    # above (derived from them when a Pairing is built directly)
+    credit_minutes: int = 0
+    flight_time_minutes: int = 0
+    time_away_from_base_minutes: int = 0
+    international_flight_time_minutes: int = 0
+
+    # Shortest and longest overnight_minutes of the duty periods, set by the
+    # parser (None without overnights)
+    min_overnight_minutes: Optional[int] = None
+    max_overnight_minutes: Optional[int] = None
+
+    # Hash of the fields above and the duty periods (see content_hash.py),
+    # set by the parser when the pairing is finalized
+    content_hash: Optional[str] = None
+
+    @model_validator(mode='after')
+    def derive_summary_minutes(self):
+        """Fill *_minutes from H.MM strings when they were not given."""
+        for field in ('credit', 'flight_time', 'time_away_from_base', 'international_flight_time'):
+            value = getattr(self, field)
+            if value and not getattr(self, f"{field}_minutes"):
+                setattr(self, f"{field}_minutes", duration_to_minutes(value))
+        return self
+
     @computed_field
     @property
     def effective_date_iso(self) -> Optional[str]:
@@ -211,30 +172,6 @@ class Pairing(BaseModel):
         """Convert MM/DD/YY to ISO 8601 format (YYYY-MM-DD)."""
         return self._parse_date_to_iso(self.through_date)
 
-    @computed_field
-    @property
-    def credit_minutes(self) -> int:
-        """Convert credit (H.MM format) to total minutes."""
-        return self._decimal_time_to_minutes(self.credit)
-
-    @computed_field
-    @property
-    def flight_time_minutes(self) -> int:
-        """Convert flight time (H.MM format) to total minutes."""
-        return self._decimal_time_to_minutes(self.flight_time)
-
-    @computed_field
-    @property
-    def time_away_from_base_minutes(self) -> int:
-        """Convert time away from base (H.MM format) to total minutes."""
-        return self._decimal_time_to_minutes(self.time_away_from_base)
-
-    @computed_field
-    @property
-    def international_flight_time_minutes(self) -> int:
-        """Convert international flight time (H.MM format) to total minutes."""
-        return self._decimal_time_to_minutes(self.international_flight_time)
-
     @staticmethod
     def _parse_date_to_iso(date_str: Optional[str]) -> Optional[str]:
         """Convert MM/DD/YY to YYYY-MM-DD format."""
@@ -247,22 +184,6 @@ class Pairing(BaseModel):
         except (ValueError, AttributeError):
             return None
 
-    @staticmethod
-    def _decimal_time_to_minutes(time_str: Optional[str]) -> int:
-        """Convert decimal time format (H.MM or HH.MM) to total minutes."""
-        if not time_str:
-            return 0
-        try:
-            # Format is H.MM or HH.MM where .MM represents minutes (not decimal)
-            parts = time_str.split('.')
-            if len(parts) == 2:
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                return hours * 60 + minutes
-            return 0
-        except (ValueError, IndexError, AttributeError):
-            return 0
-
 
 class BidPeriod(BaseModel):
     """A monthly bid period containing all pairings."""
@@ -303,30 +224,13 @@ class BidPeriod(BaseModel):
     @property
     def ftm_minutes(self) -> int:
         """Convert total flight time (H,HHH:MM format) to total minutes."""
-        return self._comma_time_to_minutes(self.ftm)
+        return total_to_minutes(self.ftm)
 
     @computed_field
     @property
     def ttl_minutes(self) -> int:
         """Convert total time (H,HHH:MM format) to total minutes."""
-        return self._comma_time_to_minutes(self.ttl)
-
-    @staticmethod
-    def _comma_time_to_minutes(time_str: Optional[str]) -> int:
-        """Convert comma-separated time format (H,HHH:MM) to total minutes."""
-        if not time_str:
-            return 0
-        try:
-            # Remove commas and parse HHH:MM
-            clean_str = time_str.replace(',', '')
-            if ':' in clean_str:
-                parts = clean_str.split(':')
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                return hours * 60 + minutes
-            return 0
-        except (ValueError, IndexError, AttributeError):
-            return 0
+        return total_to_minutes(self.ttl)
 
 
 class MasterData(BaseModel):
@@ -336,10 +240,25 @@ class MasterData(BaseModel):
 
     def add_metadata(self, source_file: str, page_count: int, processing_time: float):
         """Add parsing metadata."""
-        self.metadata = {
+        self.metadata = self.build_metadata(
+            source_file, page_count, processing_time,
+            total_bid_periods=len(self.data),
+            total_pairings=sum(len(bp.pairings) for bp in self.data)
+        )
+
+    @staticmethod
+    def build_metadata(
+        source_file: str,
+        page_count: int,
+        processing_time: float,
+        total_bid_periods: int,
+        total_pairings: int
+    ) -> dict:
+        """Build the metadata section (also used by streaming output)."""
+        return {
             "source_file": source_file,
             "page_count": page_count,
             "processing_time_seconds": round(processing_time, 2),
-            "total_bid_periods": len(self.data),
-            "total_pairings": sum(len(bp.pairings) for bp in self.data)
+            "total_bid_periods": total_bid_periods,
+            "total_pairings": total_pairings
         }
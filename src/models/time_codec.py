@@ -0,0 +1,190 @@
+"""
+Time string conversions shared by the parser and the models.
+
+Pairing files use three time notations:
+- HHMM clock times ("0920"), shown as HH:MM
+- H.MM durations ("9.24", ".45"), stored as H:MM ("9:24", ":45")
+- H,HHH:MM totals on the FTM/TTL line ("13,578:02")
+
+Clock times and durations come from a tiny domain (1440 times of day,
+durations under 100 hours), so both are answered from lookup tables built
+at import. Anything outside the tables goes through the parsing fallback,
+which is LRU-cached.
+"""
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+
+# Durations at or above this many hours are parsed instead of looked up
+MAX_TABLE_HOURS = 100
+
+
+def _build_clock_table() -> Dict[str, Tuple[str, int]]:
+    """HHMM -> (HH:MM, minutes since midnight) for every time of day."""
+    return {
+        f"{hours:02d}{minutes:02d}": (f"{hours:02d}:{minutes:02d}", hours * 60 + minutes)
+        for hours in range(24)
+        for minutes in range(60)
+    }
+
+
+def _build_duration_table() -> Dict[str, Tuple[str, int]]:
+    """H.MM and H:MM -> (stored H:MM text, minutes) for durations under MAX_TABLE_HOURS."""
+    table = {}
+    for hours in [''] + [str(hours) for hours in range(MAX_TABLE_HOURS)]:
+        total = int(hours or 0) * 60
+        for minutes in range(60):
+            text = f"{hours}:{minutes:02d}"
+            table[text] = (text, total + minutes)
+            table[f"{hours}.{minutes:02d}"] = (text, total + minutes)
+    table['0'] = ('0', 0)
+    table['.00'] = ('0', 0)
+    return table
+
+
+_CLOCKS = _build_clock_table()
+_DURATIONS = _build_duration_table()
+
+
+@lru_cache(maxsize=4096)
+def _parse_clock(value: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """Parse a clock time missing from the table (e.g. "2400")."""
+    if not value or len(value) != 4:
+        return None, None
+    formatted = f"{value[:2]}:{value[2:]}"
+    try:
+        return formatted, int(value[:2]) * 60 + int(value[2:])
+    except ValueError:
+        return formatted, None
+
+
+@lru_cache(maxsize=4096)
+def _parse_duration(value: Optional[str]) -> Tuple[str, int]:
+    """Parse a duration missing from the table (e.g. "123.45")."""
+    if not value or value == '.00':
+        return '0', 0
+    text = value.replace('.', ':')
+    parts = text.split(':')
+    if len(parts) != 2:
+        return text, 0
+    try:
+        # ":45" is 45 minutes with no hours
+        return text, int(parts[0] or 0) * 60 + int(parts[1])
+    except ValueError:
+        return text, 0
+
+
+def clock_to_minutes(value: Optional[str]) -> Optional[int]:
+    """
+    Convert an HHMM clock time to minutes since midnight.
+
+    Args:
+        value: Clock time (e.g. "0920")
+
+    Returns:
+        Minutes since midnight, or None if the value is not an HHMM time
+    """
+    entry = _CLOCKS.get(value)
+    if entry is None:
+        entry = _parse_clock(value)
+    return entry[1]
+
+
+def format_clock(value: Optional[str]) -> Optional[str]:
+    """
+    Convert an HHMM clock time to HH:MM.
+
+    Args:
+        value: Clock time (e.g. "0920")
+
+    Returns:
+        HH:MM string, or None if the value is not four characters long
+    """
+    entry = _CLOCKS.get(value)
+    if entry is None:
+        entry = _parse_clock(value)
+    return entry[0]
+
+
+def duration_text(value: Optional[str]) -> str:
+    """
+    Convert an H.MM duration to its stored H:MM form.
+
+    Args:
+        value: Duration (e.g. "9.24" or ".00")
+
+    Returns:
+        H:MM string, or "0" for empty and zero durations
+    """
+    entry = _DURATIONS.get(value)
+    if entry is None:
+        entry = _parse_duration(value)
+    return entry[0]
+
+
+def parse_duration(value: Optional[str]) -> Tuple[str, int]:
+    """
+    Convert an H.MM duration to its stored H:MM form and total minutes in one lookup.
+
+    Args:
+        value: Duration (e.g. "9.24" or ".00")
+
+    Returns:
+        (H:MM string, total minutes)
+    """
+    entry = _DURATIONS.get(value)
+    if entry is None:
+        entry = _parse_duration(value)
+    return entry
+
+
+def duration_to_minutes(value: Optional[str]) -> int:
+    """
+    Convert an H.MM or H:MM duration to total minutes.
+
+    Args:
+        value: Duration (e.g. "9.24", "9:24" or ".45")
+
+    Returns:
+        Total minutes (0 for empty or unparseable values)
+    """
+    entry = _DURATIONS.get(value)
+    if entry is None:
+        entry = _parse_duration(value)
+    return entry[1]
+
+
+def total_to_minutes(value: Optional[str]) -> int:
+    """
+    Convert an H,HHH:MM total to minutes.
+
+    Args:
+        value: Total (e.g. "13,578:02")
+
+    Returns:
+        Total minutes (0 for empty or unparseable values)
+    """
+    if not value:
+        return 0
+    return duration_to_minutes(value.replace(',', ''))
+
+
+def rest_minutes(release_minutes: Optional[int], next_report_minutes: Optional[int]) -> Optional[int]:
+    """
+    Minutes from a release to the next report.
+
+    Clock times carry no date, so a next report earlier in the day than the
+    release is taken to be on the following day.
+
+    Args:
+        release_minutes: Release time in minutes since midnight
+        next_report_minutes: Next report time in minutes since midnight
+
+    Returns:
+        Rest in minutes, or None if either time is missing
+    """
+    if release_minutes is None or next_report_minutes is None:
+        return None
+    if next_report_minutes < release_minutes:
+        next_report_minutes += 1440
+    return next_report_minutes - release_minutes
@@ -1,5 +1,5 @@
 """Parser modules for airline pairings."""
-from .pairing_parser import PairingParser
+from .pairing_parser import PairingParser, BidPeriodStart
 from .validators import PairingValidator, TimeValidator
 
-__all__ = ['PairingParser', 'PairingValidator', 'TimeValidator']
+__all__ = ['PairingParser', 'BidPeriodStart', 'PairingValidator', 'TimeValidator']
@@ -1,11 +1,13 @@
 """
 Base parser class with core parsing logic.
 """
-import re
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 import logging
 
+from .patterns import build_pattern_registry
+from ..models.time_codec import duration_text
+
 
 class BaseParser(ABC):
     """Abstract base parser class."""
@@ -20,19 +22,16 @@ class BaseParser(ABC):
         self.config = config
         self.logger = logging.getLogger(__name__)
 
-        # Compile regex patterns once
+        # Shared precompiled patterns (with any config overrides)
         self._compile_patterns()
 
     def _compile_patterns(self):
-        """Compile all regex patterns from config."""
-        self.patterns = {}
-        pattern_config = self.config.get('parser', {}).get('patterns', {})
+        """Resolve the regex pattern registry for this config."""
+        self.patterns = build_pattern_registry(self.config)
 
-        for name, pattern in pattern_config.items():
-            try:
-                self.patterns[name] = re.compile(pattern)
-            except re.error as e:
-                self.logger.warning(f"Invalid regex pattern '{name}': {e}")
+    def get_pattern_timings(self) -> Dict[str, Dict[str, float]]:
+        """Get per-pattern timing (only populated when parser.pattern_timing is on)."""
+        return self.patterns.get_timings()
 
     @abstractmethod
     def parse_line(self, line: str, line_number: int) -> Optional[Dict]:
@@ -87,14 +86,7 @@ class BaseParser(ABC):
         Returns:
             Formatted time string
         """
-        if not time_str or time_str == ".00":
-            return "0"
-
-        # Replace decimal point with colon for time format
-        if '.' in time_str:
-            return time_str.replace('.', ':')
-
-        return time_str
+        return duration_text(time_str)
 
     def is_leg_line(self, line: str) -> bool:
         """
@@ -115,12 +107,12 @@ class BaseParser(ABC):
 
     def extract_report_time(self, line: str) -> Optional[str]:
         """Extract report time from line."""
-        match = self.patterns.get('report_time', re.compile(r'RPT:\s*(\d+)')).search(line)
+        match = self.patterns['report_time'].search(line)
         return match.group(1) if match else None
 
     def extract_release_time(self, line: str) -> Optional[str]:
         """Extract release time from line."""
-        match = self.patterns.get('release_time', re.compile(r'RLS:\s*(\d+)')).search(line)
+        match = self.patterns['release_time'].search(line)
         return match.group(1) if match else None
 
     def extract_hotel_info(self, line: str) -> Dict[str, Optional[str]]:
@@ -137,13 +129,13 @@ class BaseParser(ABC):
 
         # Extract hotel name and phone
         # Format: HTL: HOTEL NAME phone OP=> operator_phone
-        hotel_match = re.search(r'HTL:\s*([A-Z\s]+?)\s+(\d[\d\-]+)', line)
+        hotel_match = self.patterns['hotel_info'].search(line)
         if hotel_match:
             hotel_info['name'] = hotel_match.group(1).strip()
             hotel_info['phone'] = hotel_match.group(2).strip()
 
         # Extract operator phone
-        op_match = re.search(r'OP=>\s*([\d\-]+)', line)
+        op_match = self.patterns['hotel_operator_phone'].search(line)
         if op_match:
             hotel_info['operator_phone'] = op_match.group(1).strip()
 
@@ -152,10 +144,5 @@ class BaseParser(ABC):
     def extract_ground_transport(self, line: str) -> Optional[str]:
         """Extract ground transportation info."""
         # Look for common transport indicators
-        transport_pattern = re.compile(
-            r'(VIP|AIRLINE|CONNECT|TAXI|TOURING|HANATOURS|VIACAO|AUTOBUS)\s+[A-Z\s]+'
-            r'\s*(\d[\d\-]+)',
-            re.IGNORECASE
-        )
-        match = transport_pattern.search(line)
+        match = self.patterns['ground_transport'].search(line)
         return match.group(0).strip() if match else None
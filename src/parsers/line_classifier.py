@@ -0,0 +1,107 @@
+"""
+Single-pass line classification for pairing files.
+
+Every record in a DSL file (PDF text or fixed-width .DAT) is identified by
+the first token on the line once leading whitespace is removed, so a lookup
+on the first four non-blank characters decides what almost every line is.
+"""
+from typing import Dict, Mapping, Optional
+
+from .patterns import DEFAULT_PATTERNS
+
+
+class LineType:
+    """Record types produced by LineClassifier."""
+    DSL_HEADER = 'dsl_header'        # "1DSL EFF 01/30/26 THRU 03/01/26 787 DENVER ..."
+    BID_HEADER = 'bid_header'        # "EFF 12/30/25 THRU 01/29/26 787 CHICAGO JAN 2026"
+    PAIRING_START = 'pairing_start'  # "EFF 02/07/26 THRU 03/01/26 ... ID D8001 - GLOBAL (PAC)"
+    REPORT = 'report'                # "RPT: 0955"
+    RELEASE = 'release'              # "RLS: 1610 HTL: ..."
+    LEG = 'leg'                      # "78P 143 DEN NRT ..." / "DH 3707 ..." / "UX 3543 ..."
+    HOTEL = 'hotel'                  # "HTL: ..."
+    GROUND_TRANSPORT = 'ground_transport'
+    SUMMARY = 'summary'              # "DAYS- 3 CRD-22.50* FTM-22.50* ..."
+    TOTALS = 'totals'                # "DEN 787  FTM- 5,735:50  TTL- 5,880:02"
+    SEPARATOR = 'separator'          # "-----", "EQP FLT# ...", "ALPA MEAL CODE ..."
+    OTHER = 'other'
+
+    ALL = (
+        DSL_HEADER, BID_HEADER, PAIRING_START, REPORT, RELEASE, LEG, HOTEL,
+        GROUND_TRANSPORT, SUMMARY, TOTALS, SEPARATOR, OTHER
+    )
+
+
+# First four non-blank characters -> record type
+PREFIX_TYPES = {
+    '1DSL': LineType.DSL_HEADER,
+    'RPT:': LineType.REPORT,
+    'RLS:': LineType.RELEASE,
+    'HTL:': LineType.HOTEL,
+    'DAYS': LineType.SUMMARY,
+    '----': LineType.SEPARATOR,
+    'EQP ': LineType.SEPARATOR,
+    'ALPA': LineType.SEPARATOR,
+}
+
+# Deadhead legs without an equipment code
+DEADHEAD_PREFIXES = ('DH ', 'UX ')
+
+# Starts of .DAT lines the parser never uses, at their fixed columns: page
+# separators, column headers and lines blank through the record columns
+# (calendar fragment only). All classify() as SEPARATOR or OTHER, so readers
+# can drop them with one bytes.startswith() call before decoding.
+DAT_IGNORED_LINE_STARTS = (b' ----', b'    EQP ', b' ALPA', b' ' * 40)
+
+
+class LineClassifier:
+    """Classify pairing file lines into record types in a single pass."""
+
+    def __init__(self, patterns: Optional[Mapping] = None):
+        """
+        Initialize classifier with zeroed per-type counters.
+
+        Args:
+            patterns: Pattern registry (defaults to the shared DEFAULT_PATTERNS)
+        """
+        patterns = patterns if patterns is not None else DEFAULT_PATTERNS
+        # Ground transport lines (second line of a hotel block) have no fixed prefix
+        self._ground_transport_hint = patterns['ground_transport_hint']
+        self.counts: Dict[str, int] = dict.fromkeys(LineType.ALL, 0)
+
+    def classify(self, line: str) -> str:
+        """
+        Determine the record type of a line.
+
+        Args:
+            line: Raw text line (leading whitespace allowed)
+
+        Returns:
+            One of the LineType constants
+        """
+        head = line.lstrip()[:4]
+        line_type = PREFIX_TYPES.get(head)
+
+        if line_type is None:
+            if head == 'EFF ':
+                # Pairing lines carry an ID; page headers only repeat the bid period
+                if ' ID ' in line:
+                    line_type = LineType.PAIRING_START
+                elif 'THRU' in line:
+                    line_type = LineType.BID_HEADER
+                else:
+                    line_type = LineType.OTHER
+            elif head[:2].isdigit() and head[2:3].isalpha() or head[:3] in DEADHEAD_PREFIXES:
+                line_type = LineType.LEG
+            elif 'FTM-' in line and 'TTL-' in line:
+                line_type = LineType.TOTALS
+            elif self._ground_transport_hint.search(line):
+                line_type = LineType.GROUND_TRANSPORT
+            else:
+                line_type = LineType.OTHER
+
+        self.counts[line_type] += 1
+        return line_type
+
+    def get_counts(self) -> Dict[str, int]:
+        """Get number of lines seen per record type."""
+        return self.counts.copy()
@@ -1,95 +1,193 @@
 """
 Main pairing parser implementation.
 """
-import re
-from typing import Dict, Any, Optional
+from operator import itemgetter
+from typing import Callable, Dict, Any, List, NamedTuple, Optional, Tuple, Union
 from .base_parser import BaseParser
+from .line_classifier import LineClassifier, LineType
 from ..models import Leg, DutyPeriod, Pairing, BidPeriod, MasterData
+from ..models.records import LegRecord, DutyPeriodRecord, PairingRecord, BidPeriodRecord
+from ..models.content_hash import pairing_content_hash
+from ..models.time_codec import clock_to_minutes, duration_to_minutes, parse_duration, rest_minutes
+
+
+# Pairing summary field -> registry pattern name (fallback path)
+SUMMARY_FIELDS = (
+    ('days', 'summary_days'),
+    ('credit', 'summary_credit'),
+    ('flight_time', 'summary_flight_time'),
+    ('time_away_from_base', 'summary_time_away_from_base'),
+    ('international_flight_time', 'summary_international_flight_time'),
+    ('nte', 'summary_nte'),
+    ('meal_money', 'summary_meal_money'),
+    ('t_c', 'summary_t_c'),
+)
+
+# Leg fields that may appear in parser.leg_columns
+LEG_FIELDS = (
+    'equipment', 'deadhead', 'flight_number', 'departure_station', 'arrival_station',
+    'departure_time', 'arrival_time', 'ground_time', 'meal_code', 'flight_time',
+    'accumulated_flight_time', 'duty_time', 'd_c',
+)
+
+# H.MM duration columns, stored as H:MM
+LEG_TIME_FIELDS = frozenset((
+    'ground_time', 'flight_time', 'accumulated_flight_time', 'duty_time', 'd_c'
+))
+
+# Columns that must line up for a leg line to be decoded by position
+LEG_ANCHOR_FIELDS = {
+    'departure_station': 'alpha',
+    'arrival_station': 'alpha',
+    'departure_time': 'digit',
+    'arrival_time': 'digit',
+}
+
+# Summary fields in H.MM format that also carry a *_minutes value
+SUMMARY_MINUTE_FIELDS = (
+    'credit', 'flight_time', 'time_away_from_base', 'international_flight_time'
+)
+
+
+class LegColumns(NamedTuple):
+    """parser.leg_columns precomputed as column slices."""
+    fields: Tuple[str, ...]
+    slices: Callable  # line -> tuple of column slices, in field order
+    durations: Tuple[Tuple[str, str], ...]  # (field, *_minutes field)
+    width: int  # Shortest line that spans every column
+    blanks: Callable  # line -> characters that must be blank before anchors
+    letters: Callable  # line -> station column slices
+    digits: Callable  # line -> clock time column slices
+
+
+class BidPeriodStart(NamedTuple):
+    """Marks the start of a bid period's pairings in streamed output."""
+    bid_period: BidPeriodRecord
 
 
 class PairingParser(BaseParser):
     """Parser for airline pairing PDF files."""
 
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize pairing parser."""
+    def __init__(self, config: Dict[str, Any], stream_output: bool = False):
+        """
+        Initialize pairing parser.
+
+        Args:
+            config: Configuration dictionary
+            stream_output: Hand finalized pairings and bid periods out through
+                pop_finished() as records instead of collecting them as
+                models in master_data
+        """
         super().__init__(config)
 
         # State tracking
         self.master_data = MasterData()
-        self.current_bid_period: Optional[BidPeriod] = None
-        self.current_pairing: Optional[Pairing] = None
-        self.current_duty_period: Optional[DutyPeriod] = None
-        self.current_leg: Optional[Leg] = None
+        self.stream_output = stream_output
+        self._finished: List[Union[BidPeriodStart, PairingRecord, BidPeriodRecord]] = []
+        self._bid_period_pairings = 0
+        # Streaming hands out slotted records, which serialize like the models
+        # without building them; buffered output keeps models, so they are
+        # built directly
+        if stream_output:
+            types = (LegRecord, DutyPeriodRecord, PairingRecord, BidPeriodRecord)
+        else:
+            types = (Leg, DutyPeriod, Pairing, BidPeriod)
+        self._leg_type, self._duty_period_type, self._pairing_type, self._bid_period_type = types
+        self.current_bid_period: Optional[Union[BidPeriod, BidPeriodRecord]] = None
+        self.current_pairing: Optional[Union[Pairing, PairingRecord]] = None
+        self.current_duty_period: Optional[Union[DutyPeriod, DutyPeriodRecord]] = None
+        self.current_leg: Optional[Union[Leg, LegRecord]] = None
+
+        # Record type -> handler dispatch table
+        self.classifier = LineClassifier(self.patterns)
+        self._handlers = {
+            LineType.DSL_HEADER: self._parse_dsl_header,
+            LineType.BID_HEADER: self._parse_bid_header,
+            LineType.TOTALS: self._handle_totals,
+            LineType.PAIRING_START: self._parse_pairing_start,
+            LineType.REPORT: self._parse_report_time,
+            LineType.RELEASE: self._handle_release,
+            LineType.LEG: self._parse_leg,
+            LineType.HOTEL: self._parse_hotel,
+            LineType.GROUND_TRANSPORT: self._parse_ground_transport,
+            LineType.SUMMARY: self._handle_summary,
+        }
+
+        # Fixed-width leg decoding (parser.leg_columns)
+        self._leg_columns = self._build_leg_columns(
+            config.get('parser', {}).get('leg_columns') or {}
+        )
 
         # Statistics
         self.stats = {
             'total_lines': 0,
             'pairings_parsed': 0,
+            'legs_fixed_width': 0,
+            'legs_tokenized': 0,
             'errors': 0,
             'warnings': 0
         }
 
+    def _build_leg_columns(self, leg_columns: Dict[str, Any]) -> Optional[LegColumns]:
+        """
+        Precompute the column slices for parser.leg_columns.
+
+        Station and clock time columns are the anchors: each must follow a
+        blank and hold only letters/digits, which is the sanity check that
+        sends misaligned lines to the tokenizer.
+
+        Args:
+            leg_columns: Mapping of Leg field -> [start, end] (0-indexed, end exclusive)
+
+        Returns:
+            LegColumns, or None if the columns cannot be used
+        """
+        missing = [field for field in LEG_ANCHOR_FIELDS if field not in leg_columns]
+        if missing:
+            if leg_columns:
+                self.logger.warning(
+                    f"leg_columns missing {', '.join(missing)}; fixed-width leg decoding disabled"
+                )
+            return None
+
+        columns = sorted(
+            (start, end, field) for field, (start, end) in leg_columns.items()
+            if field in LEG_FIELDS
+        )
+        position = 0
+        for start, end, field in columns:
+            if start < position or (field in LEG_ANCHOR_FIELDS and start <= position):
+                self.logger.warning(
+                    f"leg_columns '{field}' overlaps previous column; fixed-width leg decoding disabled"
+                )
+                return None
+            position = end
+
+        def anchors(kind):
+            return [(start, end) for start, end, field in columns if LEG_ANCHOR_FIELDS.get(field) == kind]
+
+        # itemgetter slices every column in one C-level call
+        return LegColumns(
+            fields=tuple(field for _, _, field in columns),
+            slices=itemgetter(*(slice(start, end) for start, end, _ in columns)),
+            durations=tuple(
+                (field, f"{field}_minutes") for _, _, field in columns if field in LEG_TIME_FIELDS
+            ),
+            width=position,
+            blanks=itemgetter(*(start - 1 for start, end, field in columns if field in LEG_ANCHOR_FIELDS)),
+            letters=itemgetter(*(slice(start, end) for start, end in anchors('alpha'))),
+            digits=itemgetter(*(slice(start, end) for start, end in anchors('digit'))),
+        )
+
     def parse_line(self, line: str, line_number: int) -> Optional[Dict]:
         """Parse a single line and update state."""
         self.stats['total_lines'] += 1
 
         try:
-            # Header line (bid period info) - matches "EFF dd/dd/dd THRU dd/dd/dd 787 BASE MONTH YEAR"
-            # or contains "1DSL" marker
-            # Headers repeat at top of each page, identified by fleet number but no pairing ID
-            is_header = ("1DSL" in line or
-                        ("EFF" in line and
-                         "THRU" in line and
-                         " ID " not in line and  # Not a pairing line
-                         ("787" in line or "777" in line or "737" in line or "75E" in line or "21N" in line)))  # Has fleet number
-
-            if is_header:
-                self._parse_header_line(line)
-
-            # Total FTM/TTL line (end of bid period)
-            # Format: "ORD 320 FTM-13,857:51 TTL-14,848:56"
-            # NOT the pairing summary which has "DAYS-" at start
-            elif "FTM-" in line and "TTL-" in line and "DAYS-" not in line:
-                self._parse_totals_line(line)
-                self._finalize_bid_period()
-
-            # Pairing start line (has ID and category) - CHECK BEFORE CALENDAR!
-            elif "EFF" in line and " ID " in line:
-                self._parse_pairing_start(line)
-
-            # Report time (start of duty period) - CHECK BEFORE CALENDAR!
-            elif "RPT:" in line:
-                self._parse_report_time(line)
-
-            # Release time (end of duty period) - CHECK BEFORE CALENDAR!
-            elif "RLS:" in line:
-                self._parse_release_time(line)
-                # Check if hotel info is on the same line (common in compact format)
-                if "HTL:" in line:
-                    self._parse_hotel(line)
-                self._finalize_duty_period()
-
-            # Flight leg - CHECK BEFORE CALENDAR!
-            elif self.is_leg_line(line):
-                self._parse_leg(line)
-
-            # Calendar instances (date patterns) - DISABLED for compact format
-            # In compact format, calendar dates are on the pairing header line itself
-            # elif "|" in line and "SU" not in line and "EQP" not in line:
-            #     self._parse_calendar_line(line)
-
-            # Hotel information
-            elif "HTL:" in line:
-                self._parse_hotel(line)
-
-            # Ground transportation
-            elif any(x in line for x in ['VIP', 'AIRLINE', 'CONNECT', 'TAXI', 'TOURING']):
-                self._parse_ground_transport(line)
-
-            # Pairing summary (end of pairing)
-            elif "DAYS-" in line:
-                self._parse_pairing_summary(line)
-                self._finalize_pairing()
+            # The line classifier picks the record type from the line prefix, then dispatch to its handler
+            handler = self._handlers.get(self.classifier.classify(line))
+            if handler:
+                handler(line)
 
         except Exception as e:
             self.stats['errors'] += 1
@@ -97,15 +195,41 @@ class PairingParser(BaseParser):
 
         return None
 
-    def _parse_header_line(self, line: str):
+    def _handle_totals(self, line: str):
+        """Totals line (FTM/TTL) closes the bid period."""
+        self._parse_totals_line(line)
+        self._finalize_bid_period()
+
+    def _handle_release(self, line: str):
+        """Release line closes the duty period."""
+        self._parse_release_time(line)
+        # Check if hotel info is on the same line (common in compact format)
+        if "HTL:" in line:
+            self._parse_hotel(line)
+        self._finalize_duty_period()
+
+    def _handle_summary(self, line: str):
+        """Pairing summary (DAYS-/CRD-/FTM-) closes the pairing."""
+        self._parse_pairing_summary(line)
+        self._finalize_pairing()
+
+    def _parse_dsl_header(self, line: str):
+        """Parse full-format bid period header ("1DSL EFF ...")."""
+        self._parse_header_line(line, dsl_format=True)
+
+    def _parse_bid_header(self, line: str):
+        """Parse compact bid period header ("EFF ... THRU ... 787 CHICAGO ...")."""
+        self._parse_header_line(line, dsl_format=False)
+
+    def _parse_header_line(self, line: str, dsl_format: bool):
         """Parse bid period header line."""
         # Only create new bid period if we don't have one yet
         # (headers repeat on every page, but represent the same bid period)
         if not self.current_bid_period:
-            self.current_bid_period = BidPeriod()
+            self.current_bid_period = self._bid_period_type()
 
-        # Check if this is the compact format (ORDDSLMini) or full format (with 1DSL)
-        if "1DSL" in line:
+        # Compact format (ORDDSLMini, PDF text) or full format (with 1DSL)
+        if dsl_format:
             # Original format: positions from notebook
             self.current_bid_period.bid_month_year = self.extract_field(line, 68, 78)
             self.current_bid_period.fleet = self.extract_field(line, 35, 38)
@@ -136,14 +260,12 @@ class PairingParser(BaseParser):
 
         # Extract fleet from totals line (e.g., "ORD 787 FTM-...")
         # Fleet is between base and FTM
-        fleet_pattern = r"([A-Z]{3})\s+([0-9]{2,3}[A-Z]?)\s+FTM-"
-        fleet_match = re.search(fleet_pattern, line)
+        fleet_match = self.patterns['totals_fleet'].search(line)
         if fleet_match:
             self.current_bid_period.fleet = fleet_match.group(2)
 
         # Extract FTM and TTL values
-        pattern = r"(FTM|TTL)-\s*(\d{1,}(?:,\d{1,})*:\d{2})"
-        matches = re.findall(pattern, line)
+        matches = self.patterns['totals_values'].findall(line)
 
         if len(matches) >= 2:
             self.current_bid_period.ftm = matches[0][1]
@@ -156,7 +278,7 @@ class PairingParser(BaseParser):
 
         # Extract digits from the calendar section
         calendar_section = line[109:129] if len(line) > 109 else line
-        dates = re.findall(r'(\d+)', calendar_section)
+        dates = self.patterns['calendar_digits'].findall(calendar_section)
         self.current_pairing.date_instances.extend(dates)
 
     def _parse_pairing_start(self, line: str):
@@ -165,15 +287,10 @@ class PairingParser(BaseParser):
         if self.current_pairing:
             self._finalize_pairing()
 
-        self.current_pairing = Pairing()
+        self.current_pairing = self._pairing_type()
 
         # Extract pairing information (use full line, not substring that cuts off 'E')
-        pattern = (
-            r"EFF (\d{2}/\d{2}/\d{2}) THRU (\d{2}/\d{2}/\d{2}).*?"
-            r"(F/O)?\s*ID (\w+)\s+-\s+(\w+)(?:\s+\((\w+)\))?"
-        )
-
-        match = re.search(pattern, line)
+        match = self.patterns['pairing_start'].search(line)
         if match:
             eff_date, thru_date, fo_presence, id_value, category, optional_content = match.groups()
             self.current_pairing.effective_date = eff_date
@@ -191,7 +308,7 @@ class PairingParser(BaseParser):
             # Calendar dates appear after the category: "BASIC (HNL) 30 31 1 2| 3"
             # Find everything after the closing paren or category, extract digits
             calendar_part = line.split(')')[-1] if ')' in line else line.split(category_str)[-1]
-            dates = re.findall(r'\b(\d{1,2})\b', calendar_part)
+            dates = self.patterns['calendar_dates'].findall(calendar_part)
             self.current_pairing.date_instances.extend(dates)
 
             self.logger.debug(f"Started pairing: {id_value} - {category_str}")
@@ -202,10 +319,11 @@ class PairingParser(BaseParser):
         if self.current_duty_period:
             self._finalize_duty_period()
 
-        self.current_duty_period = DutyPeriod()
+        self.current_duty_period = self._duty_period_type()
         report_time = self.extract_report_time(line)
         if report_time:
             self.current_duty_period.report_time = report_time
+            self.current_duty_period.report_time_minutes = clock_to_minutes(report_time)
 
     def is_leg_line(self, line: str) -> bool:
         """
@@ -239,24 +357,91 @@ class PairingParser(BaseParser):
     def _parse_leg(self, line: str):
         """Parse flight leg data.
 
+        Fixed-width (.DAT) lines are sliced by parser.leg_columns; anything that
+        fails the column sanity check (e.g. PDF text) is tokenized instead.
+        """
+        if not self.current_duty_period:
+            self.current_duty_period = self._duty_period_type()
+
+        values = self._decode_leg_columns(line) if self._leg_columns else None
+        if values is not None:
+            self.stats['legs_fixed_width'] += 1
+        else:
+            values = self._decode_leg_tokens(line)
+            if values is None:
+                return
+            self._set_duration_minutes(values)
+            self.stats['legs_tokenized'] += 1
+
+        values['departure_time_minutes'] = clock_to_minutes(values.get('departure_time'))
+        values['arrival_time_minutes'] = clock_to_minutes(values.get('arrival_time'))
+        self.current_duty_period.legs.append(self._leg_type(**values))
+
+    @staticmethod
+    def _set_duration_minutes(values: Dict[str, Any]):
+        """Add the *_minutes values for a tokenized leg's H:MM durations."""
+        for field in LEG_TIME_FIELDS:
+            value = values.get(field)
+            if value:
+                values[f"{field}_minutes"] = duration_to_minutes(value)
+
+    def _decode_leg_columns(self, line: str) -> Optional[Dict[str, Any]]:
+        """Decode a fixed-width leg line by column slices.
+
+        Format (DAT columns, see parser.leg_columns):
+            "    78P     143 DEN NRT 1125 1540  25.55 L D S  12.15 12.15  14.15      .00"
+            "    21N DH 1244 IAH DEN 0818 1000                2.42   .00   3.27     2.42"
+
+        Returns:
+            Leg field values, or None if the line does not line up with the configured columns
+        """
+        columns = self._leg_columns
+
+        # Stations/times must sit in their columns, each after a blank
+        if (len(line) < columns.width
+                or ''.join(columns.blanks(line)).strip(' ')
+                or not ''.join(columns.letters(line)).isalpha()
+                or not ''.join(columns.digits(line)).isdigit()):
+            return None
+
+        values = {
+            field: value
+            for field, value in zip(columns.fields, map(str.strip, columns.slices(line)))
+            if value
+        }
+        for field, minutes_field in columns.durations:
+            value = values.get(field)
+            if value:
+                # ".00" -> "0", "9.24" -> "9:24"
+                values[field], values[minutes_field] = parse_duration(value)
+        if 'meal_code' in values:
+            values['meal_code'] = ' '.join(values['meal_code'].split())
+        if 'deadhead' in values:
+            values['deadhead'] = True
+
+        return values
+
+    def _decode_leg_tokens(self, line: str) -> Optional[Dict[str, Any]]:
+        """Decode a leg line by splitting it into whitespace-separated tokens.
+
         Format: Equipment [DH] FlightNum Dept Arr DepTime ArrTime GroundTime MealCode(s) FlightTime AccumFlightTime AccumDutyTime
 
         Examples:
         - 73G 123 ORD LAX 0800 1030 2:15 B L 4:30 4:30 6:45
         - 78J DH 456 LAX SFO 1245 1415 0 7:45 12:15 14:30
         - 37K 789 SFO ORD 1415 2030 0 B D 4:15 16:30 18:45
-        """
-        if not self.current_duty_period:
-            self.current_duty_period = DutyPeriod()
 
-        leg = Leg()
+        Returns:
+            Leg field values, or None if the line has too few fields
+        """
+        values = {}
 
         # Remove calendar dates (everything after |)
         main_part = line.split('|')[0] if '|' in line else line
         fields = main_part.split()
 
         if len(fields) < 6:
-            return
+            return None
 
         # Field index tracker
         idx = 0
@@ -264,44 +449,44 @@ class PairingParser(BaseParser):
         # Check if first field is a deadhead marker (UX, DH, etc.) without equipment code
         # Deadhead markers are 2-letter uppercase codes
         if len(fields[idx]) == 2 and fields[idx].isupper() and fields[idx].isalpha():
-            leg.deadhead = True
-            leg.equipment = None  # No equipment code for UX deadheads
+            values['deadhead'] = True
+            values['equipment'] = None  # No equipment code for UX deadheads
             idx += 1
         else:
             # Normal leg: equipment code comes first
-            leg.equipment = fields[idx]
+            values['equipment'] = fields[idx]
             idx += 1
 
             # Check for deadhead marker after equipment (e.g., "20S DH 1124...")
             if idx < len(fields) and len(fields[idx]) == 2 and fields[idx].isupper() and fields[idx].isalpha():
-                leg.deadhead = True
+                values['deadhead'] = True
                 idx += 1
             else:
-                leg.deadhead = False
+                values['deadhead'] = False
 
         # 3. Flight number
         if idx < len(fields):
-            leg.flight_number = fields[idx]
+            values['flight_number'] = fields[idx]
             idx += 1
 
         # 4. Departure station
         if idx < len(fields):
-            leg.departure_station = fields[idx]
+            values['departure_station'] = fields[idx]
             idx += 1
 
         # 5. Arrival station
         if idx < len(fields):
-            leg.arrival_station = fields[idx]
+            values['arrival_station'] = fields[idx]
             idx += 1
 
         # 6. Departure time (HHMM format)
         if idx < len(fields):
-            leg.departure_time = fields[idx]
+            values['departure_time'] = fields[idx]
             idx += 1
 
         # 7. Arrival time (HHMM format)
         if idx < len(fields):
-            leg.arrival_time = fields[idx]
+            values['arrival_time'] = fields[idx]
             idx += 1
 
         # 8. Ground time (H:MM or HH:MM or may be missing)
@@ -310,7 +495,7 @@ class PairingParser(BaseParser):
             field = fields[idx]
             # Check if this looks like a time (contains : or is "0" or numeric)
             if ':' in field or field == '0' or (field.replace('.', '').replace(':', '').isdigit()):
-                leg.ground_time = self.convert_time(field)
+                values['ground_time'] = self.convert_time(field)
                 idx += 1
             # Otherwise, no ground time present, this is meal code
 
@@ -327,21 +512,21 @@ class PairingParser(BaseParser):
                 break
 
         if meal_codes:
-            leg.meal_code = ' '.join(meal_codes)
+            values['meal_code'] = ' '.join(meal_codes)
 
         # 10. Flight time (H:MM or HH:MM)
         if idx < len(fields):
-            leg.flight_time = self.convert_time(fields[idx])
+            values['flight_time'] = self.convert_time(fields[idx])
             idx += 1
 
         # 11. Accumulated flight time (H:MM or HH:MM)
         if idx < len(fields):
-            leg.accumulated_flight_time = self.convert_time(fields[idx])
+            values['accumulated_flight_time'] = self.convert_time(fields[idx])
             idx += 1
 
         # 12. Accumulated duty time (H:MM or HH:MM)
         if idx < len(fields):
-            leg.duty_time = self.convert_time(fields[idx])
+            values['duty_time'] = self.convert_time(fields[idx])
             idx += 1
 
         # 13. D/C (deadhead credit) - optional field, only present on some deadhead legs
@@ -349,13 +534,13 @@ class PairingParser(BaseParser):
             field = fields[idx]
             # Check if it's a time format (H:MM, HH:MM, or decimal like .00)
             if ':' in field or '.' in field or field.replace('.', '').replace(':', '').isdigit():
-                leg.d_c = self.convert_time(field)
+                values['d_c'] = self.convert_time(field)
                 idx += 1
 
         # Any remaining fields before calendar dates are ignored
         # (calendar dates start after duty time)
 
-        self.current_duty_period.legs.append(leg)
+        return values
 
     def _parse_release_time(self, line: str):
         """Parse release time."""
@@ -365,6 +550,7 @@ class PairingParser(BaseParser):
         release_time = self.extract_release_time(line)
         if release_time:
             self.current_duty_period.release_time = release_time
+            self.current_duty_period.release_time_minutes = clock_to_minutes(release_time)
 
     def _parse_hotel(self, line: str):
         """Parse hotel information."""
@@ -393,24 +579,51 @@ class PairingParser(BaseParser):
 
     def _parse_pairing_summary(self, line: str):
         """Parse pairing summary metrics."""
-        if not self.current_pairing:
+        pairing = self.current_pairing
+        if not pairing:
             return
 
-        patterns = {
-            "days": r"DAYS-\s*(\d+)",
-            "credit": r"CRD-\s*([\d\.]+)",
-            "flight_time": r"FTM-\s*([\d\.:]+)",
-            "time_away_from_base": r"TAFB-\s*([\d\.:]+)",
-            "international_flight_time": r"INT-\s*([\d\.]+)",
-            "nte": r"NTE-\s*([\d\.]+)",
-            "meal_money": r"M\$-\s*([\d\.]+)",
-            "t_c": r"T/C-\s*([\d\.]+)"
-        }
+        match = self.patterns['pairing_summary'].search(line)
+        if not match:
+            self._parse_pairing_summary_fields(line)
+            return
+
+        pairing.days = match['days']
+        pairing.nte = match['nte']
+        pairing.meal_money = match['meal_money']
+        pairing.t_c = match['t_c']
+
+        pairing.credit = match['credit']
+        pairing.credit_minutes = int(match['credit_h'] or 0) * 60 + int(match['credit_m'])
+        pairing.flight_time = match['flight_time']
+        pairing.flight_time_minutes = (
+            int(match['flight_time_h'] or 0) * 60 + int(match['flight_time_m'])
+        )
+        pairing.time_away_from_base = match['time_away_from_base']
+        pairing.time_away_from_base_minutes = (
+            int(match['time_away_from_base_h'] or 0) * 60 + int(match['time_away_from_base_m'])
+        )
+        pairing.international_flight_time = match['international_flight_time']
+        pairing.international_flight_time_minutes = (
+            int(match['international_flight_time_h'] or 0) * 60
+            + int(match['international_flight_time_m'])
+        )
+
+    def _parse_pairing_summary_fields(self, line: str):
+        """Parse summary metrics one field at a time (irregular summary lines)."""
+        pairing = self.current_pairing
 
-        for field, pattern in patterns.items():
-            match = re.search(pattern, line)
+        for field, pattern_name in SUMMARY_FIELDS:
+            match = self.patterns[pattern_name].search(line)
             if match:
-                setattr(self.current_pairing, field, match.group(1))
+                setattr(pairing, field, match.group(1))
+
+        for field in SUMMARY_MINUTE_FIELDS:
+            setattr(
+                pairing,
+                f"{field}_minutes",
+                duration_to_minutes(getattr(pairing, field))
+            )
 
     def _finalize_duty_period(self):
         """Finalize current duty period."""
@@ -423,8 +636,17 @@ class PairingParser(BaseParser):
         if self.current_pairing and self.current_bid_period:
             # Set layover_station values based on business rules
             self._set_layover_stations(self.current_pairing)
-
-            self.current_bid_period.pairings.append(self.current_pairing)
+            self._set_overnight_minutes(self.current_pairing)
+            self.current_pairing.content_hash = pairing_content_hash(self.current_pairing)
+
+            if self.stream_output:
+                if not self._bid_period_pairings:
+                    # Header lines come first, so its key fields are known
+                    self._finished.append(BidPeriodStart(self.current_bid_period))
+                self._finished.append(self.current_pairing)
+            else:
+                self.current_bid_period.pairings.append(self.current_pairing)
+            self._bid_period_pairings += 1
             self.stats['pairings_parsed'] += 1
             self.logger.debug(f"Finalized pairing: {self.current_pairing.id}")
             self.current_pairing = None
@@ -461,15 +683,57 @@ class PairingParser(BaseParser):
                 else:
                     duty_period.layover_station = None
 
+    def _set_overnight_minutes(self, pairing):
+        """Set the rest after each duty period and the pairing's shortest and longest.
+
+        Rest runs from a duty period's release to the next one's report; the
+        last duty period has none.
+        """
+        overnights = []
+        duty_periods = pairing.duty_periods
+        for i, duty_period in enumerate(duty_periods):
+            if i == len(duty_periods) - 1:
+                duty_period.overnight_minutes = None
+                continue
+            duty_period.overnight_minutes = rest_minutes(
+                duty_period.release_time_minutes, duty_periods[i + 1].report_time_minutes
+            )
+            if duty_period.overnight_minutes is not None:
+                overnights.append(duty_period.overnight_minutes)
+
+        pairing.min_overnight_minutes = min(overnights) if overnights else None
+        pairing.max_overnight_minutes = max(overnights) if overnights else None
+
     def _finalize_bid_period(self):
         """Finalize current bid period."""
         if self.current_bid_period:
-            self.master_data.data.append(self.current_bid_period)
+            if self.stream_output:
+                # Header fields only; its pairings were already handed out
+                self._finished.append(self.current_bid_period)
+            else:
+                self.master_data.data.append(self.current_bid_period)
             self.logger.info(
                 f"Finalized bid period: {self.current_bid_period.bid_month_year} "
-                f"with {len(self.current_bid_period.pairings)} pairings"
+                f"with {self._bid_period_pairings} pairings"
             )
             self.current_bid_period = None
+            self._bid_period_pairings = 0
+
+    def pop_finished(self) -> List[Union[BidPeriodStart, PairingRecord, BidPeriodRecord]]:
+        """
+        Take the pairings and bid periods finalized since the last call.
+
+        Only used with stream_output. A BidPeriodStart comes before the first
+        pairing of each bid period, and the bid period itself follows its own
+        pairings and carries no pairings itself. Records serialize like the
+        models; call to_model() where a pydantic model is needed.
+
+        Returns:
+            BidPeriodStart markers and finalized PairingRecord and
+            BidPeriodRecord objects in file order
+        """
+        finished, self._finished = self._finished, []
+        return finished
 
     def finalize(self) -> MasterData:
         """Finalize parsing and return complete data."""
@@ -491,3 +755,7 @@ class PairingParser(BaseParser):
     def get_stats(self) -> Dict[str, int]:
         """Get parsing statistics."""
         return self.stats.copy()
+
+    def get_line_type_counts(self) -> Dict[str, int]:
+        """Get number of lines classified per record type."""
+        return self.classifier.get_counts()
@@ -0,0 +1,224 @@
+"""
+Precompiled regex registry shared by all parsers.
+
+Every pattern is compiled once at import time. Parsers receive a read-only
+registry, optionally with overrides from ``parser.patterns`` in the config,
+and can switch on per-pattern timing with ``parser.pattern_timing``.
+"""
+import re
+import time
+import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator
+
+
+logger = logging.getLogger(__name__)
+
+
+# Default pattern sources, keyed by registry name
+PATTERN_SOURCES = MappingProxyType({
+    # Duty period boundaries
+    'report_time': r"RPT:\s*(\d+)",
+    'release_time': r"RLS:\s*(\d+)",
+
+    # Hotel: "HTL: HOTEL NAME phone OP=> operator_phone"
+    'hotel_info': r"HTL:\s*([A-Z\s]+?)\s+(\d[\d\-]+)",
+    'hotel_operator_phone': r"OP=>\s*([\d\-]+)",
+
+    # Ground transport line and the cheap keyword check used by the classifier
+    'ground_transport': (
+        r"(?i)(VIP|AIRLINE|CONNECT|TAXI|TOURING|HANATOURS|VIACAO|AUTOBUS)\s+[A-Z\s]+"
+        r"\s*(\d[\d\-]+)"
+    ),
+    'ground_transport_hint': r"VIP|AIRLINE|CONNECT|TAXI|TOURING",
+
+    # Pairing start: "EFF 02/07/26 THRU 03/01/26 ... ID D8001  - GLOBAL  (PAC)"
+    'pairing_start': (
+        r"EFF (\d{2}/\d{2}/\d{2}) THRU (\d{2}/\d{2}/\d{2}).*?"
+        r"(F/O)?\s*ID (\w+)\s+-\s+(\w+)(?:\s+\((\w+)\))?"
+    ),
+    'calendar_dates': r"\b(\d{1,2})\b",
+    'calendar_digits': r"(\d+)",
+
+    # Bid period totals: "ORD 787 FTM-13,578:02 TTL-14,387:35"
+    'totals_fleet': r"([A-Z]{3})\s+([0-9]{2,3}[A-Z]?)\s+FTM-",
+    'totals_values': r"(FTM|TTL)-\s*(\d{1,}(?:,\d{1,})*:\d{2})",
+
+    # Pairing summary: "DAYS- 3 CRD-22.50* FTM-22.50* TAFB- 50.45 INT- 22.50 NTE-   .00
+    # M$-179.65 T/C-  .00  3.03*   1|". All eight metrics in one scan; H.MM
+    # durations also capture hours/minutes so minutes need no re-splitting.
+    # Anything after T/C (rig value, calendar fragment) is left unmatched.
+    'pairing_summary': (
+        r"DAYS-\s*(?P<days>\d+)\s+"
+        r"CRD-\s*(?P<credit>(?P<credit_h>\d*)\.(?P<credit_m>\d\d))\*?\s+"
+        r"FTM-\s*(?P<flight_time>(?P<flight_time_h>\d*)\.(?P<flight_time_m>\d\d))\*?\s+"
+        r"TAFB-\s*(?P<time_away_from_base>"
+        r"(?P<time_away_from_base_h>\d*)\.(?P<time_away_from_base_m>\d\d))\*?\s+"
+        r"INT-\s*(?P<international_flight_time>"
+        r"(?P<international_flight_time_h>\d*)\.(?P<international_flight_time_m>\d\d))\*?\s+"
+        r"NTE-\s*(?P<nte>[\d\.]+)\*?\s+"
+        r"M\$-\s*(?P<meal_money>[\d\.]+)\*?\s+"
+        r"T/C-\s*(?P<t_c>[\d\.]+)"
+    ),
+
+    # Per-field summary patterns, used when a line does not fit pairing_summary
+    'summary_days': r"DAYS-\s*(\d+)",
+    'summary_credit': r"CRD-\s*([\d\.]+)",
+    'summary_flight_time': r"FTM-\s*([\d\.:]+)",
+    'summary_time_away_from_base': r"TAFB-\s*([\d\.:]+)",
+    'summary_international_flight_time': r"INT-\s*([\d\.]+)",
+    'summary_nte': r"NTE-\s*([\d\.]+)",
+    'summary_meal_money': r"M\$-\s*([\d\.]+)",
+    'summary_t_c': r"T/C-\s*([\d\.]+)",
+})
+
+
+class TimedPattern:
+    """Compiled pattern wrapper that records call count and time spent."""
+
+    __slots__ = ('name', 'compiled', 'calls', 'seconds')
+
+    def __init__(self, name: str, compiled: re.Pattern):
+        self.name = name
+        self.compiled = compiled
+        self.calls = 0
+        self.seconds = 0.0
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.calls += 1
+            self.seconds += time.perf_counter() - start
+
+    def search(self, string: str, *args):
+        return self._timed(self.compiled.search, string, *args)
+
+    def match(self, string: str, *args):
+        return self._timed(self.compiled.match, string, *args)
+
+    def fullmatch(self, string: str, *args):
+        return self._timed(self.compiled.fullmatch, string, *args)
+
+    def findall(self, string: str, *args):
+        return self._timed(self.compiled.findall, string, *args)
+
+    def __getattr__(self, attr: str) -> Any:
+        # pattern, flags, groupindex, ... come from the compiled pattern
+        return getattr(self.compiled, attr)
+
+
+class PatternRegistry(Mapping):
+    """Immutable name -> compiled pattern mapping."""
+
+    def __init__(self, patterns: Mapping):
+        """
+        Initialize registry.
+
+        Args:
+            patterns: Mapping of name to compiled pattern (or TimedPattern)
+        """
+        self._patterns = MappingProxyType(dict(patterns))
+
+    def __getitem__(self, name: str):
+        return self._patterns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._patterns)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def with_overrides(self, overrides: Mapping) -> 'PatternRegistry':
+        """
+        Build a new registry with some patterns replaced.
+
+        Invalid or unknown overrides, and overrides whose capture groups
+        (count or names) differ from the default's, are logged and the
+        default is kept: the parsers unpack groups by position and name.
+
+        Args:
+            overrides: Mapping of name to regex source string
+
+        Returns:
+            New PatternRegistry (this registry is left unchanged)
+        """
+        patterns = dict(self._patterns)
+
+        for name, source in overrides.items():
+            if name not in patterns:
+                logger.warning(f"Unknown regex pattern '{name}' in config, ignored")
+                continue
+            try:
+                compiled = re.compile(source)
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern '{name}': {e}")
+                continue
+
+            default = getattr(patterns[name], 'compiled', patterns[name])
+            if compiled.groups != default.groups or dict(compiled.groupindex) != dict(default.groupindex):
+                logger.warning(
+                    f"Regex pattern '{name}' in config has {compiled.groups} groups "
+                    f"{sorted(compiled.groupindex)}, expected {default.groups} "
+                    f"{sorted(default.groupindex)}; keeping the default"
+                )
+                continue
+            patterns[name] = compiled
+
+        return PatternRegistry(patterns)
+
+    def timed(self) -> 'PatternRegistry':
+        """Build a registry whose patterns record per-pattern timing."""
+        return PatternRegistry({
+            name: TimedPattern(name, getattr(pattern, 'compiled', pattern))
+            for name, pattern in self._patterns.items()
+        })
+
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-pattern call counts and cumulative seconds.
+
+        Returns:
+            Dictionary of name -> {'calls', 'seconds'} (empty if not timed)
+        """
+        return {
+            name: {'calls': pattern.calls, 'seconds': pattern.seconds}
+            for name, pattern in self._patterns.items()
+            if isinstance(pattern, TimedPattern)
+        }
+
+
+# Compiled once at import, shared by every parser instance
+DEFAULT_PATTERNS = PatternRegistry({
+    name: re.compile(source) for name, source in PATTERN_SOURCES.items()
+})
+
+
+def build_pattern_registry(config: Dict[str, Any]) -> PatternRegistry:
+    """
+    Get the pattern registry for a parser configuration.
+
+    Args:
+        config: Configuration dictionary (uses parser.patterns and parser.pattern_timing)
+
+    Returns:
+        DEFAULT_PATTERNS, or a derived registry when overrides or timing are configured
+    """
+    parser_config = config.get('parser', {}) or {}
+    overrides = parser_config.get('patterns') or {}
+
+    registry = DEFAULT_PATTERNS
+    # Skip rebuilding when the config only repeats the defaults
+    changed = {
+        name: source for name, source in overrides.items()
+        if PATTERN_SOURCES.get(name) != source
+    }
+    if changed:
+        registry = registry.with_overrides(changed)
+
+    if parser_config.get('pattern_timing', False):
+        registry = registry.timed()
+
+    return registry
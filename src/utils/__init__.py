@@ -1,16 +1,43 @@
-"""Utility modules for pairing parser."""
-from .logger import get_logger
-from .pdf_reader import StreamingPDFReader, PDFInfo
-from .text_reader import StreamingTextReader, TextFileInfo
-from .file_utils import StreamingJSONWriter, JSONFileWriter, backup_file
+"""Utility modules for pairing parser.
 
-__all__ = [
-    'get_logger',
-    'StreamingPDFReader',
-    'PDFInfo',
-    'StreamingTextReader',
-    'TextFileInfo',
-    'StreamingJSONWriter',
-    'JSONFileWriter',
-    'backup_file'
-]
+Exports are imported on first use, so scripts that need one light module
+(mongodb_import.py reads JSON with json_reader) do not load pdfplumber,
+the serializers or pyarrow.
+"""
+from importlib import import_module
+
+# Exported name -> module defining it
+_EXPORTS = {
+    'get_logger': 'logger',
+    'StreamingPDFReader': 'pdf_reader',
+    'PDFInfo': 'pdf_reader',
+    'PDFTextCache': 'text_cache',
+    'StreamingTextReader': 'text_reader',
+    'MappedDATReader': 'text_reader',
+    'TextFileInfo': 'text_reader',
+    'JSONSerializer': 'json_serializer',
+    'StreamingJSONWriter': 'file_utils',
+    'StreamingJSONReader': 'json_reader',
+    'JSONFileWriter': 'file_utils',
+    'ColumnarWriter': 'columnar_export',
+    'ProcessingManifest': 'manifest',
+    'PairingDiff': 'pairing_diff',
+    'diff_hashes': 'pairing_diff',
+    'diff_outputs': 'pairing_diff',
+    'backup_file': 'file_utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,322 @@
+"""
+Columnar Parquet export of parsed pairings.
+
+Writes three flat tables next to the JSON output path instead of the nested
+document: ``<name>.pairings.parquet``, ``<name>.duty_periods.parquet`` and
+``<name>.legs.parquet``. Rows are linked by the bid period columns (bid
+month, base, fleet) plus pairing_id, duty_period_index and leg_index, times
+are integer minutes and station/equipment columns are dictionary encoded,
+so a month across all bases can be scanned with pyarrow.dataset or pandas
+without walking nested JSON. Each bid period becomes one row group with
+its own dictionaries, so call Table.unify_dictionaries() before grouping a
+multi-file scan on a dictionary column.
+
+Requires pyarrow (optional dependency).
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional
+    pa = None
+    pq = None
+
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAMES = ('pairings', 'duty_periods', 'legs')
+
+
+def _build_schemas() -> Dict[str, 'pa.Schema']:
+    """Arrow schema of each exported table."""
+    category = pa.dictionary(pa.int32(), pa.string())
+    keys = [
+        ('bid_month_year', category),
+        ('base', category),
+        ('fleet', category),
+        ('pairing_id', pa.string()),
+    ]
+    return {
+        'pairings': pa.schema(keys + [
+            ('pairing_category', category),
+            ('is_first_officer', pa.bool_()),
+            ('effective_date', pa.date32()),
+            ('through_date', pa.date32()),
+            ('date_instances', pa.list_(pa.int8())),
+            ('days', pa.int16()),
+            ('duty_period_count', pa.int16()),
+            ('leg_count', pa.int16()),
+            ('credit_minutes', pa.int32()),
+            ('flight_time_minutes', pa.int32()),
+            ('time_away_from_base_minutes', pa.int32()),
+            ('international_flight_time_minutes', pa.int32()),
+            ('min_overnight_minutes', pa.int16()),
+            ('max_overnight_minutes', pa.int16()),
+            ('nte', pa.float64()),
+            ('meal_money', pa.float64()),
+            ('t_c', pa.float64()),
+            ('content_hash', pa.string()),
+        ]),
+        'duty_periods': pa.schema(keys + [
+            ('duty_period_index', pa.int16()),
+            ('origin_station', category),
+            ('layover_station', category),
+            ('report_time_minutes', pa.int16()),
+            ('release_time_minutes', pa.int16()),
+            ('overnight_minutes', pa.int16()),
+            ('leg_count', pa.int16()),
+            ('hotel', category),
+            ('hotel_phone', pa.string()),
+            ('ground_transport', pa.string()),
+        ]),
+        'legs': pa.schema(keys + [
+            ('duty_period_index', pa.int16()),
+            ('leg_index', pa.int16()),
+            ('equipment', category),
+            ('deadhead', pa.bool_()),
+            ('flight_number', pa.string()),
+            ('departure_station', category),
+            ('arrival_station', category),
+            ('departure_time_minutes', pa.int16()),
+            ('arrival_time_minutes', pa.int16()),
+            ('ground_time_minutes', pa.int32()),
+            ('flight_time_minutes', pa.int32()),
+            ('accumulated_flight_time_minutes', pa.int32()),
+            ('duty_time_minutes', pa.int32()),
+            ('d_c_minutes', pa.int32()),
+            ('meal_code', category),
+        ]),
+    }
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ColumnarWriter:
+    """
+    Write pairings as pairings/duty_periods/legs Parquet tables.
+
+    Has the same interface as StreamingJSONWriter, so process_single_file
+    can feed it pairings as they are finalized. Column values are buffered
+    for the open bid period only (bid period fields are known at its end)
+    and flushed as one row group per table when it closes.
+    """
+
+    def __init__(self, output_path: str, compression: str = 'zstd'):
+        """
+        Initialize columnar writer.
+
+        Args:
+            output_path: Output path of the JSON this replaces; tables are
+                written as <stem>.<table>.parquet in the same directory
+            compression: Parquet compression codec
+        """
+        if pa is None:
+            raise ImportError(
+                "Parquet output requires pyarrow. Install with: pip install pyarrow"
+            )
+
+        output_path = Path(output_path)
+        self.output_paths = {
+            name: output_path.with_name(f"{output_path.stem}.{name}.parquet")
+            for name in TABLE_NAMES
+        }
+        self.compression = compression
+        self.schemas = _build_schemas()
+        self.logger = logging.getLogger(__name__)
+        self.writers: Dict[str, 'pq.ParquetWriter'] = {}
+        self.columns: Dict[str, Dict[str, List[Any]]] = {}
+        self.metadata: dict = {}
+        self.items_written = 0
+        self.pairings_written = 0
+        self.bytes_written = 0
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _tmp_path(self, name: str) -> Path:
+        path = self.output_paths[name]
+        return path.with_name(f"{path.name}.tmp")
+
+    def _reset_columns(self):
+        self.columns = {
+            name: {field: [] for field in schema.names}
+            for name, schema in self.schemas.items()
+        }
+
+    def __enter__(self):
+        """Context manager entry: open one Parquet writer per table."""
+        self.writers = {
+            name: pq.ParquetWriter(
+                self._tmp_path(name), self.schemas[name], compression=self.compression
+            )
+            for name in TABLE_NAMES
+        }
+        self._reset_columns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit: finish and move tables into place, or discard on error."""
+        if not self.writers:
+            return
+
+        if exc_type is None and self.columns['pairings']['pairing_id']:
+            # Pairings with no closing bid period line
+            self.end_bid_period({})
+
+        for writer in self.writers.values():
+            if exc_type is None:
+                writer.add_key_value_metadata({'pairing_parser': json.dumps(self.metadata)})
+            writer.close()
+        self.writers = {}
+
+        for name in TABLE_NAMES:
+            tmp_path = self._tmp_path(name)
+            if exc_type is not None:
+                tmp_path.unlink(missing_ok=True)
+                continue
+            os.replace(tmp_path, self.output_paths[name])
+            self.bytes_written += self.output_paths[name].stat().st_size
+
+        if exc_type is None:
+            self.logger.info(
+                f"Successfully wrote {', '.join(path.name for path in self.output_paths.values())}"
+            )
+
+    def start_bid_period(self, header: Any):
+        """
+        Open a bid period (its key columns are filled in when it closes).
+
+        Args:
+            header: BidPeriod model or dict of its fields
+        """
+
+    def write_pairing(self, pairing: Any):
+        """
+        Add one pairing, its duty periods and legs to the open bid period.
+
+        Args:
+            pairing: Pairing model
+        """
+        pairings = self.columns['pairings']
+        duty_periods = self.columns['duty_periods']
+        legs = self.columns['legs']
+        pairing_id = pairing.id
+
+        leg_count = 0
+        for dp_index, duty_period in enumerate(pairing.duty_periods):
+            for leg_index, leg in enumerate(duty_period.legs):
+                legs['pairing_id'].append(pairing_id)
+                legs['duty_period_index'].append(dp_index)
+                legs['leg_index'].append(leg_index)
+                legs['equipment'].append(leg.equipment)
+                legs['deadhead'].append(leg.deadhead)
+                legs['flight_number'].append(leg.flight_number)
+                legs['departure_station'].append(leg.departure_station)
+                legs['arrival_station'].append(leg.arrival_station)
+                legs['departure_time_minutes'].append(leg.departure_time_minutes)
+                legs['arrival_time_minutes'].append(leg.arrival_time_minutes)
+                legs['ground_time_minutes'].append(leg.ground_time_minutes)
+                legs['flight_time_minutes'].append(leg.flight_time_minutes)
+                legs['accumulated_flight_time_minutes'].append(leg.accumulated_flight_time_minutes)
+                legs['duty_time_minutes'].append(leg.duty_time_minutes)
+                legs['d_c_minutes'].append(leg.d_c_minutes)
+                legs['meal_code'].append(leg.meal_code)
+
+            duty_periods['pairing_id'].append(pairing_id)
+            duty_periods['duty_period_index'].append(dp_index)
+            duty_periods['origin_station'].append(duty_period.origin_station)
+            duty_periods['layover_station'].append(duty_period.layover_station)
+            duty_periods['report_time_minutes'].append(duty_period.report_time_minutes)
+            duty_periods['release_time_minutes'].append(duty_period.release_time_minutes)
+            duty_periods['overnight_minutes'].append(duty_period.overnight_minutes)
+            duty_periods['leg_count'].append(len(duty_period.legs))
+            duty_periods['hotel'].append(duty_period.hotel)
+            duty_periods['hotel_phone'].append(duty_period.hotel_phone)
+            duty_periods['ground_transport'].append(duty_period.ground_transport)
+            leg_count += len(duty_period.legs)
+
+        pairings['pairing_id'].append(pairing_id)
+        pairings['pairing_category'].append(pairing.pairing_category)
+        pairings['is_first_officer'].append(pairing.is_first_officer)
+        pairings['effective_date'].append(pairing.effective_date_iso)
+        pairings['through_date'].append(pairing.through_date_iso)
+        pairings['date_instances'].append([_to_int(day) for day in pairing.date_instances])
+        pairings['days'].append(_to_int(pairing.days))
+        pairings['duty_period_count'].append(len(pairing.duty_periods))
+        pairings['leg_count'].append(leg_count)
+        pairings['credit_minutes'].append(pairing.credit_minutes)
+        pairings['flight_time_minutes'].append(pairing.flight_time_minutes)
+        pairings['time_away_from_base_minutes'].append(pairing.time_away_from_base_minutes)
+        pairings['international_flight_time_minutes'].append(
+            pairing.international_flight_time_minutes
+        )
+        pairings['min_overnight_minutes'].append(pairing.min_overnight_minutes)
+        pairings['max_overnight_minutes'].append(pairing.max_overnight_minutes)
+        pairings['nte'].append(_to_float(pairing.nte))
+        pairings['meal_money'].append(_to_float(pairing.meal_money))
+        pairings['t_c'].append(_to_float(pairing.t_c))
+        pairings['content_hash'].append(pairing.content_hash)
+
+        self.pairings_written += 1
+
+    def end_bid_period(self, header: Any):
+        """
+        Close the open bid period and write its rows as one row group per table.
+
+        Args:
+            header: BidPeriod model or dict of its fields
+        """
+        if not isinstance(header, dict):
+            header = {
+                'bid_month_year': header.bid_month_year,
+                'base': header.base,
+                'fleet': header.fleet,
+            }
+
+        for name, columns in self.columns.items():
+            rows = len(columns['pairing_id'])
+            if not rows:
+                continue
+            for key in ('bid_month_year', 'base', 'fleet'):
+                columns[key] = [header.get(key)] * rows
+
+            schema = self.schemas[name]
+            arrays = [
+                self._to_array(columns[field.name], field.type) for field in schema
+            ]
+            self.writers[name].write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        self._reset_columns()
+        self.items_written += 1
+
+    @staticmethod
+    def _to_array(values: List[Any], arrow_type: 'pa.DataType') -> 'pa.Array':
+        if arrow_type == pa.date32():
+            # ISO strings -> dates
+            return pa.array(values, type=pa.string()).cast(arrow_type)
+        return pa.array(values, type=arrow_type)
+
+    def write_metadata(self, metadata: dict):
+        """
+        Set the file metadata (stored as Parquet key-value metadata on close).
+
+        Args:
+            metadata: Metadata dictionary
+        """
+        self.metadata = metadata
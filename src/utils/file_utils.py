@@ -2,104 +2,269 @@
 File I/O utilities for JSON output.
 """
 import json
+import os
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO, Optional
 from datetime import datetime
 import logging
 
+from .json_serializer import JSONSerializer
+from ..models import BidPeriod
+
+
+# BidPeriod fields that precede its pairings; start_bid_period() writes them
+# ahead of the pairings, so streamed output has the buffered key order
+_BID_PERIOD_FIELDS = list(BidPeriod.model_fields)
+BID_PERIOD_LEAD_FIELDS = tuple(_BID_PERIOD_FIELDS[:_BID_PERIOD_FIELDS.index('pairings')])
+
 
 class StreamingJSONWriter:
-    """Write JSON data incrementally to avoid memory issues."""
+    """
+    Write MasterData-shaped JSON incrementally, one pairing at a time.
 
-    def __init__(self, output_path: str, indent: int = 2):
+    Output goes to a temporary file next to output_path that replaces it
+    only when the writer exits cleanly, so a failed parse never leaves a
+    truncated file (or loses the previous output). A bid period opened with
+    start_bid_period() begins with its key fields (month, fleet, base and
+    dates), so readers know which bid period the pairings belong to; the
+    rest of the header is written when the bid period closes, since totals
+    lines only appear at its end.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        indent: int = 2,
+        create_backup: bool = True,
+        serializer: Optional[JSONSerializer] = None
+    ):
         """
         Initialize streaming JSON writer.
 
         Args:
             output_path: Path to output JSON file
-            indent: JSON indentation spaces
+            indent: JSON indentation spaces (ignored when serializer is given)
+            create_backup: Whether to backup an existing output file
+            serializer: Serializer for items (default: pydantic-core with indent)
         """
         self.output_path = Path(output_path)
-        self.indent = indent
+        self.serializer = serializer or JSONSerializer(indent=indent)
+        self.indent = self.serializer.indent
+        self.create_backup = create_backup
         self.logger = logging.getLogger(__name__)
-        self.file_handle: TextIO = None
+        self.file_handle: BinaryIO = None
+        self.tmp_path = self.output_path.with_name(f"{self.output_path.name}.tmp")
         self.first_item = True
+        self.first_pairing = True
+        self.in_bid_period = False
+        self.lead_fields: tuple = ()
+        self.metadata: dict = {}
+        self.items_written = 0
+        self.pairings_written = 0
+        self.bytes_written = 0
 
         # Create output directory if it doesn't exist
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
     def __enter__(self):
         """Context manager entry."""
-        self.file_handle = open(self.output_path, 'w', encoding='utf-8')
-        self.file_handle.write('{\n')
-        self.file_handle.write(f'{" " * self.indent}"data": [\n')
+        self.file_handle = open(self.tmp_path, 'wb')
+        self._write(b'{' + self._newline(1) + b'"data": [')
         self.first_item = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        if self.file_handle:
-            self.file_handle.write('\n' + ' ' * self.indent + '],\n')
-            self.file_handle.write(f'{" " * self.indent}"metadata": {{}}\n')
-            self.file_handle.write('}\n')
+        """Context manager exit: finish and move into place, or discard on error."""
+        if not self.file_handle:
+            return
+
+        if exc_type is not None:
             self.file_handle.close()
+            self.file_handle = None
+            self.tmp_path.unlink(missing_ok=True)
+            return
+
+        if self.in_bid_period:
+            self.end_bid_period({})
+        self._write(
+            (b'' if self.first_item else self._newline(1)) + b'],' + self._newline(1)
+            + b'"metadata": ' + self._dumps(self.metadata, 1) + self._newline(0) + b'}\n'
+        )
+        self.file_handle.close()
+        self.file_handle = None
+
+        if self.create_backup and self.output_path.exists():
+            backup_path = self.output_path.with_suffix(
+                f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            )
+            self.logger.info(f"Creating backup: {backup_path.name}")
+            self.output_path.rename(backup_path)
+
+        os.replace(self.tmp_path, self.output_path)
+        self.logger.info(f"Successfully wrote output to {self.output_path}")
+
+    def _write(self, data: bytes):
+        self.file_handle.write(data)
+        self.bytes_written += len(data)
+
+    def _newline(self, level: int) -> bytes:
+        """Line break and indentation for a nesting level (empty when compact)."""
+        return b'\n' + b' ' * (self.indent * level) if self.indent else b''
+
+    def _dumps(self, value: Any, level: int, exclude: Optional[set] = None) -> bytes:
+        """Serialize a value to start at the given nesting level."""
+        data = self.serializer.dumps(value, exclude=exclude)
+        if self.indent:
+            # JSON strings never contain raw newlines, so this only re-indents
+            data = data.replace(b'\n', self._newline(level))
+        return data
+
+    def _require_open(self):
+        if not self.file_handle:
+            raise RuntimeError("Writer not opened. Use as context manager.")
+
+    def _start_item(self):
+        """Separator before the next element of the data array."""
+        self._write((b',' if not self.first_item else b'') + self._newline(2))
+        self.first_item = False
+
+    @staticmethod
+    def _lead_fields(header: Any) -> dict:
+        """The BID_PERIOD_LEAD_FIELDS of a bid period model, record or dict."""
+        if isinstance(header, dict):
+            return {k: header[k] for k in BID_PERIOD_LEAD_FIELDS if k in header}
+        return {k: getattr(header, k) for k in BID_PERIOD_LEAD_FIELDS}
+
+    def _start_bid_period(self, lead: Optional[dict] = None):
+        self._start_item()
+        if lead:
+            # The lead object's members, then the pairings array after them
+            members = self._dumps(lead, 2).rstrip()[1:-1].rstrip()
+            self._write(b'{' + members + b',' + self._newline(3) + b'"pairings": [')
+        else:
+            self._write(b'{' + self._newline(3) + b'"pairings": [')
+        self.in_bid_period = True
+        self.first_pairing = True
+        self.lead_fields = tuple(lead or ())
+
+    def start_bid_period(self, header: Any):
+        """
+        Open a bid period, writing its key fields ahead of its pairings.
+
+        Optional: write_pairing() opens a bid period without them, and all
+        header fields are then written after the pairings.
+
+        Args:
+            header: BidPeriod model or record (or dict) with its key fields set
+        """
+        self._require_open()
+        if self.in_bid_period:
+            raise RuntimeError("Bid period already open")
+
+        self._start_bid_period(self._lead_fields(header))
 
     def write_item(self, item: Any):
         """
-        Write a single item to the JSON array.
+        Write a single complete item to the data array.
 
         Args:
-            item: Item to write (should be JSON-serializable)
+            item: Item to write (model or JSON-serializable value)
         """
-        if not self.file_handle:
-            raise RuntimeError("Writer not opened. Use as context manager.")
+        self._require_open()
+        if self.in_bid_period:
+            raise RuntimeError("Cannot write an item inside an open bid period")
+
+        self._start_item()
+        self._write(self._dumps(item, 2))
+        self.items_written += 1
+
+    def write_pairing(self, pairing: Any):
+        """
+        Write one pairing of the current bid period and flush it.
 
-        if not self.first_item:
-            self.file_handle.write(',\n')
+        Args:
+            pairing: Pairing model (or its model_dump() dict)
+        """
+        self._require_open()
 
-        # Serialize the item
-        item_json = json.dumps(item, indent=self.indent)
+        if not self.in_bid_period:
+            self._start_bid_period()
 
-        # Indent each line
-        indented_lines = []
-        for line in item_json.split('\n'):
-            indented_lines.append(' ' * (self.indent * 2) + line)
+        self._write(
+            (b',' if not self.first_pairing else b'') + self._newline(4) + self._dumps(pairing, 4)
+        )
+        self.file_handle.flush()
+        self.first_pairing = False
+        self.pairings_written += 1
 
-        self.file_handle.write('\n'.join(indented_lines))
-        self.first_item = False
+    def end_bid_period(self, header: Any):
+        """
+        Close the current bid period with its header fields.
+
+        Args:
+            header: BidPeriod model (its pairings are not written) or a dict of
+                bid period fields other than pairings
+        """
+        self._require_open()
+
+        if not self.in_bid_period:
+            # Bid period without pairings
+            self._start_bid_period(self._lead_fields(header))
+
+        exclude = {'pairings', *self.lead_fields}
+        if isinstance(header, dict):
+            fields = self._dumps({k: v for k, v in header.items() if k not in exclude}, 2)
+        else:
+            fields = self._dumps(header, 2, exclude=exclude)
+
+        self._write((b'' if self.first_pairing else self._newline(3)) + b']')
+        if fields.rstrip(b'} \n') == b'{':
+            # No header fields left
+            self._write(self._newline(2) + b'}')
+        else:
+            # Splice the header object's members in after the pairings array
+            self._write(b',' + fields[1:])
+        self.file_handle.flush()
+        self.in_bid_period = False
+        self.items_written += 1
 
     def write_metadata(self, metadata: dict):
         """
-        Write metadata section (call before closing).
+        Set the metadata section (written when the writer closes).
 
         Args:
             metadata: Metadata dictionary
         """
-        # This will be called at the end to update metadata
-        pass  # Metadata written in __exit__ for now
+        self.metadata = metadata
 
 
 class JSONFileWriter:
     """Standard JSON file writer with backup support."""
 
-    def __init__(self, create_backup: bool = True):
+    def __init__(self, create_backup: bool = True, serializer: Optional[JSONSerializer] = None):
         """
         Initialize JSON file writer.
 
         Args:
             create_backup: Whether to backup existing files
+            serializer: Serializer producing the file bytes (default: stdlib
+                json.dump with the indent passed to write())
         """
         self.create_backup = create_backup
+        self.serializer = serializer
         self.logger = logging.getLogger(__name__)
 
-    def write(self, data: Any, output_path: str, indent: int = 2):
+    def write(self, data: Any, output_path: str, indent: int = 2) -> int:
         """
         Write data to JSON file.
 
         Args:
-            data: Data to write
+            data: Data to write (a pydantic model needs a serializer)
             output_path: Output file path
-            indent: JSON indentation
+            indent: JSON indentation (ignored when a serializer is set)
+
+        Returns:
+            Size of the written file in bytes
         """
         output_path = Path(output_path)
 
@@ -115,13 +280,19 @@ class JSONFileWriter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            if self.serializer:
+                with open(output_path, 'wb') as f:
+                    f.write(self.serializer.dumps(data))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=False)
             self.logger.info(f"Successfully wrote output to {output_path}")
         except Exception as e:
             self.logger.error(f"Error writing JSON file: {e}")
             raise
 
+        return output_path.stat().st_size
+
 
 def backup_file(file_path: str) -> Path:
     """
@@ -0,0 +1,164 @@
+"""
+Incremental reader for parsed JSON output.
+
+Walks the MasterData layout ({"data": [bid periods], "metadata": {...}})
+and hands out one pairing at a time, decoding each with the stdlib JSON
+scanner from a sliding buffer, so memory stays at about one read chunk
+whatever the file size. Bid period members before the pairings array
+(month, fleet, base and dates in buffered output, and in streamed output
+since StreamingJSONWriter.start_bid_period) are reported when the array
+starts; all of them are reported again when the bid period closes.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+
+# Event types yielded by StreamingJSONReader.events()
+BID_PERIOD_START = 'bid_period_start'
+PAIRING = 'pairing'
+BID_PERIOD_END = 'bid_period_end'
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class StreamingJSONReader:
+    """Read a parser JSON output one pairing at a time."""
+
+    def __init__(self, input_path: Path, chunk_size: int = READ_CHUNK_SIZE):
+        """
+        Initialize reader.
+
+        Args:
+            input_path: Parser JSON output
+            chunk_size: Characters read from the file at a time
+        """
+        self.input_path = Path(input_path)
+        self.chunk_size = chunk_size
+        self.metadata: Dict[str, Any] = {}
+        self.file_handle = None
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def __enter__(self):
+        self.file_handle = open(self.input_path, 'r', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.file_handle:
+            self.file_handle.close()
+            self.file_handle = None
+
+    def events(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Walk the file.
+
+        Yields:
+            (BID_PERIOD_START, header members seen so far),
+            (PAIRING, pairing dict) for each pairing and
+            (BID_PERIOD_END, all header members) per bid period; metadata is
+            available once the walk is done
+        """
+        self._expect('{')
+        for key in self._members():
+            if key == 'data':
+                self._expect('[')
+                for _ in self._elements():
+                    yield from self._bid_period()
+            elif key == 'metadata':
+                self.metadata = self._value()
+            else:
+                self._value()
+
+    def _bid_period(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        header = {}
+        self._expect('{')
+        for key in self._members():
+            if key == 'pairings':
+                yield BID_PERIOD_START, dict(header)
+                self._expect('[')
+                for _ in self._elements():
+                    yield PAIRING, self._value()
+            else:
+                header[key] = self._value()
+        yield BID_PERIOD_END, header
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what was already consumed."""
+        chunk = self.file_handle.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character (not consumed)."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                raise ValueError(f"{self.input_path}: unexpected end of JSON")
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"{self.input_path}: expected '{char}', found '{found}'")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof or not self._fill():
+                    raise
+                continue
+            # A value ending at the buffer end may be a truncated number
+            if end < len(self._buffer) or self._eof or not self._fill():
+                self._pos = end
+                return value
+            # Otherwise decode again with the next chunk appended
+
+    def _separator(self, closing: str) -> bool:
+        """Consume ',' or the closing bracket; True if more items follow."""
+        char = self._peek()
+        self._pos += 1
+        if char == ',':
+            return True
+        if char != closing:
+            raise ValueError(f"{self.input_path}: expected ',' or '{closing}', found '{char}'")
+        return False
+
+    def _members(self) -> Iterator[str]:
+        """Keys of the open object; the caller consumes each value."""
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            if not self._separator('}'):
+                return
+
+    def _elements(self) -> Iterator[None]:
+        """One step per element of the open array; the caller consumes each."""
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if not self._separator(']'):
+                return
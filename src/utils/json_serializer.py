@@ -0,0 +1,128 @@
+"""
+JSON serialization straight from pydantic models to bytes.
+
+The stdlib path (model_dump() to dicts, then json.dump) builds a full dict
+copy of the output and then walks it again in pure Python. pydantic-core
+serializes models (computed fields included) to UTF-8 bytes in one Rust
+pass. orjson is supported as an alternative engine when installed; it
+still needs model_dump() first, so pydantic is the default.
+
+Parse-phase records (src/models/records.py) are serialized by pydantic-core
+directly, with the same output as their models.
+"""
+import dataclasses
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
+
+from ..models.records import RECORD_ADAPTERS
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ('pydantic', 'orjson', 'json')
+STYLES = ('pretty', 'compact')
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(cls: type) -> TypeAdapter:
+    """Cached TypeAdapter for a dataclass (building one compiles a schema)."""
+    return RECORD_ADAPTERS.get(cls) or TypeAdapter(cls)
+
+
+class JSONSerializer:
+    """Serialize models and plain values to JSON bytes."""
+
+    def __init__(self, engine: str = 'pydantic', indent: Optional[int] = 2):
+        """
+        Initialize serializer.
+
+        Args:
+            engine: 'pydantic' (pydantic-core), 'orjson' or 'json' (stdlib)
+            indent: Indentation spaces for pretty output; None or 0 for compact
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown JSON engine '{engine}' (expected one of {', '.join(ENGINES)})")
+        if engine == 'orjson' and orjson is None:
+            logger.warning("orjson is not installed; using pydantic-core for JSON output")
+            engine = 'pydantic'
+        if engine == 'orjson' and indent and indent != 2:
+            logger.warning(f"orjson only indents by 2 spaces (output.indent is {indent})")
+            indent = 2
+
+        self.engine = engine
+        self.indent = indent or None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'JSONSerializer':
+        """
+        Build the serializer from the ``output`` configuration section.
+
+        Args:
+            config: Configuration dictionary (uses output.serializer, output.style
+                and output.indent)
+
+        Returns:
+            JSONSerializer
+        """
+        output_config = config.get('output', {}) or {}
+        style = output_config.get('style', 'pretty')
+        if style not in STYLES:
+            logger.warning(f"Unknown output style '{style}', using pretty")
+            style = 'pretty'
+
+        return cls(
+            engine=output_config.get('serializer', 'pydantic'),
+            indent=output_config.get('indent', 2) if style == 'pretty' else None
+        )
+
+    @property
+    def style(self) -> str:
+        """'pretty' or 'compact'."""
+        return 'pretty' if self.indent else 'compact'
+
+    def dumps(self, value: Any, exclude: Optional[set] = None) -> bytes:
+        """
+        Serialize a value to UTF-8 JSON bytes (non-ASCII is not escaped).
+
+        Args:
+            value: Pydantic model, parse-phase record or JSON-compatible value
+            exclude: Model fields to leave out (models and records only)
+
+        Returns:
+            JSON bytes
+        """
+        is_record = dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+        if self.engine == 'pydantic':
+            if isinstance(value, BaseModel):
+                return type(value).__pydantic_serializer__.to_json(
+                    value, indent=self.indent, exclude=exclude
+                )
+            if is_record:
+                return _type_adapter(type(value)).dump_json(
+                    value, indent=self.indent, exclude=exclude
+                )
+            return pydantic_core.to_json(value, indent=self.indent)
+
+        if is_record:
+            value = value.to_model()
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude=exclude)
+
+        if self.engine == 'orjson':
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if self.indent else 0)
+
+        separators = None if self.indent else (',', ':')
+        return json.dumps(
+            value, indent=self.indent, ensure_ascii=False, separators=separators
+        ).encode('utf-8')
@@ -0,0 +1,246 @@
+"""
+Manifest of processed input files for incremental batch runs.
+
+For each input file the manifest records the SHA-256 of its contents, the
+parser version and config hash it was parsed with, the output files that
+were written and where it was imported. An input whose hash, parser version
+and config hash all match, and whose output files are still in place, does
+not need parsing again, and its import is skipped when it already went
+to the same database. The file hash is only recomputed when the input's
+size or modification time changed.
+
+The parser version is a fingerprint of the parser source (src/**/*.py), so
+any code change re-parses everything without a version to bump by hand.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+MANIFEST_VERSION = 1
+
+# Config sections that change the parsed output
+CONFIG_SECTIONS = ('parser', 'output', 'validation')
+
+SOURCE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def file_sha256(file_path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_parser_version() -> str:
+    """
+    Fingerprint of the parser source code.
+
+    Returns:
+        Short hex digest over the paths and contents of src/**/*.py
+    """
+    digest = hashlib.sha256()
+    for path in sorted(SOURCE_ROOT.rglob('*.py')):
+        digest.update(path.relative_to(SOURCE_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_config_hash(config: Dict[str, Any]) -> str:
+    """
+    Hash the configuration sections that affect parsed output.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Short hex digest of the parser, output and validation sections
+    """
+    relevant = {section: config.get(section) for section in CONFIG_SECTIONS}
+    encoded = json.dumps(relevant, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class ProcessingManifest:
+    """Per-input record of parse and import results, stored as one JSON file."""
+
+    def __init__(self, path: Path, parser_version: str, config_hash: str):
+        """
+        Initialize manifest and load existing entries.
+
+        Args:
+            path: Manifest JSON file
+            parser_version: Current parser version (see get_parser_version())
+            config_hash: Current config hash (see get_config_hash())
+        """
+        self.path = Path(path)
+        self.parser_version = parser_version
+        self.config_hash = config_hash
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}
+        # The pipelined batch records imports from its import thread
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load entries from disk (a missing or unreadable manifest starts empty)."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return
+
+        if data.get('version') != MANIFEST_VERSION:
+            logger.info(f"Ignoring manifest {self.path} from another manifest version")
+            return
+        self.entries = data.get('files', {})
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f'.tmp{os.getpid()}')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _key(input_file: Path) -> str:
+        return str(Path(input_file).resolve())
+
+    def input_hash(self, input_file: Path) -> str:
+        """
+        Get the content hash of an input file.
+
+        The hash recorded in the manifest is reused when the file's size and
+        modification time are unchanged.
+
+        Args:
+            input_file: Input pairing file
+
+        Returns:
+            Hex SHA-256 of the file contents
+        """
+        key = self._key(input_file)
+        if key in self._hashes:
+            return self._hashes[key]
+
+        stat = Path(input_file).stat()
+        entry = self.entries.get(key, {})
+        if (entry.get('input_size') == stat.st_size
+                and entry.get('input_mtime_ns') == stat.st_mtime_ns
+                and entry.get('input_sha256')):
+            digest = entry['input_sha256']
+        else:
+            digest = file_sha256(input_file)
+            if digest == entry.get('input_sha256'):
+                # Touched but unchanged: remember the new stat (saved with the next record)
+                entry['input_size'] = stat.st_size
+                entry['input_mtime_ns'] = stat.st_mtime_ns
+        self._hashes[key] = digest
+        return digest
+
+    def is_parsed(self, input_file: Path, output_file: Path) -> bool:
+        """
+        Check whether an input was already parsed to output_file by this parser and config.
+
+        Args:
+            input_file: Input pairing file
+            output_file: Output path it would be written to
+
+        Returns:
+            True if parsing can be skipped
+        """
+        entry = self.entries.get(self._key(input_file))
+        if not entry:
+            return False
+
+        if (entry.get('parser_version') != self.parser_version
+                or entry.get('config_hash') != self.config_hash
+                or entry.get('output') != str(output_file)):
+            return False
+
+        for artifact, size in entry.get('artifacts', {}).items():
+            try:
+                if Path(artifact).stat().st_size != size:
+                    return False
+            except OSError:
+                return False
+
+        return entry.get('input_sha256') == self.input_hash(input_file)
+
+    def record_parse(
+        self,
+        input_file: Path,
+        output_file: Path,
+        artifacts: Optional[List[Path]] = None
+    ):
+        """
+        Record a successful parse (clears any earlier import record).
+
+        Args:
+            input_file: Input pairing file
+            output_file: Output path the input was parsed to
+            artifacts: Files actually written (default: output_file); all
+                must still be in place with the same size to skip a re-parse
+        """
+        stat = Path(input_file).stat()
+        entry = {
+            'input_sha256': self.input_hash(input_file),
+            'input_size': stat.st_size,
+            'input_mtime_ns': stat.st_mtime_ns,
+            'parser_version': self.parser_version,
+            'config_hash': self.config_hash,
+            'output': str(output_file),
+            'artifacts': {
+                str(path): Path(path).stat().st_size for path in (artifacts or [output_file])
+            },
+            'parsed_at': datetime.now().isoformat(timespec='seconds'),
+            'imported_to': None,
+        }
+        with self._lock:
+            self.entries[self._key(input_file)] = entry
+            self.save()
+
+    def is_imported(self, input_file: Path, target: str) -> bool:
+        """
+        Check whether the current output of an input was imported into target.
+
+        Args:
+            input_file: Input pairing file
+            target: Import target id (see BatchPipeline)
+
+        Returns:
+            True if importing can be skipped
+        """
+        entry = self.entries.get(self._key(input_file))
+        return bool(entry) and entry.get('imported_to') == target
+
+    def record_import(self, input_file: Path, target: str):
+        """
+        Record a successful import of an input's current output.
+
+        Args:
+            input_file: Input pairing file
+            target: Import target id
+        """
+        with self._lock:
+            entry = self.entries.get(self._key(input_file))
+            if entry is None:
+                return
+            entry['imported_to'] = target
+            entry['imported_at'] = datetime.now().isoformat(timespec='seconds')
+            self.save()
@@ -0,0 +1,145 @@
+"""
+Pairing-level diff between two revisions of parsed bid periods.
+
+Pairings are matched by bid period (bid month, fleet, base) plus pairing id
+and effective date, and compared by content hash (see
+src/models/content_hash.py). A reissued DSL file can then be applied as the
+added, removed and changed pairings instead of a full reload.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .json_reader import StreamingJSONReader, PAIRING, BID_PERIOD_END
+
+
+BidPeriodKey = Tuple[Optional[str], Optional[str], Optional[str]]
+PairingKey = Tuple[Optional[str], Optional[str]]
+
+
+def bid_period_key(bid_period: Dict[str, Any]) -> BidPeriodKey:
+    """(bid_month_year, fleet, base) of a bid period dictionary."""
+    return bid_period.get('bid_month_year'), bid_period.get('fleet'), bid_period.get('base')
+
+
+def pairing_key(pairing: Dict[str, Any]) -> PairingKey:
+    """(id, effective_date) of a pairing dictionary, unique within a bid period."""
+    return pairing.get('id'), pairing.get('effective_date')
+
+
+def pairing_key_conditions(
+    keys: List[PairingKey], id_field: str = 'id', date_field: str = 'effective_date'
+) -> List[Dict[str, Any]]:
+    """
+    MongoDB $or conditions matching documents by pairing key.
+
+    Pairing ids repeat within a bid period (one pairing per effective date),
+    so documents are matched on both parts of the key.
+
+    Args:
+        keys: (id, effective_date) pairing keys
+        id_field: Field holding the pairing id ('pairing_id' on legs)
+        date_field: Field holding the effective date ('pairing_effective_date' on legs)
+
+    Returns:
+        List of {id_field: id, date_field: effective_date} conditions
+    """
+    return [{id_field: pairing_id, date_field: effective_date} for pairing_id, effective_date in keys]
+
+
+def pairing_hash(pairing: Dict[str, Any]) -> str:
+    """Stored content hash of a pairing dictionary, computed if it has none."""
+    if pairing.get('content_hash'):
+        return pairing['content_hash']
+    # Only files parsed before hashes were added need the models (pydantic)
+    from ..models.content_hash import pairing_dict_content_hash
+    return pairing_dict_content_hash(pairing)
+
+
+@dataclass
+class PairingDiff:
+    """Keys of pairings added, removed and changed between two revisions."""
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    changed: List[Any] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.changed)} changed, {self.unchanged} unchanged")
+
+
+def diff_hashes(old: Dict[Any, Optional[str]], new: Dict[Any, Optional[str]]) -> PairingDiff:
+    """
+    Diff two revisions given as key -> content hash.
+
+    A missing (None) old hash always counts as changed.
+
+    Args:
+        old: Hashes of the previous revision
+        new: Hashes of the new revision
+
+    Returns:
+        PairingDiff with keys sorted
+    """
+    diff = PairingDiff()
+    for key, digest in new.items():
+        if key not in old:
+            diff.added.append(key)
+        elif old[key] is None or old[key] != digest:
+            diff.changed.append(key)
+        else:
+            diff.unchanged += 1
+    diff.removed = [key for key in old if key not in new]
+
+    sort_key = lambda key: tuple(str(part) for part in key)
+    diff.added.sort(key=sort_key)
+    diff.removed.sort(key=sort_key)
+    diff.changed.sort(key=sort_key)
+    return diff
+
+
+def load_output_hashes(json_file: Path) -> Dict[Tuple[BidPeriodKey, PairingKey], str]:
+    """
+    Content hashes of every pairing in a parsed JSON output file.
+
+    The file is read one pairing at a time. Files written before content
+    hashes were added are hashed on load.
+
+    Args:
+        json_file: Parser JSON output
+
+    Returns:
+        Dictionary of (bid period key, pairing key) -> content hash
+    """
+    hashes = {}
+    pending = []
+    with StreamingJSONReader(json_file) as reader:
+        for event, value in reader.events():
+            if event == PAIRING:
+                pending.append((pairing_key(value), pairing_hash(value)))
+            elif event == BID_PERIOD_END:
+                # The bid period key is complete once its header is read
+                period = bid_period_key(value)
+                for key, digest in pending:
+                    hashes[(period, key)] = digest
+                pending = []
+    return hashes
+
+
+def diff_outputs(old_file: Path, new_file: Path) -> PairingDiff:
+    """
+    Diff the pairings of two parsed JSON output files.
+
+    Args:
+        old_file: Output of the previous revision
+        new_file: Output of the new revision
+
+    Returns:
+        PairingDiff keyed by (bid period key, pairing key)
+    """
+    return diff_hashes(load_output_hashes(old_file), load_output_hashes(new_file))
@@ -1,37 +1,219 @@
 """
 PDF reading utilities with streaming and chunking support.
 """
+import io
 import pdfplumber
-from typing import Generator, List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Generator, List, Optional, Tuple
 from pathlib import Path
 import logging
 
+from .text_cache import PDFTextCache
+
+
+logger = logging.getLogger(__name__)
+
+
+def _extract_pages(pdf, start_idx: int, end_idx: int) -> List[Optional[List[str]]]:
+    """
+    Extract text lines from a range of pages of an open PDF.
+
+    Args:
+        pdf: Open pdfplumber PDF
+        start_idx: First page index (0-based)
+        end_idx: Page index to stop before
+
+    Returns:
+        Text lines per page, in page order (None for a page that failed)
+    """
+    pages = []
+
+    for page_num in range(start_idx, end_idx):
+        try:
+            page = pdf.pages[page_num]
+            text = page.extract_text() or ""
+            pages.append(text.splitlines())
+            # Drop parsed layout objects; pages are never revisited
+            page.close()
+        except Exception as e:
+            logger.warning(f"Error extracting text from page {page_num + 1}: {e}")
+            pages.append(None)
+
+    return pages
+
+
+def _extract_page_range(file_path: str, start_idx: int, end_idx: int) -> List[Optional[List[str]]]:
+    """Worker process entry point: open the PDF and extract one page range."""
+    with pdfplumber.open(file_path) as pdf:
+        return _extract_pages(pdf, start_idx, end_idx)
+
+
+def _join_pages(pages: List[Optional[List[str]]]) -> List[str]:
+    """Concatenate per-page lines, skipping pages that failed to extract."""
+    lines = []
+    for page_lines in pages:
+        if page_lines:
+            lines.extend(page_lines)
+    return lines
+
 
 class StreamingPDFReader:
     """Read PDF files in chunks to manage memory efficiently."""
 
-    def __init__(self, file_path: str, chunk_size: int = 10):
+    progress_unit = 'page'
+
+    def __init__(
+        self,
+        file_path: str,
+        chunk_size: int = 10,
+        workers: int = 1,
+        cache: Optional[PDFTextCache] = None
+    ):
         """
         Initialize PDF reader.
 
         Args:
             file_path: Path to PDF file
             chunk_size: Number of pages to process at once
+            workers: Processes extracting page chunks in parallel (1 = in-process)
+            cache: Extracted text cache (None to always extract)
         """
         self.file_path = Path(file_path)
         self.chunk_size = chunk_size
-        self.logger = logging.getLogger(__name__)
+        self.workers = max(1, workers)
+        self.cache = cache
+        self.logger = logger
 
         if not self.file_path.exists():
             raise FileNotFoundError(f"PDF file not found: {file_path}")
 
+        self.size_bytes = self.file_path.stat().st_size
+        self._opened = False
+        self._pdf = None
+        self._page_count = None
+        self._metadata = None
+        self._cache_key = None
+        self._cached_pages = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
+
+    def open(self):
+        """
+        Read the PDF once for the cache key, page count, metadata and text.
+
+        The file bytes are hashed for the cache lookup and, on a miss, handed
+        to pdfplumber from memory, so the file is read from disk only once.
+        Calling open() again is a no-op.
+        """
+        if self._opened:
+            return
+
+        try:
+            data = self.file_path.read_bytes()
+
+            if self.cache is not None:
+                self._cache_key = self.cache.get_key_for_bytes(data)
+                self._cached_pages = self.cache.get(self._cache_key)
+
+            if self._cached_pages is not None:
+                self._page_count = len(self._cached_pages)
+            else:
+                self._pdf = pdfplumber.open(io.BytesIO(data))
+                self._page_count = len(self._pdf.pages)
+                self._metadata = self._pdf.metadata
+        except Exception as e:
+            self.logger.error(f"Error opening PDF: {e}")
+            raise
+
+        self._opened = True
+
+    def close(self):
+        """Release the in-memory PDF."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        self._opened = False
+
+    @property
+    def from_cache(self) -> bool:
+        """Whether text comes from the cache instead of pdfplumber."""
+        self.open()
+        return self._cached_pages is not None
+
+    @property
+    def progress_total(self) -> int:
+        """Total progress units (pages) read_chunks will report."""
+        return self.get_page_count()
+
     def get_page_count(self) -> int:
         """Get total number of pages in PDF."""
+        self.open()
+        return self._page_count
+
+    def get_info(self) -> dict:
+        """
+        Get PDF information from the open session.
+
+        Returns:
+            Dictionary with file metadata
+        """
+        self.open()
+        info = {
+            'filename': self.file_path.name,
+            'path': str(self.file_path.absolute()),
+            'size_bytes': self.size_bytes,
+            'size_mb': self.size_bytes / (1024 * 1024),
+            'page_count': self._page_count,
+            'file_type': 'pdf'
+        }
+        if self._metadata is not None:
+            info['metadata'] = self._metadata
+        return info
+
+    def read_chunks(self) -> Generator[Tuple[List[str], int], None, None]:
+        """
+        Read PDF pages in chunks.
+
+        With more than one worker, page chunks are extracted in worker
+        processes (each opening the PDF itself) and yielded strictly in
+        page order, so callers see the same line sequence either way.
+        Cached text is yielded in the same chunks without running pdfplumber.
+
+        Yields:
+            Tuple of (text lines of the chunk, pages in the chunk)
+        """
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                return len(pdf.pages)
+            self.open()
+
+            if self._cached_pages is not None:
+                self.logger.info(f"Using cached text for {self.file_path.name}")
+                for start_idx in range(0, len(self._cached_pages), self.chunk_size):
+                    chunk_pages = self._cached_pages[start_idx:start_idx + self.chunk_size]
+                    yield _join_pages(chunk_pages), len(chunk_pages)
+                return
+
+            all_pages = [] if self.cache is not None else None
+            for chunk_pages in self._extract_chunks():
+                if all_pages is not None:
+                    all_pages.extend(chunk_pages)
+                yield _join_pages(chunk_pages), len(chunk_pages)
+
+            if all_pages is not None:
+                self._store(all_pages)
+
         except Exception as e:
-            self.logger.error(f"Error reading PDF page count: {e}")
+            self.logger.error(f"Error reading PDF file: {e}")
             raise
 
     def read_pages_chunked(self) -> Generator[List[str], None, None]:
@@ -41,35 +223,84 @@ class StreamingPDFReader:
         Yields:
             List of text lines from each chunk of pages
         """
+        for chunk_lines, _ in self.read_chunks():
+            if chunk_lines:
+                yield chunk_lines
+
+    def read_page_lines(self) -> List[List[str]]:
+        """
+        Read the text lines of every page.
+
+        Returns:
+            List of lines per page (empty for a page that failed to extract)
+        """
+        self.open()
+        if self._cached_pages is None:
+            pages = [page for chunk_pages in self._extract_chunks() for page in chunk_pages]
+            if self.cache is not None:
+                self._store(pages)
+            return [page_lines or [] for page_lines in pages]
+
+        return self._cached_pages
+
+    def _store(self, pages: List[Optional[List[str]]]):
+        """Cache extracted pages unless a page failed (it may succeed next time)."""
+        if any(page_lines is None for page_lines in pages):
+            self.logger.warning(f"Not caching text for {self.file_path.name}: some pages failed")
+            return
+        self.cache.put(self._cache_key, pages, source_file=self.file_path.name)
+        self._cached_pages = pages
+
+    def _extract_chunks(self) -> Generator[List[Optional[List[str]]], None, None]:
+        """Extract all pages with pdfplumber, one chunk_size page range at a time."""
+        total_pages = self.get_page_count()
+        self.logger.info(f"Processing {total_pages} pages from {self.file_path.name}")
+
+        ranges = [
+            (start_idx, min(start_idx + self.chunk_size, total_pages))
+            for start_idx in range(0, total_pages, self.chunk_size)
+        ]
+
+        if self.workers > 1 and len(ranges) > 1:
+            return self._extract_parallel(ranges)
+        return self._extract_serial(ranges)
+
+    def _extract_serial(self, ranges: List[tuple]) -> Generator[List[Optional[List[str]]], None, None]:
+        """Extract page ranges one after another from the open PDF."""
+        for start_idx, end_idx in ranges:
+            self.logger.debug(f"Reading pages {start_idx + 1}-{end_idx}")
+            yield _extract_pages(self._pdf, start_idx, end_idx)
+
+    def _extract_parallel(self, ranges: List[tuple]) -> Generator[List[Optional[List[str]]], None, None]:
+        """
+        Extract page ranges in a process pool, yielding results in page order.
+
+        At most two ranges per worker are in flight, so memory stays bounded
+        when the consumer is slower than extraction. If the pool cannot start
+        (or breaks), the ranges not yet yielded are extracted in-process.
+        """
+        workers = min(self.workers, len(ranges))
+        self.logger.debug(f"Extracting {len(ranges)} page chunks with {workers} workers")
+        done = 0
+
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                total_pages = len(pdf.pages)
-                self.logger.info(f"Processing {total_pages} pages from {self.file_path.name}")
-
-                for start_idx in range(0, total_pages, self.chunk_size):
-                    end_idx = min(start_idx + self.chunk_size, total_pages)
-                    chunk_lines = []
-
-                    self.logger.debug(f"Reading pages {start_idx + 1}-{end_idx}")
-
-                    for page_num in range(start_idx, end_idx):
-                        try:
-                            page = pdf.pages[page_num]
-                            text = page.extract_text() or ""
-                            lines = text.splitlines()
-                            chunk_lines.extend(lines)
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Error extracting text from page {page_num + 1}: {e}"
-                            )
-                            continue
-
-                    if chunk_lines:
-                        yield chunk_lines
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                def submit(page_range):
+                    return executor.submit(_extract_page_range, str(self.file_path), *page_range)
 
-        except Exception as e:
-            self.logger.error(f"Error reading PDF file: {e}")
-            raise
+                remaining = iter(ranges)
+                pending = deque(submit(page_range) for page_range in islice(remaining, workers * 2))
+
+                while pending:
+                    chunk_pages = pending.popleft().result()
+                    page_range = next(remaining, None)
+                    if page_range is not None:
+                        pending.append(submit(page_range))
+                    done += 1
+                    yield chunk_pages
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            self.logger.warning(f"Page worker pool unavailable ({e}); extracting in-process")
+            yield from self._extract_serial(ranges[done:])
 
     def read_all_lines(self) -> List[str]:
         """
@@ -0,0 +1,185 @@
+"""
+On-disk cache of extracted PDF text.
+
+Text extraction with pdfplumber is the slowest step of parsing a PDF, and the
+source PDFs rarely change. Extracted lines are stored per page, keyed by the
+SHA-256 of the PDF contents and the pdfplumber version, so a re-parse after a
+parser fix only pays for the line parse. The cache directory is bounded in
+size; the least recently used entries are evicted first.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pdfplumber
+
+
+logger = logging.getLogger(__name__)
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+class PDFTextCache:
+    """Per-page PDF text lines stored as JSON files with LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/pdf_text",
+        max_size_mb: float = 200,
+        rebuild: bool = False
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_mb: Total size the directory is trimmed to after a write
+            rebuild: Ignore existing entries (they are overwritten on the next write)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.rebuild = rebuild
+        self.stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional['PDFTextCache']:
+        """
+        Build the cache from the ``cache`` configuration section.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            PDFTextCache, or None when caching is disabled
+        """
+        cache_config = config.get('cache', {}) or {}
+        if not cache_config.get('enabled', True):
+            return None
+
+        return cls(
+            cache_dir=cache_config.get('dir', '.cache/pdf_text'),
+            max_size_mb=cache_config.get('max_size_mb', 200),
+            rebuild=cache_config.get('rebuild', False)
+        )
+
+    @staticmethod
+    def get_key(file_path: str) -> str:
+        """
+        Get the cache key of a PDF.
+
+        Args:
+            file_path: Path to PDF file
+
+        Returns:
+            Hex digest of the file contents and pdfplumber version
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        digest.update(f"pdfplumber-{pdfplumber.__version__}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_key_for_bytes(data: bytes) -> str:
+        """
+        Get the cache key of PDF contents already in memory.
+
+        Args:
+            data: PDF file contents
+
+        Returns:
+            Same key get_key() returns for a file with these contents
+        """
+        digest = hashlib.sha256(data)
+        digest.update(f"pdfplumber-{pdfplumber.__version__}".encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[List[str]]]:
+        """
+        Look up the extracted lines of a PDF.
+
+        Args:
+            key: Cache key from get_key()
+
+        Returns:
+            List of lines per page, or None on a miss
+        """
+        path = self._entry_path(key)
+        if self.rebuild or not path.exists():
+            self.stats['misses'] += 1
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                pages = json.load(f)['pages']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable text cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.stats['misses'] += 1
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(path)
+        self.stats['hits'] += 1
+        return pages
+
+    def put(self, key: str, pages: List[List[str]], source_file: str = None):
+        """
+        Store the extracted lines of a PDF and trim the cache.
+
+        Args:
+            key: Cache key from get_key()
+            pages: List of lines per page
+            source_file: PDF file name, kept for inspection only
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source_file': source_file,
+                    'pdfplumber_version': pdfplumber.__version__,
+                    'pages': pages
+                }, f, ensure_ascii=False)
+            # Atomic so concurrent readers never see a partial entry
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write text cache entry for {source_file}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self.stats['writes'] += 1
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_size_mb."""
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats['evictions'] += 1
+            logger.debug(f"Evicted text cache entry {path.name}")
+
+    def clear(self):
+        """Delete all cache entries."""
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink(missing_ok=True)
@@ -1,7 +1,8 @@
 """
 Text file reading utilities for .DAT files with the same interface as PDF reader.
 """
-from typing import Generator, List
+import mmap
+from typing import Generator, List, Optional, Tuple
 from pathlib import Path
 import logging
 
@@ -9,6 +10,10 @@ import logging
 class StreamingTextReader:
     """Read text files (.DAT) with the same interface as StreamingPDFReader."""
 
+    # Progress is reported in bytes consumed, so no line count is needed up front
+    progress_unit = 'B'
+    from_cache = False
+
     def __init__(self, file_path: str, chunk_size: int = 1000):
         """
         Initialize text reader.
@@ -24,6 +29,40 @@ class StreamingTextReader:
         if not self.file_path.exists():
             raise FileNotFoundError(f"Text file not found: {file_path}")
 
+        self.size_bytes = self.file_path.stat().st_size
+        self.bytes_read = 0
+        # Known once the file has been read to the end
+        self.line_count = None
+
+    def __enter__(self):
+        """Context manager entry (the file is opened by read_chunks)."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        return False
+
+    @property
+    def progress_total(self) -> int:
+        """Total progress units (bytes) read_chunks will report."""
+        return self.size_bytes
+
+    def get_info(self) -> dict:
+        """
+        Get file information without an extra read of the file.
+
+        Returns:
+            Dictionary with file information (line_count is None until read)
+        """
+        return {
+            'filename': self.file_path.name,
+            'path': str(self.file_path.absolute()),
+            'size_bytes': self.size_bytes,
+            'size_mb': self.size_bytes / (1024 * 1024),
+            'line_count': self.line_count,
+            'file_type': 'text/dat'
+        }
+
     def get_page_count(self) -> int:
         """
         Get estimated 'page count' for text files.
@@ -38,37 +77,57 @@ class StreamingTextReader:
             self.logger.error(f"Error reading text file line count: {e}")
             raise
 
-    def read_pages_chunked(self) -> Generator[List[str], None, None]:
+    def read_chunks(self) -> Generator[Tuple[List[str], int], None, None]:
         """
-        Read text file lines in chunks.
+        Read text file lines in chunks in a single pass.
 
         Yields:
-            List of text lines from each chunk
+            Tuple of (text lines of the chunk, bytes consumed by the chunk)
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(self.file_path, 'rb') as f:
                 chunk_lines = []
+                chunk_bytes = 0
+                line_count = 0
 
-                for line_num, line in enumerate(f, 1):
+                for raw_line in f:
+                    chunk_bytes += len(raw_line)
                     # Remove carriage returns and strip
-                    line = line.replace('\r', '').rstrip('\n')
+                    line = raw_line.decode('utf-8', errors='ignore').replace('\r', '').rstrip('\n')
                     chunk_lines.append(line)
 
                     # Yield chunk when it reaches chunk_size
                     if len(chunk_lines) >= self.chunk_size:
                         self.logger.debug(f"Yielding chunk of {len(chunk_lines)} lines")
-                        yield chunk_lines
+                        line_count += len(chunk_lines)
+                        self.bytes_read += chunk_bytes
+                        yield chunk_lines, chunk_bytes
                         chunk_lines = []
+                        chunk_bytes = 0
 
                 # Yield any remaining lines
                 if chunk_lines:
                     self.logger.debug(f"Yielding final chunk of {len(chunk_lines)} lines")
-                    yield chunk_lines
+                    line_count += len(chunk_lines)
+                    self.bytes_read += chunk_bytes
+                    yield chunk_lines, chunk_bytes
+
+                self.line_count = line_count
 
         except Exception as e:
             self.logger.error(f"Error reading text file: {e}")
             raise
 
+    def read_pages_chunked(self) -> Generator[List[str], None, None]:
+        """
+        Read text file lines in chunks.
+
+        Yields:
+            List of text lines from each chunk
+        """
+        for chunk_lines, _ in self.read_chunks():
+            yield chunk_lines
+
     def read_all_lines(self) -> List[str]:
         """
         Read all lines from text file at once.
@@ -89,6 +148,129 @@ class StreamingTextReader:
             raise
 
 
+class MappedDATReader:
+    """
+    Memory-mapped, byte-level reader for fixed-width .DAT files.
+
+    The file is mapped once and split into lines in large byte blocks.
+    Empty lines and lines starting with one of skip_starts are never decoded
+    and are yielded as None, so callers keep exact line numbers without
+    parsing them.
+    """
+
+    progress_unit = 'B'
+    from_cache = False
+
+    def __init__(
+        self,
+        file_path: str,
+        chunk_bytes: int = 256 * 1024,
+        skip_starts: Tuple[bytes, ...] = ()
+    ):
+        """
+        Initialize reader.
+
+        Args:
+            file_path: Path to .DAT file
+            chunk_bytes: Approximate bytes per chunk (chunks end on a line break)
+            skip_starts: Raw line starts to yield as None (empty tuple decodes every line)
+        """
+        self.file_path = Path(file_path)
+        self.chunk_bytes = chunk_bytes
+        self.skip_starts = tuple(skip_starts)
+        self.logger = logging.getLogger(__name__)
+
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Text file not found: {file_path}")
+
+        self.size_bytes = self.file_path.stat().st_size
+        self.bytes_read = 0
+        self.skipped_lines = 0
+        # Known once the file has been read to the end
+        self.line_count = None
+
+    def __enter__(self):
+        """Context manager entry (the file is mapped by read_chunks)."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        return False
+
+    @property
+    def progress_total(self) -> int:
+        """Total progress units (bytes) read_chunks will report."""
+        return self.size_bytes
+
+    def get_info(self) -> dict:
+        """
+        Get file information without an extra read of the file.
+
+        Returns:
+            Dictionary with file information (line_count is None until read)
+        """
+        return {
+            'filename': self.file_path.name,
+            'path': str(self.file_path.absolute()),
+            'size_bytes': self.size_bytes,
+            'size_mb': self.size_bytes / (1024 * 1024),
+            'line_count': self.line_count,
+            'skipped_lines': self.skipped_lines,
+            'file_type': 'text/dat'
+        }
+
+    def read_chunks(self) -> Generator[Tuple[List[Optional[str]], int], None, None]:
+        """
+        Read the file in byte blocks of whole lines.
+
+        Yields:
+            Tuple of (lines of the block, with None for skipped lines,
+            bytes consumed by the block)
+        """
+        if self.size_bytes == 0:
+            self.line_count = 0
+            return
+
+        skip_starts = self.skip_starts
+        line_count = 0
+
+        try:
+            with open(self.file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                position = 0
+
+                while position < self.size_bytes:
+                    end = mapped.find(b'\n', position + self.chunk_bytes)
+                    end = self.size_bytes if end < 0 else end + 1
+
+                    block = mapped[position:end]
+                    raw_lines = block.replace(b'\r', b'').split(b'\n')
+                    if block.endswith(b'\n'):
+                        raw_lines.pop()  # Empty string after the final line break
+
+                    if skip_starts:
+                        # One C-level test per line; decoded like StreamingTextReader
+                        lines = [
+                            None if not raw or raw.startswith(skip_starts)
+                            else raw.decode('utf-8', errors='ignore')
+                            for raw in raw_lines
+                        ]
+                        self.skipped_lines += lines.count(None)
+                    else:
+                        lines = [raw.decode('utf-8', errors='ignore') for raw in raw_lines]
+
+                    line_count += len(lines)
+                    self.bytes_read += end - position
+                    yield lines, end - position
+                    position = end
+
+            self.line_count = line_count
+
+        except Exception as e:
+            self.logger.error(f"Error reading text file: {e}")
+            raise
+
+
 class TextFileInfo:
     """Utility class for getting text file information."""
 
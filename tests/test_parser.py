@@ -1,15 +1,34 @@
 """
 Unit tests for pairing parser.
 """
+import os
+import json
 import pytest
 from pathlib import Path
 import sys
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add project root to path (src uses package-relative imports)
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from parsers import PairingParser
-from models import Pairing, Leg
+from src.parsers import PairingParser, BidPeriodStart
+from src.parsers.line_classifier import LineClassifier, LineType, DAT_IGNORED_LINE_STARTS
+from src.parsers.patterns import DEFAULT_PATTERNS, build_pattern_registry
+from src.models import (
+    Pairing, Leg, DutyPeriod, BidPeriod, MasterData,
+    LegRecord, DutyPeriodRecord, PairingRecord, BidPeriodRecord
+)
+from src.models.time_codec import (
+    clock_to_minutes, format_clock, duration_text, duration_to_minutes, total_to_minutes,
+    rest_minutes
+)
+from src.main import find_input_files, get_output_file, open_reader
+from src.utils import (
+    StreamingPDFReader, PDFTextCache, MappedDATReader, StreamingTextReader, StreamingJSONWriter, StreamingJSONReader,
+    JSONSerializer, ColumnarWriter, ProcessingManifest, diff_hashes
+)
+from src.models.content_hash import pairing_content_hash, pairing_dict_content_hash
+from src.utils.pairing_diff import pairing_key_conditions
+from src.utils import pdf_reader
 
 
 def get_test_config():
@@ -68,6 +87,110 @@ class TestPairingParser:
         assert leg.departure_station == "ORD"
         assert leg.arrival_station == "OGG"
 
+    def test_parse_pairing_summary(self):
+        """Test fused summary parse sets strings and minutes together."""
+        config = get_test_config()
+        parser = PairingParser(config)
+        parser.current_pairing = Pairing(id="D8006")
+
+        parser._parse_pairing_summary(
+            "                 DAYS- 4 CRD-26.57* FTM-24.15* TAFB- 73.30 INT- 24.15 "
+            "NTE-   .00 M$-248.74 T/C- 2.42   .32*   1|"
+        )
+
+        pairing = parser.current_pairing
+        assert pairing.days == "4"
+        assert pairing.credit == "26.57"
+        assert pairing.credit_minutes == 26 * 60 + 57
+        assert pairing.flight_time_minutes == 24 * 60 + 15
+        assert pairing.time_away_from_base_minutes == 73 * 60 + 30
+        assert pairing.international_flight_time_minutes == 24 * 60 + 15
+        assert pairing.meal_money == "248.74"
+        assert pairing.t_c == "2.42"
+
+    def test_parse_pairing_summary_minutes_only(self):
+        """Test durations under an hour (".45") convert to minutes."""
+        config = get_test_config()
+        parser = PairingParser(config)
+        parser.current_pairing = Pairing(id="G5006")
+
+        parser._parse_pairing_summary(
+            "DAYS- 1 CRD- 5.15* FTM- .45* TAFB- 3.35 INT- .45 NTE- .00 M$- 10.89 T/C- 4.30 .20*"
+        )
+
+        assert parser.current_pairing.flight_time_minutes == 45
+        assert parser.current_pairing.credit_minutes == 315
+
+    def test_parse_fixed_width_leg(self):
+        """Test DAT leg lines are decoded by leg_columns."""
+        config = get_test_config()
+        config['parser']['leg_columns'] = {
+            'equipment': [4, 7],
+            'deadhead': [8, 10],
+            'flight_number': [11, 15],
+            'departure_station': [16, 19],
+            'arrival_station': [20, 23],
+            'departure_time': [24, 28],
+            'arrival_time': [29, 33],
+            'ground_time': [35, 40],
+            'meal_code': [41, 47],
+            'flight_time': [48, 53],
+            'accumulated_flight_time': [53, 59],
+            'duty_time': [61, 66],
+            'd_c': [69, 75],
+        }
+        parser = PairingParser(config)
+        parser.parse_line("              RPT: 0600", 1)
+
+        # No ground time or meals: token parsing would shift every time field
+        parser.parse_line(
+            "    73Y    1914 RSW CLE 1103 1348                2.45  5.44   8.03      .00"
+            "                                  --|-- -- -- -- --|--    ",
+            2
+        )
+        parser.parse_line(
+            "    37X DH 2212 EWR IAD 1950 2113  20.47 B       1.23   .00   2.08     1.23", 3
+        )
+
+        first, second = parser.current_duty_period.legs
+        assert first.flight_number == "1914"
+        assert first.ground_time == "0"
+        assert first.flight_time == "2:45"
+        assert first.accumulated_flight_time == "5:44"
+        assert first.duty_time == "8:03"
+        assert first.d_c == "0"
+        assert first.deadhead is False
+        assert first.departure_time_minutes == 11 * 60 + 3
+        assert first.flight_time_minutes == 2 * 60 + 45
+        assert first.ground_time_minutes == 0
+
+        assert second.equipment == "37X"
+        assert second.deadhead is True
+        assert second.ground_time == "20:47"
+        assert second.meal_code == "B"
+        assert second.duty_time == "2:08"
+        assert second.d_c == "1:23"
+        assert second.ground_time_minutes == 20 * 60 + 47
+        assert parser.stats['legs_fixed_width'] == 2
+
+    def test_fixed_width_leg_falls_back_to_tokens(self):
+        """Test lines that do not line up with leg_columns use the token parser."""
+        config = get_test_config()
+        config['parser']['leg_columns'] = {
+            'departure_station': [16, 19],
+            'arrival_station': [20, 23],
+            'departure_time': [24, 28],
+            'arrival_time': [29, 33],
+        }
+        parser = PairingParser(config)
+        parser.parse_line("RPT: 0820", 1)
+        parser.parse_line("78J 202 ORD OGG 0920 1444 26.31 B S 9.24 9.24 10.39 .00", 2)
+
+        leg = parser.current_duty_period.legs[0]
+        assert leg.departure_station == "ORD"
+        assert leg.flight_time == "9:24"
+        assert parser.stats['legs_tokenized'] == 1
+
     def test_time_conversion(self):
         """Test time format conversion."""
         config = get_test_config()
@@ -77,6 +200,25 @@ class TestPairingParser:
         assert parser.convert_time(".00") == "0"
         assert parser.convert_time("") == "0"
 
+    def test_overnight_minutes(self):
+        """Test rest after each duty period and the pairing's shortest and longest."""
+        parser = PairingParser(get_test_config())
+        pairing = PairingRecord(days="3", duty_periods=[
+            DutyPeriodRecord(report_time_minutes=300, release_time_minutes=820),
+            DutyPeriodRecord(report_time_minutes=815, release_time_minutes=1385),
+            DutyPeriodRecord(report_time_minutes=770, release_time_minutes=1326),
+        ])
+        parser._set_overnight_minutes(pairing)
+
+        assert [dp.overnight_minutes for dp in pairing.duty_periods] == [1435, 825, None]
+        assert pairing.min_overnight_minutes == 825
+        assert pairing.max_overnight_minutes == 1435
+
+        pairing = PairingRecord(days="1", duty_periods=[DutyPeriodRecord(release_time_minutes=900)])
+        parser._set_overnight_minutes(pairing)
+        assert pairing.min_overnight_minutes is None
+        assert pairing.max_overnight_minutes is None
+
     def test_is_leg_line(self):
         """Test leg line detection."""
         config = get_test_config()
@@ -90,6 +232,89 @@ class TestPairingParser:
         assert parser.is_leg_line("DAYS- 3") == False
 
 
+class TestLineClassifier:
+    """Test single-pass line classification."""
+
+    def test_classify_dat_lines(self):
+        """Test record types for fixed-width DAT lines."""
+        classifier = LineClassifier()
+
+        assert classifier.classify("1DSL EFF 01/30/26 THRU 03/01/26    787    DENVER") == LineType.DSL_HEADER
+        assert classifier.classify(
+            " EFF 02/07/26 THRU 03/01/26          ID D8001  - GLOBAL  (PAC)"
+        ) == LineType.PAIRING_START
+        assert classifier.classify("              RPT: 0955") == LineType.REPORT
+        assert classifier.classify("              RLS: 1610      HTL: ANA INTERCONTINENTAL") == LineType.RELEASE
+        assert classifier.classify("    78P     143 DEN NRT 1125 1540  25.55 L D S") == LineType.LEG
+        assert classifier.classify("        UX 3543 IAD IND 1235 1431  18.21") == LineType.LEG
+        assert classifier.classify("                 DAYS- 3 CRD-22.50* FTM-22.50*") == LineType.SUMMARY
+        assert classifier.classify(" DEN 787  FTM- 5,735:50  TTL- 5,880:02") == LineType.TOTALS
+        assert classifier.classify("                      TOURING TOURS  49697191260") == LineType.GROUND_TRANSPORT
+        assert classifier.classify(" ---------------------------") == LineType.SEPARATOR
+        assert classifier.classify("") == LineType.OTHER
+
+    def test_classify_compact_header(self):
+        """Test compact (PDF text) header is not mistaken for a pairing."""
+        classifier = LineClassifier()
+
+        assert classifier.classify("EFF 12/30/25 THRU 01/29/26 737 GUAM JAN 2026 12/30/25") == LineType.BID_HEADER
+
+    def test_counts(self):
+        """Test per-type counters."""
+        classifier = LineClassifier()
+        classifier.classify("RPT: 0955")
+        classifier.classify("RPT: 1005")
+        classifier.classify("RLS: 1610")
+
+        counts = classifier.get_counts()
+        assert counts[LineType.REPORT] == 2
+        assert counts[LineType.RELEASE] == 1
+        assert counts[LineType.LEG] == 0
+
+
+class TestPatternRegistry:
+    """Test shared regex pattern registry."""
+
+    def test_default_registry_shared(self):
+        """Test parsers share the precompiled registry when config has no overrides."""
+        parser = PairingParser(get_test_config())
+        assert parser.patterns is DEFAULT_PATTERNS
+
+    def test_registry_is_read_only(self):
+        """Test registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            DEFAULT_PATTERNS['report_time'] = None
+
+    def test_config_override(self):
+        """Test config patterns replace defaults without touching the shared registry."""
+        config = get_test_config()
+        config['parser']['patterns']['report_time'] = r'RPT=\s*(\d+)'
+        registry = build_pattern_registry(config)
+
+        assert registry['report_time'].search("RPT= 0955").group(1) == "0955"
+        assert DEFAULT_PATTERNS['report_time'].search("RPT= 0955") is None
+
+    def test_override_with_other_groups_ignored(self):
+        """Test old marker-style overrides ("EFF", "HTL:") keep the default patterns."""
+        config = get_test_config()
+        config['parser']['patterns'].update({'pairing_start': "EFF", 'hotel_info': "HTL:"})
+        registry = build_pattern_registry(config)
+
+        assert registry['pairing_start'] is DEFAULT_PATTERNS['pairing_start']
+        assert registry['hotel_info'] is DEFAULT_PATTERNS['hotel_info']
+
+    def test_pattern_timing(self):
+        """Test per-pattern timing is recorded when enabled."""
+        config = get_test_config()
+        config['parser']['pattern_timing'] = True
+        parser = PairingParser(config)
+        parser.parse_line("RPT: 0820", 1)
+
+        timings = parser.get_pattern_timings()
+        assert timings['report_time']['calls'] == 1
+        assert timings['release_time']['calls'] == 0
+
+
 class TestPairingModel:
     """Test pairing data models."""
 
@@ -105,6 +330,18 @@ class TestPairingModel:
         assert leg.equipment == "78J"
         assert leg.flight_number == "202"
 
+    def test_minutes_derived_when_not_given(self):
+        """Test models built directly fill *_minutes from their time strings."""
+        leg = Leg(departure_time="0920", flight_time="9:24", ground_time=".00")
+        duty_period = DutyPeriod(report_time="0820", legs=[leg])
+
+        assert leg.departure_time_minutes == 9 * 60 + 20
+        assert leg.arrival_time_minutes is None
+        assert leg.flight_time_minutes == 9 * 60 + 24
+        assert leg.ground_time_minutes == 0
+        assert duty_period.report_time_minutes == 8 * 60 + 20
+        assert duty_period.release_time_minutes is None
+
     def test_pairing_creation(self):
         """Test pairing model creation."""
         pairing = Pairing(
@@ -116,5 +353,483 @@ class TestPairingModel:
         assert len(pairing.duty_periods) == 0
 
 
+class TestTimeCodec:
+    """Test shared time conversions."""
+
+    def test_clock_times(self):
+        """Test HHMM lookups and the fallback for values outside the table."""
+        assert clock_to_minutes("0920") == 9 * 60 + 20
+        assert format_clock("0920") == "09:20"
+        assert clock_to_minutes("2400") == 24 * 60
+        assert clock_to_minutes("12A0") is None
+        assert format_clock("920") is None
+        assert clock_to_minutes(None) is None
+
+    def test_durations(self):
+        """Test H.MM and H:MM durations, including under an hour and over the table."""
+        assert duration_text("9.24") == "9:24"
+        assert duration_text(".00") == "0"
+        assert duration_text(None) == "0"
+        assert duration_to_minutes("9.24") == duration_to_minutes("9:24") == 9 * 60 + 24
+        assert duration_to_minutes(":45") == duration_to_minutes(".45") == 45
+        assert duration_to_minutes("123.45") == 123 * 60 + 45
+        assert duration_to_minutes("0") == duration_to_minutes("abc") == 0
+        assert total_to_minutes("13,578:02") == 13578 * 60 + 2
+
+    def test_rest_minutes(self):
+        """Test rest across midnight and with a missing time."""
+        assert rest_minutes(820, 1300) == 480
+        assert rest_minutes(1385, 815) == 1440 - 1385 + 815
+        assert rest_minutes(None, 815) is None
+
+
+class TestProcessDirectory:
+    """Test cases for directory input discovery."""
+
+    def test_find_input_files(self, tmp_path):
+        """Test PDF and DAT files are found regardless of extension case."""
+        for name in ("DENDSL.DAT", "ORDDSL.pdf", "IAHDSL.dat", "notes.txt"):
+            (tmp_path / name).write_text("")
+
+        names = [path.name for path in find_input_files(str(tmp_path))]
+        assert names == ["DENDSL.DAT", "IAHDSL.dat", "ORDDSL.pdf"]
+
+    def test_output_file_names(self, tmp_path):
+        """Test PDF and DAT copies of the same base get separate outputs."""
+        files = [tmp_path / "DENDSL.DAT", tmp_path / "DENDSL.pdf", tmp_path / "ORDDSL.pdf"]
+
+        assert get_output_file(files[0], tmp_path, files).name == "DENDSL_dat.json"
+        assert get_output_file(files[1], tmp_path, files).name == "DENDSL_pdf.json"
+        assert get_output_file(files[2], tmp_path, files).name == "ORDDSL.json"
+
+
+class TestPDFTextCache:
+    """Test cases for the extracted PDF text cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test pages are returned as stored, keyed by file contents."""
+        pdf = tmp_path / "ORDDSL.pdf"
+        pdf.write_bytes(b"%PDF-1.4 one")
+        cache = PDFTextCache(str(tmp_path / "cache"))
+        key = cache.get_key(str(pdf))
+
+        assert cache.get(key) is None
+        cache.put(key, [["EFF 12/30/25 THRU 01/29/26"], []], source_file=pdf.name)
+        assert cache.get(key) == [["EFF 12/30/25 THRU 01/29/26"], []]
+
+        pdf.write_bytes(b"%PDF-1.4 two")
+        assert cache.get_key(str(pdf)) != key
+        assert PDFTextCache(str(tmp_path / "cache"), rebuild=True).get(key) is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used entry is evicted when over size."""
+        cache = PDFTextCache(str(tmp_path), max_size_mb=0.001)
+        page = [["x" * 400]]
+
+        cache.put("a", page)
+        cache.put("b", page)
+        os.utime(tmp_path / "a.json", (1, 1))
+        os.utime(tmp_path / "b.json", (2, 2))
+        cache.put("c", page)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == page
+        assert cache.get("c") == page
+
+
+class TestStreamingPDFReader:
+    """Test cases for serial and multiprocess PDF page extraction."""
+
+    PAGES = [
+        [f"PAGE {page} LINE {line} DEN LAX 0800 1030" for line in range(1, 4)]
+        for page in range(1, 8)
+    ]
+
+    def write_pdf(self, tmp_path):
+        """Write a minimal PDF with one text line per row of PAGES."""
+        page_ids = [4 + 2 * i for i in range(len(self.PAGES))]
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids)
+            + b"] /Count %d >>" % len(page_ids),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>",
+        ]
+        for page_id, lines in zip(page_ids, self.PAGES):
+            stream = b"BT /F1 10 Tf 72 720 Td " + b" 0 -14 Td ".join(
+                b"(" + line.encode('ascii') + b") Tj" for line in lines
+            ) + b" ET"
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (page_id + 1)
+            )
+            objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+        data = b"%PDF-1.4\n"
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(data))
+            data += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(data)
+        data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1, xref
+        )
+
+        path = tmp_path / "TEST.pdf"
+        path.write_bytes(data)
+        return str(path)
+
+    def read_lines(self, path, workers):
+        with StreamingPDFReader(path, chunk_size=1, workers=workers) as reader:
+            return [line for chunk_lines, _ in reader.read_chunks() for line in chunk_lines]
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test page_workers > 1 yields the serial lines in page order."""
+        path = self.write_pdf(tmp_path)
+        serial = self.read_lines(path, workers=1)
+
+        assert serial == [line for lines in self.PAGES for line in lines]
+        # 7 one-page chunks, 4 in flight: results are requeued as they complete
+        assert self.read_lines(path, workers=2) == serial
+
+    def test_parallel_falls_back_when_pool_cannot_start(self, tmp_path, monkeypatch):
+        """Test pages are extracted in-process if the worker pool cannot start."""
+        def unavailable(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        monkeypatch.setattr(pdf_reader, 'ProcessPoolExecutor', unavailable)
+        path = self.write_pdf(tmp_path)
+
+        assert self.read_lines(path, workers=4) == [line for lines in self.PAGES for line in lines]
+
+
+class TestJSONSerializer:
+    """Test cases for the JSON output engines."""
+
+    @pytest.mark.parametrize("engine", ["pydantic", "orjson", "json"])
+    def test_engines_match_model_dump(self, engine):
+        """Test every engine and style serializes a model like model_dump()."""
+        pairing = Pairing(id="D8001", credit="5.30", pairing_category="GLOBAL (PAC)")
+
+        for indent in (2, None):
+            data = JSONSerializer(engine=engine, indent=indent).dumps(pairing)
+            assert json.loads(data) == pairing.model_dump()
+            assert (b'\n' in data) == bool(indent)
+
+    def test_record_matches_model(self):
+        """Test a parse-phase record serializes to the same bytes as its model."""
+        record = PairingRecord(
+            id="D8001", credit="5.30", credit_minutes=330,
+            effective_date="02/01/26", through_date="02/28/26",
+            duty_periods=[DutyPeriodRecord(report_time="0700", report_time_minutes=420, legs=[
+                LegRecord(departure_station="DEN", departure_time="1200", departure_time_minutes=720)
+            ])]
+        )
+        serializer = JSONSerializer()
+
+        assert serializer.dumps(record) == serializer.dumps(record.to_model())
+
+    def test_from_config(self):
+        """Test output.style compact drops the indent."""
+        config = {'output': {'indent': 2, 'serializer': 'json', 'style': 'compact'}}
+        serializer = JSONSerializer.from_config(config)
+
+        assert serializer.engine == 'json'
+        assert serializer.style == 'compact'
+        assert serializer.dumps({'a': [1, 2]}) == b'{"a":[1,2]}'
+
+
+class TestStreamingJSONWriter:
+    """Test cases for streaming JSON output."""
+
+    def make_master_data(self):
+        leg = Leg(departure_station="DEN", arrival_station="NRT", departure_time="1200")
+        pairings = [
+            Pairing(id=f"D800{i}", credit="5.30", duty_periods=[DutyPeriod(legs=[leg])])
+            for i in range(3)
+        ]
+        return MasterData(data=[
+            BidPeriod(bid_month_year="FEB 2026", fleet="787", pairings=pairings, ftm="1,234:56"),
+            BidPeriod(bid_month_year="FEB 2026", fleet="737"),
+        ])
+
+    def stream(self, master_data, output_path, indent):
+        with StreamingJSONWriter(output_path, indent=indent, create_backup=False) as writer:
+            for bid_period in master_data.data:
+                if bid_period.pairings:
+                    writer.start_bid_period(bid_period)
+                for pairing in bid_period.pairings:
+                    writer.write_pairing(pairing)
+                writer.end_bid_period(bid_period)
+            writer.write_metadata({'total_pairings': writer.pairings_written})
+
+    @pytest.mark.parametrize("indent", [2, 0])
+    def test_matches_model_dump(self, tmp_path, indent):
+        """Test streamed output loads to the same data as MasterData.model_dump()."""
+        master_data = self.make_master_data()
+        output_path = tmp_path / "out.json"
+        self.stream(master_data, output_path, indent)
+
+        with open(output_path) as f:
+            streamed = json.load(f)
+        assert streamed['data'] == master_data.model_dump()['data']
+        assert [list(item) for item in streamed['data']] == [
+            list(item) for item in master_data.model_dump()['data']
+        ]
+        assert streamed['metadata'] == {'total_pairings': 3}
+
+    def test_error_keeps_previous_output(self, tmp_path):
+        """Test a failed write leaves the existing file and no temp file behind."""
+        output_path = tmp_path / "out.json"
+        output_path.write_text("previous")
+
+        with pytest.raises(ValueError):
+            with StreamingJSONWriter(output_path) as writer:
+                writer.write_pairing({'id': 'D8001'})
+                raise ValueError("parse failed")
+
+        assert output_path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_parser_stream_output(self):
+        """Test stream_output hands pairings out instead of collecting them."""
+        parser = PairingParser(get_test_config(), stream_output=True)
+        parser.current_bid_period = BidPeriodRecord(fleet="787")
+        parser.current_pairing = PairingRecord(id="D8001")
+        parser._finalize_pairing()
+        parser._finalize_bid_period()
+
+        finished = parser.pop_finished()
+        assert [type(item) for item in finished] == [BidPeriodStart, PairingRecord, BidPeriodRecord]
+        assert finished[0].bid_period is finished[2]
+        assert finished[2].pairings == []
+        assert parser.finalize().data == []
+        assert parser.pop_finished() == []
+
+
+class TestStreamingJSONReader:
+    """Test cases for incremental reading of parsed output."""
+
+    @pytest.mark.parametrize("lead", [True, False])
+    def test_events_match_json_load(self, tmp_path, lead):
+        """Test events rebuild the file at any chunk size, with or without lead key fields."""
+        pairings = [Pairing(id=f"D800{i}", credit="5.30") for i in range(3)]
+        bid_period = BidPeriod(bid_month_year="FEB 2026", fleet="787", base="DENVER", ftm="1,234:56")
+        output_path = tmp_path / "out.json"
+        with StreamingJSONWriter(output_path, indent=2, create_backup=False) as writer:
+            if lead:
+                writer.start_bid_period(bid_period)
+            for pairing in pairings:
+                writer.write_pairing(pairing)
+            writer.end_bid_period(bid_period)
+            writer.write_metadata({'total_pairings': 3})
+
+        with open(output_path) as f:
+            expected = json.load(f)
+        for chunk_size in (5, 1 << 20):
+            with StreamingJSONReader(output_path, chunk_size=chunk_size) as reader:
+                events = list(reader.events())
+            assert [event for event, _ in events] == (
+                ['bid_period_start'] + ['pairing'] * 3 + ['bid_period_end']
+            )
+            assert events[0][1].get('fleet') == ("787" if lead else None)
+            assert [value for _, value in events[1:4]] == expected['data'][0]['pairings']
+            assert events[4][1] == {
+                k: v for k, v in expected['data'][0].items() if k != 'pairings'
+            }
+            assert reader.metadata == {'total_pairings': 3}
+
+
+class TestProcessingManifest:
+    """Test the incremental batch manifest."""
+
+    def test_skip_only_when_unchanged(self, tmp_path):
+        """Test a recorded parse is current until the input, config or output changes."""
+        input_file = tmp_path / "ORDDSL.DAT"
+        output_file = tmp_path / "ORDDSL.json"
+        input_file.write_text("EFF 12/30/25 THRU 01/29/26")
+        output_file.write_text("{}")
+        manifest_path = tmp_path / "manifest.json"
+
+        manifest = ProcessingManifest(manifest_path, "v1", "cfg1")
+        assert not manifest.is_parsed(input_file, output_file)
+        manifest.record_parse(input_file, output_file)
+        manifest.record_import(input_file, "db1")
+
+        reloaded = ProcessingManifest(manifest_path, "v1", "cfg1")
+        assert reloaded.is_parsed(input_file, output_file)
+        assert reloaded.is_imported(input_file, "db1")
+        assert not reloaded.is_imported(input_file, "db2")
+        assert not ProcessingManifest(manifest_path, "v2", "cfg1").is_parsed(input_file, output_file)
+        assert not ProcessingManifest(manifest_path, "v1", "cfg2").is_parsed(input_file, output_file)
+
+        input_file.write_text("EFF 01/30/26 THRU 02/27/26 787")
+        assert not ProcessingManifest(manifest_path, "v1", "cfg1").is_parsed(input_file, output_file)
+
+    def test_missing_output_is_reparsed(self, tmp_path):
+        """Test a deleted output file invalidates the recorded parse."""
+        input_file = tmp_path / "ORDDSL.DAT"
+        output_file = tmp_path / "ORDDSL.json"
+        input_file.write_text("data")
+        output_file.write_text("{}")
+
+        manifest = ProcessingManifest(tmp_path / "manifest.json", "v1", "cfg1")
+        manifest.record_parse(input_file, output_file)
+        output_file.unlink()
+
+        assert not manifest.is_parsed(input_file, output_file)
+
+
+class TestPairingDiff:
+    """Test pairing content hashes and revision diffs."""
+
+    def make_record(self, flight_number="1234"):
+        return PairingRecord(
+            id="D8001", effective_date="02/01/26", credit="5.30", credit_minutes=330,
+            date_instances=["1", "8"],
+            duty_periods=[DutyPeriodRecord(report_time="0700", report_time_minutes=420, legs=[
+                LegRecord(flight_number=flight_number, departure_station="DEN", arrival_station="NRT")
+            ])]
+        )
+
+    def test_content_hash(self):
+        """Test the hash is the same for record, model and JSON, and tracks leg changes."""
+        record = self.make_record()
+        digest = pairing_content_hash(record)
+
+        assert pairing_content_hash(record.to_model()) == digest
+        assert pairing_dict_content_hash(json.loads(JSONSerializer().dumps(record))) == digest
+        assert pairing_content_hash(self.make_record(flight_number="1235")) != digest
+
+        record.content_hash = digest
+        assert pairing_content_hash(record) == digest
+
+    def test_diff_hashes(self):
+        """Test added, removed and changed keys; a missing old hash counts as changed."""
+        old = {('D8001', '02/01/26'): 'a', ('D8002', '02/01/26'): 'b',
+               ('D8003', '02/01/26'): 'c', ('D8004', '02/01/26'): None}
+        new = {('D8001', '02/01/26'): 'a', ('D8002', '02/01/26'): 'x',
+               ('D8004', '02/01/26'): 'd', ('D8005', '02/01/26'): 'e'}
+
+        diff = diff_hashes(old, new)
+
+        assert diff.added == [('D8005', '02/01/26')]
+        assert diff.removed == [('D8003', '02/01/26')]
+        assert diff.changed == [('D8002', '02/01/26'), ('D8004', '02/01/26')]
+        assert diff.unchanged == 1
+        assert diff_hashes(new, new).has_changes is False
+
+    def test_effective_date_move(self):
+        """Test a pairing moved to a new effective date keeps the new date's legs."""
+        diff = diff_hashes({('D8001', '02/01/26'): 'a'}, {('D8001', '02/08/26'): 'a'})
+        assert diff.removed == [('D8001', '02/01/26')]
+        assert diff.added == [('D8001', '02/08/26')]
+
+        conditions = pairing_key_conditions(diff.removed, 'pairing_id', 'pairing_effective_date')
+        legs = [{'pairing_id': 'D8001', 'pairing_effective_date': date}
+                for date in ('02/01/26', '02/08/26')]
+        deleted = [leg for leg in legs
+                   if any(all(leg[field] == value for field, value in condition.items())
+                          for condition in conditions)]
+        assert deleted == [legs[0]]
+
+
+class TestColumnarWriter:
+    """Test cases for the Parquet table export."""
+
+    def test_tables(self, tmp_path):
+        """Test pairings, duty periods and legs become linked flat rows."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        master_data = TestStreamingJSONWriter().make_master_data()
+        with ColumnarWriter(tmp_path / "DEN.json") as writer:
+            for bid_period in master_data.data:
+                for pairing in bid_period.pairings:
+                    writer.write_pairing(pairing)
+                writer.end_bid_period(bid_period)
+            writer.write_metadata({'total_pairings': writer.pairings_written})
+
+        pairings = pq.read_table(tmp_path / "DEN.pairings.parquet")
+        legs = pq.read_table(tmp_path / "DEN.legs.parquet").to_pylist()
+
+        assert pairings.column('credit_minutes').to_pylist() == [330, 330, 330]
+        assert pairings.schema.field('fleet').type.value_type == 'string'
+        assert [(leg['pairing_id'], leg['duty_period_index'], leg['leg_index']) for leg in legs] == [
+            ("D8000", 0, 0), ("D8001", 0, 0), ("D8002", 0, 0)
+        ]
+        assert legs[0]['departure_station'] == "DEN"
+        assert legs[0]['departure_time_minutes'] == 720
+        assert legs[0]['fleet'] == "787"
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "DEN.duty_periods.parquet", "DEN.legs.parquet", "DEN.pairings.parquet"
+        ]
+
+
+class TestMappedDATReader:
+    """Test cases for the byte-level DAT reader."""
+
+    LINES = [
+        "1DSL EFF 01/30/26 THRU 03/01/26    787    DENVER",
+        "    EQP    FLT# DPT ARV DPTR ARVL  GRND  ML      FTM",
+        " EFF 02/07/26 THRU 03/01/26          ID D8001  - GLOBAL  (PAC)",
+        "              RPT: 0955",
+        "",
+        " " * 109 + "1|",
+        " ALPA MEAL CODE KEY",
+        " " + "-" * 40,
+    ]
+
+    def write_dat(self, tmp_path, lines=LINES):
+        path = tmp_path / "TEST.DAT"
+        path.write_bytes(("\r\n".join(lines) + "\r\n").encode('utf-8'))
+        return str(path)
+
+    def test_matches_text_reader(self, tmp_path):
+        """Test lines match StreamingTextReader and progress covers every byte."""
+        path = self.write_dat(tmp_path)
+        reader = MappedDATReader(path, chunk_bytes=64)
+
+        lines = []
+        progress = 0
+        for chunk_lines, chunk_bytes in reader.read_chunks():
+            lines.extend(chunk_lines)
+            progress += chunk_bytes
+
+        assert lines == StreamingTextReader(path).read_all_lines() == self.LINES
+        assert progress == reader.size_bytes
+        assert reader.get_info()['line_count'] == len(self.LINES)
+
+    def test_decodes_like_text_reader(self, tmp_path):
+        """Test non-ASCII text is decoded as UTF-8, not dropped."""
+        lines = self.LINES[:3] + ["                HTL: ZÜRICH MARRIOTT"]
+        path = self.write_dat(tmp_path, lines)
+        decoded = [line for chunk_lines, _ in MappedDATReader(path).read_chunks() for line in chunk_lines]
+
+        assert decoded == StreamingTextReader(path).read_all_lines() == lines
+
+    def test_open_reader_defaults_to_text_reader(self, tmp_path):
+        """Test the mmap reader is only used when processing.dat_reader asks for it."""
+        path = self.write_dat(tmp_path)
+
+        assert isinstance(open_reader(path, {'processing': {}}), StreamingTextReader)
+        assert isinstance(open_reader(path, {'processing': {'dat_reader': 'mmap'}}), MappedDATReader)
+
+    def test_skips_ignored_lines(self, tmp_path):
+        """Test ignored records come back as None in place."""
+        reader = MappedDATReader(self.write_dat(tmp_path), skip_starts=DAT_IGNORED_LINE_STARTS)
+        lines = [line for chunk_lines, _ in reader.read_chunks() for line in chunk_lines]
+
+        assert lines == [self.LINES[0], None, self.LINES[2], self.LINES[3], None, None, None, None]
+        assert reader.skipped_lines == 5
+
+    def test_ignored_starts_are_unused_records(self):
+        """Test every skipped line start classifies as a record the parser ignores."""
+        classifier = LineClassifier()
+        for start in DAT_IGNORED_LINE_STARTS:
+            line = start.decode('ascii') + "  1|"
+            assert classifier.classify(line) in (LineType.SEPARATOR, LineType.OTHER)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
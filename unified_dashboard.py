@@ -8,12 +8,14 @@ Combines the main pairing explorer with QA validation tools in one interface.
 
 import streamlit as st
 import json
-import pdfplumber
+from src.main import load_config
+from src.utils import StreamingPDFReader, PDFTextCache
+from src.models.time_codec import rest_minutes
 from pathlib import Path
 import pandas as pd
 from datetime import datetime
 import re
-from pymongo import MongoClient
+from pymongo import MongoClient, DESCENDING
 import plotly.express as px
 import plotly.graph_objects as go
 import airportsdata
@@ -95,6 +97,68 @@ def get_airport_coords(code):
         return airport['lat'], airport['lon'], airport.get('city', code)
     return None, None, code
 
+# ============================================================================
+# BID PERIOD CATALOG
+# ============================================================================
+
+# How long a loaded catalog is trusted, and how often to check for imports
+CATALOG_TTL = 3600
+CATALOG_VERSION_TTL = 30
+
+@st.cache_data(ttl=CATALOG_VERSION_TTL)
+def get_catalog_version():
+    """Time of the latest bid period import (changes whenever mongodb_import.py runs)."""
+    latest = db.bid_periods.find_one({}, {'imported_at': 1}, sort=[('imported_at', DESCENDING)])
+    return latest.get('imported_at') if latest else None
+
+@st.cache_data(ttl=CATALOG_TTL)
+def get_bid_period_catalog(version):
+    """
+    Load every bid period's _id keyed by (bid month, base, fleet).
+
+    Args:
+        version: get_catalog_version(); a new import loads a new catalog
+
+    Returns:
+        Dictionary of (bid_month_year, base, fleet) -> bid period _id
+    """
+    return {
+        (bp.get('bid_month_year'), bp.get('base'), bp.get('fleet')): bp['_id']
+        for bp in db.bid_periods.find({}, {'bid_month_year': 1, 'base': 1, 'fleet': 1})
+    }
+
+@st.cache_data(ttl=CATALOG_TTL)
+def get_facets(version):
+    """
+    Load the sidebar filter values of every bid month.
+
+    Args:
+        version: get_catalog_version(); a new import loads new facets
+
+    Returns:
+        Dictionary of bid_month_year -> facets document (written by mongodb_import.py)
+    """
+    return {doc['_id']: doc for doc in db.facets.find()}
+
+def bid_period_filter(bid_month=None, base=None, fleet=None):
+    """
+    bid_period_id condition for the selected bid month, base and fleet.
+
+    Resolved from the in-process catalog instead of querying bid_periods.
+
+    Returns:
+        {'$in': [ids]} or None when no bid month, base or fleet is selected ('All')
+    """
+    selected = [value if value and value != 'All' else None for value in (bid_month, base, fleet)]
+    if not any(selected):
+        return None
+
+    catalog = get_bid_period_catalog(get_catalog_version())
+    return {'$in': [
+        bid_period_id for key, bid_period_id in catalog.items()
+        if all(value is None or value == part for value, part in zip(selected, key))
+    ]}
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
@@ -104,30 +168,10 @@ def get_fleet_stats(bid_month=None, base=None):
     """Get fleet statistics from MongoDB, filtered by bid month and base."""
     match_stage = {}
 
-    # Filter by bid month
-    if bid_month and bid_month != 'All':
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find({'bid_month_year': bid_month}, {'_id': 1})
-        ]
-        if bid_period_ids:
-            match_stage['bid_period_id'] = {'$in': bid_period_ids}
-
-    # Filter by base
-    if base and base != 'All':
-        base_filter = {'base': base}
-        if bid_month and bid_month != 'All':
-            base_filter['bid_month_year'] = bid_month
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find(base_filter, {'_id': 1})
-        ]
-        if bid_period_ids:
-            if 'bid_period_id' in match_stage:
-                # Intersect with existing filter
-                match_stage['bid_period_id']['$in'] = list(set(match_stage['bid_period_id']['$in']) & set(bid_period_ids))
-            else:
-                match_stage['bid_period_id'] = {'$in': bid_period_ids}
+    # Filter by bid month and base (bid period ids from the catalog)
+    bid_periods = bid_period_filter(bid_month, base)
+    if bid_periods:
+        match_stage['bid_period_id'] = bid_periods
 
     pipeline = []
     if match_stage:
@@ -151,71 +195,27 @@ def get_fleet_stats(bid_month=None, base=None):
 def get_layover_stats(fleet=None, category=None, min_credit=0, max_credit=100, days=None,
                       bid_month=None, base=None):
     """Get top layover destinations with coordinates, filtered by pairing criteria."""
-    pairing_match = {'credit_minutes': {'$gte': min_credit * 60, '$lte': max_credit * 60}}
-
-    # Filter by bid month
-    if bid_month and bid_month != 'All':
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find({'bid_month_year': bid_month}, {'_id': 1})
-        ]
-        if bid_period_ids:
-            pairing_match['bid_period_id'] = {'$in': bid_period_ids}
-
-    # Filter by base
-    if base and base != 'All':
-        base_filter = {'base': base}
-        if bid_month and bid_month != 'All':
-            base_filter['bid_month_year'] = bid_month
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find(base_filter, {'_id': 1})
-        ]
-        if bid_period_ids:
-            if 'bid_period_id' in pairing_match:
-                # Intersect with existing filter
-                pairing_match['bid_period_id']['$in'] = list(set(pairing_match['bid_period_id']['$in']) & set(bid_period_ids))
-            else:
-                pairing_match['bid_period_id'] = {'$in': bid_period_ids}
+    fact_match = {'credit_minutes': {'$gte': min_credit * 60, '$lte': max_credit * 60}}
+
+    # Filter by bid month and base (bid period ids from the catalog)
+    bid_periods = bid_period_filter(bid_month, base)
+    if bid_periods:
+        fact_match['bid_period_id'] = bid_periods
 
     if fleet and fleet != 'All':
-        pairing_match['fleet'] = fleet
+        fact_match['fleet'] = fleet
 
     if category and category != 'All':
-        pairing_match['pairing_category'] = category
+        fact_match['pairing_category'] = category
 
     if days and len(days) > 0:
-        pairing_match['days'] = {'$in': [str(d) for d in days]}
-
-    # Build initial match stage for legs collection (filter directly on legs.bid_period_id)
-    legs_match = {'layover_station': {'$ne': None}}
-
-    # Add bid_period_id filter directly to legs (since legs have bid_period_id field)
-    if 'bid_period_id' in pairing_match:
-        legs_match['bid_period_id'] = pairing_match['bid_period_id']
-        # Remove from pairing_match since we're filtering on legs instead
-        pairing_match_without_bid = {k: v for k, v in pairing_match.items() if k != 'bid_period_id'}
-    else:
-        pairing_match_without_bid = pairing_match
+        fact_match['days'] = {'$in': [str(d) for d in days]}
 
+    # One layover fact per overnight, carrying the pairing's filter fields
+    # (written by mongodb_import.py), so this is one indexed $group
+    fact_match['away_from_base'] = True
     pipeline = [
-        {'$match': legs_match},
-        {
-            '$lookup': {
-                'from': 'pairings',
-                'localField': 'pairing_id',
-                'foreignField': 'id',
-                'as': 'pairing'
-            }
-        },
-        {'$unwind': '$pairing'},
-        {'$match': {f'pairing.{k}': v for k, v in pairing_match_without_bid.items()}},
-        {
-            '$addFields': {
-                'is_away_from_base': {'$ne': ['$layover_station', '$pairing.base']}
-            }
-        },
-        {'$match': {'is_away_from_base': True}},
+        {'$match': fact_match},
         {
             '$group': {
                 '_id': '$layover_station',
@@ -226,7 +226,7 @@ def get_layover_stats(fleet=None, category=None, min_credit=0, max_credit=100, d
         {'$limit': 200}
     ]
 
-    results = list(db.legs.aggregate(pipeline))
+    results = list(db.layover_facts.aggregate(pipeline))
     df = pd.DataFrame(results).rename(columns={'_id': 'station', 'count': 'layovers'})
 
     df['lat'] = df['station'].apply(lambda x: get_airport_coords(x)[0])
@@ -235,47 +235,40 @@ def get_layover_stats(fleet=None, category=None, min_credit=0, max_credit=100, d
 
     df = df.dropna(subset=['lat', 'lon'])
 
-    all_bases = set(db.pairings.distinct('base'))
+    all_bases = {base for _, base, _ in get_bid_period_catalog(get_catalog_version())}
     df = df[~df['station'].isin(all_bases)]
 
     return df
 
-@st.cache_data(ttl=600)
-def get_pairings_data(fleet=None, category=None, min_credit=0, max_credit=100, days=None,
-                      layover_station=None, min_overnight_hours=None, max_overnight_hours=None,
-                      bid_month=None, base=None):
-    """Get pairings with filters including bid month and base."""
+# Pairing Explorer rows per page
+EXPLORER_PAGE_SIZE = 50
+
+# Explorer sort, newest _id first among equal credit; backed by the
+# pairing_explorer index (mongodb_import.py) and used as the keyset cursor
+EXPLORER_SORT = [('credit_minutes', DESCENDING), ('_id', DESCENDING)]
+
+# Summary fields only: the duty periods' layover stations, not their legs
+EXPLORER_PROJECTION = {
+    'id': 1, 'fleet': 1, 'base': 1, 'pairing_category': 1,
+    'credit_minutes': 1, 'days': 1, 'flight_time_minutes': 1, 'bid_period_id': 1,
+    'duty_periods.layover_station': 1, 'min_overnight_minutes': 1, 'max_overnight_minutes': 1
+}
+
+
+def build_pairings_query(fleet=None, category=None, min_credit=0, max_credit=100, days=None,
+                         layover_station=None, min_overnight_hours=None, max_overnight_hours=None,
+                         bid_month=None, base=None):
+    """Build the pairings query for the explorer filters, including bid month and base."""
     query = {'credit_minutes': {'$gte': min_credit * 60, '$lte': max_credit * 60}}
 
-    # Primary filters
-    if bid_month and bid_month != 'All':
-        # Get bid_period_id(s) for the selected bid month
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find({'bid_month_year': bid_month}, {'_id': 1})
-        ]
-        if bid_period_ids:
-            query['bid_period_id'] = {'$in': bid_period_ids}
+    # Filter by bid month and base (bid period ids from the catalog)
+    bid_periods = bid_period_filter(bid_month, base)
+    if bid_periods:
+        query['bid_period_id'] = bid_periods
 
     if fleet and fleet != 'All':
         query['fleet'] = fleet
 
-    if base and base != 'All':
-        # Get bid_period_id(s) for the selected base
-        base_filter = {'base': base}
-        if bid_month and bid_month != 'All':
-            base_filter['bid_month_year'] = bid_month
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find(base_filter, {'_id': 1})
-        ]
-        if bid_period_ids:
-            if 'bid_period_id' in query:
-                # Intersect with existing bid_period_id filter
-                query['bid_period_id']['$in'] = list(set(query['bid_period_id']['$in']) & set(bid_period_ids))
-            else:
-                query['bid_period_id'] = {'$in': bid_period_ids}
-
     # Pairing filters
     if category and category != 'All':
         query['pairing_category'] = category
@@ -287,53 +280,72 @@ def get_pairings_data(fleet=None, category=None, min_credit=0, max_credit=100, d
     if layover_station and layover_station != 'All':
         query['duty_periods.layover_station'] = layover_station
 
-    pairings = list(db.pairings.find(
-        query,
-        {
-            'id': 1, 'fleet': 1, 'base': 1, 'pairing_category': 1,
-            'credit_minutes': 1, 'days': 1, 'flight_time_minutes': 1,
-            'duty_periods': 1, 'bid_period_id': 1, '_id': 1
-        }
-    ).limit(500))
+    # Overnight length (longest rest, stored by the parser) is filtered
+    # server-side so pages hold matching pairings only
+    if min_overnight_hours is not None or max_overnight_hours is not None:
+        overnight_range = {}
+        if min_overnight_hours is not None:
+            overnight_range['$gte'] = min_overnight_hours * 60
+        if max_overnight_hours is not None:
+            overnight_range['$lte'] = max_overnight_hours * 60
+        query['max_overnight_minutes'] = overnight_range
+
+    return query
+
+@st.cache_data(ttl=600)
+def get_pairings_page(fleet=None, category=None, min_credit=0, max_credit=100, days=None,
+                      layover_station=None, min_overnight_hours=None, max_overnight_hours=None,
+                      bid_month=None, base=None, after=None, page_size=EXPLORER_PAGE_SIZE):
+    """
+    Get one page of pairing summaries, highest credit first.
+
+    Keyset pagination: the page starts after the (credit_minutes, _id) cursor
+    of the previous page's last row, so every page is an index range scan
+    however deep the user pages.
+
+    Returns:
+        (DataFrame of summary rows, cursor for the next page or None on the last page)
+    """
+    query = build_pairings_query(fleet, category, min_credit, max_credit, days, layover_station,
+                                 min_overnight_hours, max_overnight_hours, bid_month, base)
+    if after is not None:
+        credit_minutes, object_id = after
+        query = {'$and': [query, {'$or': [
+            {'credit_minutes': {'$lt': credit_minutes}},
+            {'credit_minutes': credit_minutes, '_id': {'$lt': object_id}}
+        ]}]}
+
+    # One extra row tells whether there is a next page
+    pairings = list(db.pairings.find(query, EXPLORER_PROJECTION)
+                    .sort(EXPLORER_SORT).limit(page_size + 1))
+    next_cursor = None
+    if len(pairings) > page_size:
+        pairings = pairings[:page_size]
+        next_cursor = (pairings[-1]['credit_minutes'], pairings[-1]['_id'])
 
     for p in pairings:
         p['credit_hours'] = p['credit_minutes'] / 60
         p['flight_hours'] = p['flight_time_minutes'] / 60
-        p['layovers'] = [dp.get('layover_station') for dp in p.get('duty_periods', [])
+        p['layovers'] = [dp.get('layover_station') for dp in p.pop('duty_periods', [])
                         if dp.get('layover_station')]
+        p['max_overnight_hours'] = (p.get('max_overnight_minutes') or 0) / 60
+        p['min_overnight_hours'] = (p.get('min_overnight_minutes') or 0) / 60
 
-        # Calculate overnight durations (time between release and next report)
-        overnight_hours = []
-        duty_periods = p.get('duty_periods', [])
-        for i in range(len(duty_periods) - 1):
-            current_dp = duty_periods[i]
-            next_dp = duty_periods[i + 1]
+    return pd.DataFrame(pairings), next_cursor
 
-            release_mins = current_dp.get('release_time_minutes')
-            next_report_mins = next_dp.get('report_time_minutes')
-
-            if release_mins is not None and next_report_mins is not None:
-                # Handle overnight (next day)
-                if next_report_mins < release_mins:
-                    next_report_mins += 1440  # Add 24 hours
-
-                overnight_mins = next_report_mins - release_mins
-                overnight_hours.append(overnight_mins / 60)
-
-        p['overnight_hours'] = overnight_hours
-        p['max_overnight_hours'] = max(overnight_hours) if overnight_hours else 0
-        p['min_overnight_hours'] = min(overnight_hours) if overnight_hours else 0
-
-    df = pd.DataFrame(pairings)
-
-    # Filter by overnight length if specified
-    if not df.empty and (min_overnight_hours is not None or max_overnight_hours is not None):
-        if min_overnight_hours is not None:
-            df = df[df['max_overnight_hours'] >= min_overnight_hours]
-        if max_overnight_hours is not None:
-            df = df[df['max_overnight_hours'] <= max_overnight_hours]
+@st.cache_data(ttl=600)
+def count_pairings(fleet=None, category=None, min_credit=0, max_credit=100, days=None,
+                   layover_station=None, min_overnight_hours=None, max_overnight_hours=None,
+                   bid_month=None, base=None):
+    """Count the pairings matching the explorer filters."""
+    query = build_pairings_query(fleet, category, min_credit, max_credit, days, layover_station,
+                                 min_overnight_hours, max_overnight_hours, bid_month, base)
+    return db.pairings.count_documents(query)
 
-    return df
+@st.cache_data(ttl=600)
+def get_pairing_detail(pairing_object_id):
+    """Get one pairing with its duty periods and legs, for the detail viewer."""
+    return db.pairings.find_one({'_id': pairing_object_id})
 
 # ============================================================================
 # QA FUNCTIONS
@@ -341,12 +353,10 @@ def get_pairings_data(fleet=None, category=None, min_credit=0, max_credit=100, d
 
 @st.cache_data
 def extract_pdf_text(pdf_path: str) -> dict:
-    """Extract text from PDF by page."""
-    pages = {}
-    with pdfplumber.open(pdf_path) as pdf:
-        for i, page in enumerate(pdf.pages):
-            pages[i] = page.extract_text() or ''
-    return pages
+    """Extract text from PDF by page (through the parser's configured text cache)."""
+    cache = PDFTextCache.from_config(load_config())
+    with StreamingPDFReader(pdf_path, cache=cache) as reader:
+        return {i: '\n'.join(lines) for i, lines in enumerate(reader.read_page_lines())}
 
 @st.cache_data
 def load_json_data(json_path: str) -> dict:
@@ -513,8 +523,14 @@ with st.sidebar:
         # ========== PRIMARY FILTERS ==========
         st.subheader("🎯 Primary Filters")
 
+        # Filter values from the cached catalog and facets (no collection scans)
+        catalog_version = get_catalog_version()
+        facets = get_facets(catalog_version)
+
         # 1. Bid Month filter (NEW - First filter, REQUIRED)
-        bid_months = sorted(db.bid_periods.distinct('bid_month_year'))
+        bid_months = sorted({
+            month for month, _, _ in get_bid_period_catalog(catalog_version) if month
+        })
 
         if not bid_months:
             st.warning("No bid periods found in database")
@@ -527,15 +543,18 @@ with st.sidebar:
             help="Select the bid period to view pairings from"
         )
 
+        month_facets = facets.get(selected_bid_month)
+        if month_facets is None:
+            st.warning("No filter values stored for this bid month. "
+                       "Run: python3 mongodb_import.py --rebuild-facets")
+            month_facets = {}
+
         # 2. Fleet filter
-        fleet_options = ['All'] + sorted(db.pairings.distinct('fleet'))
+        fleet_options = ['All'] + month_facets.get('fleets', [])
         selected_fleet = st.selectbox("✈️ Fleet", fleet_options)
 
         # 3. Base filter (NEW)
-        base_options = ['All'] + sorted([
-            base for base in db.bid_periods.distinct('base')
-            if base is not None
-        ])
+        base_options = ['All'] + month_facets.get('bases', [])
         selected_base = st.selectbox("🏠 Base", base_options)
 
         st.markdown("---")
@@ -544,14 +563,15 @@ with st.sidebar:
         st.subheader("📋 Pairing Filters")
 
         # Category filter
-        category_options = ['All'] + sorted(db.pairings.distinct('pairing_category'))
+        category_options = ['All'] + month_facets.get('categories', [])
         selected_category = st.selectbox("Category", category_options)
 
-        # Credit hours filter
+        # Credit hours filter (widened for months with longer pairings)
+        credit_max_minutes = month_facets.get('credit_max_minutes') or 0
         credit_range = st.slider(
             "Credit Hours Range",
             min_value=0,
-            max_value=50,
+            max_value=max(50, -(-credit_max_minutes // 60)),
             value=(10, 30)
         )
 
@@ -569,10 +589,7 @@ with st.sidebar:
         st.subheader("🏨 Layover Filters")
 
         # Layover station filter
-        layover_stations = ['All'] + sorted([
-            station for station in db.pairings.distinct('duty_periods.layover_station')
-            if station is not None
-        ])
+        layover_stations = ['All'] + month_facets.get('layover_stations', [])
 
         # Check if a layover was selected via quick filter button
         default_layover_index = 0
@@ -623,29 +640,9 @@ if st.session_state.nav_page == 'explorer':
 
     # Build query for total pairings count
     pairings_count_query = {}
-    if selected_bid_month:
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find({'bid_month_year': selected_bid_month}, {'_id': 1})
-        ]
-        if bid_period_ids:
-            pairings_count_query['bid_period_id'] = {'$in': bid_period_ids}
-
-    if selected_base and selected_base != 'All':
-        base_filter = {'base': selected_base}
-        if selected_bid_month:
-            base_filter['bid_month_year'] = selected_bid_month
-        bid_period_ids = [
-            bp['_id'] for bp in
-            db.bid_periods.find(base_filter, {'_id': 1})
-        ]
-        if bid_period_ids:
-            if 'bid_period_id' in pairings_count_query:
-                pairings_count_query['bid_period_id']['$in'] = list(
-                    set(pairings_count_query['bid_period_id']['$in']) & set(bid_period_ids)
-                )
-            else:
-                pairings_count_query['bid_period_id'] = {'$in': bid_period_ids}
+    bid_periods = bid_period_filter(selected_bid_month, selected_base)
+    if bid_periods:
+        pairings_count_query['bid_period_id'] = bid_periods
 
     with col1:
         total_pairings = db.pairings.count_documents(pairings_count_query)
@@ -775,7 +772,7 @@ if st.session_state.nav_page == 'explorer':
     st.markdown("---")
     st.subheader("🔎 Pairing Search")
 
-    pairings_df = get_pairings_data(
+    pairing_filters = dict(
         fleet=selected_fleet,
         category=selected_category,
         min_credit=credit_range[0],
@@ -788,34 +785,58 @@ if st.session_state.nav_page == 'explorer':
         base=selected_base
     )
 
+    # Key based on active filters, to reset paging and force re-render when filters change
+    filter_key = f"{selected_bid_month}_{selected_fleet}_{selected_base}_{selected_category}_{selected_layover}"
+    page_state_key = f"{filter_key}_{credit_range}_{days_options}_{min_overnight}_{max_overnight}"
+
+    # Start cursor of every page visited so far (keyset pagination)
+    if st.session_state.get('explorer_page_key') != page_state_key:
+        st.session_state.explorer_page_key = page_state_key
+        st.session_state.explorer_cursors = [None]
+    page_cursors = st.session_state.explorer_cursors
+    page_number = len(page_cursors)
+
+    pairings_df, next_cursor = get_pairings_page(after=page_cursors[-1], **pairing_filters)
+
     if not pairings_df.empty:
-        st.write(f"Found **{len(pairings_df)}** pairings")
+        total_found = count_pairings(**pairing_filters)
+        first_row = (page_number - 1) * EXPLORER_PAGE_SIZE + 1
+        st.write(f"Found **{total_found}** pairings (showing {first_row}-{first_row + len(pairings_df) - 1})")
 
         # Prepare display columns
-        display_cols = ['id', 'fleet', 'pairing_category', 'credit_hours', 'days', 'flight_hours', 'layovers']
-
-        # Add overnight hours columns if available
-        if 'max_overnight_hours' in pairings_df.columns:
-            display_cols.append('max_overnight_hours')
+        display_cols = ['id', 'fleet', 'pairing_category', 'credit_hours', 'days', 'flight_hours', 'layovers',
+                        'max_overnight_hours']
 
         # Keep _id for detail lookup (but don't display it)
         display_df = pairings_df[display_cols + ['_id']].copy()
         display_df['credit_hours'] = display_df['credit_hours'].round(1)
         display_df['flight_hours'] = display_df['flight_hours'].round(1)
         display_df['layovers'] = display_df['layovers'].apply(lambda x: ', '.join(x) if x else 'None')
+        display_df['max_overnight_hours'] = display_df['max_overnight_hours'].round(1)
+        display_df = display_df.rename(columns={'max_overnight_hours': 'max_overnight_h'})
 
-        if 'max_overnight_hours' in display_df.columns:
-            display_df['max_overnight_hours'] = display_df['max_overnight_hours'].round(1)
-            display_df = display_df.rename(columns={'max_overnight_hours': 'max_overnight_h'})
-
-        # Display dataframe without _id column
+        # Display dataframe without _id column (already sorted by credit server-side)
         display_cols_for_table = [col for col in display_df.columns if col != '_id']
         st.dataframe(
-            display_df[display_cols_for_table].sort_values('credit_hours', ascending=False),
+            display_df[display_cols_for_table],
             hide_index=True,
             use_container_width=True
         )
 
+        prev_col, page_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("◀ Previous", disabled=page_number == 1, use_container_width=True,
+                         key="explorer_prev_page"):
+                page_cursors.pop()
+                st.rerun()
+        with page_col:
+            st.caption(f"Page {page_number} of {-(-total_found // EXPLORER_PAGE_SIZE)}")
+        with next_col:
+            if st.button("Next ▶", disabled=next_cursor is None, use_container_width=True,
+                         key="explorer_next_page"):
+                page_cursors.append(next_cursor)
+                st.rerun()
+
         # Pairing detail viewer
         st.markdown("---")
         st.subheader("🔍 Explore Pairing Details")
@@ -824,10 +845,10 @@ if st.session_state.nav_page == 'explorer':
         pairing_option_to_id = {}
         pairing_options = ['Select a pairing...']
 
-        for idx, row in display_df.iterrows():
-            # Format layovers list
-            layovers_str = row['layovers'] if isinstance(row['layovers'], str) else ', '.join(row['layovers']) if row['layovers'] else 'None'
-
+        for pairing_id, fleet, days, credit_hours, layovers_str, object_id in zip(
+            display_df['id'], display_df['fleet'], display_df['days'],
+            display_df['credit_hours'], display_df['layovers'], display_df['_id']
+        ):
             # Truncate if too long (keep first few layovers)
             if len(layovers_str) > 40:
                 layover_parts = layovers_str.split(', ')
@@ -836,23 +857,21 @@ if st.session_state.nav_page == 'explorer':
                 else:
                     layovers_str = layovers_str[:37] + '...'
 
-            option_text = f"{row['id']} - {row['fleet']} - {row['days']}D - {row['credit_hours']:.1f}h - [{layovers_str}]"
+            option_text = f"{pairing_id} - {fleet} - {days}D - {credit_hours:.1f}h - [{layovers_str}]"
             pairing_options.append(option_text)
-            pairing_option_to_id[option_text] = row['_id']
-
-        # Create a dynamic key based on active filters to force re-render when filters change
-        filter_key = f"{selected_bid_month}_{selected_fleet}_{selected_base}_{selected_category}_{selected_layover}"
+            pairing_option_to_id[option_text] = object_id
 
         selected_pairing_option = st.selectbox(
             "Choose a pairing to see detailed route map and structure:",
             options=pairing_options,
-            key=f"pairing_detail_selector_{filter_key}"
+            key=f"pairing_detail_selector_{filter_key}_{page_number}"
         )
 
         if selected_pairing_option != 'Select a pairing...':
-            # Use MongoDB _id to get the exact pairing (handles duplicate pairing IDs across bid months)
+            # Use MongoDB _id to get the exact pairing (handles duplicate pairing IDs across bid months);
+            # duty periods and legs are only fetched for the selected pairing
             pairing_object_id = pairing_option_to_id[selected_pairing_option]
-            pairing_details = db.pairings.find_one({'_id': pairing_object_id})
+            pairing_details = get_pairing_detail(pairing_object_id)
 
             if pairing_details:
                 pairing_id = pairing_details.get('id')
@@ -956,17 +975,15 @@ if st.session_state.nav_page == 'explorer':
                         # Calculate overnight duration if not last duty period
                         overnight_info = ""
                         if dp_idx < len(duty_periods) - 1:
-                            next_dp = duty_periods[dp_idx + 1]
-                            release_mins = dp.get('release_time_minutes')
-                            next_report_mins = next_dp.get('report_time_minutes')
-
-                            if release_mins is not None and next_report_mins is not None:
-                                # Handle overnight (next day)
-                                if next_report_mins < release_mins:
-                                    next_report_mins += 1440  # Add 24 hours
-                                overnight_mins = next_report_mins - release_mins
-                                overnight_hrs = overnight_mins / 60
-                                overnight_info = f" - Overnight: {overnight_hrs:.1f}h"
+                            overnight_mins = dp.get('overnight_minutes')
+                            if overnight_mins is None:
+                                # Imported before the parser stored it
+                                overnight_mins = rest_minutes(
+                                    dp.get('release_time_minutes'),
+                                    duty_periods[dp_idx + 1].get('report_time_minutes')
+                                )
+                            if overnight_mins is not None:
+                                overnight_info = f" - Overnight: {overnight_mins / 60:.1f}h"
 
                         with st.expander(f"**Day {dp_idx + 1}** - {len(legs)} flights" + (f" - Layover: {layover}" if layover else " - Return to base") + overnight_info, expanded=(dp_idx == 0)):
                             st.markdown(f"**Report:** {dp.get('report_time_formatted', dp.get('report_time', 'N/A'))} | **Release:** {dp.get('release_time_formatted', dp.get('release_time', 'N/A'))}")
@@ -1337,10 +1354,9 @@ elif st.session_state.nav_page == 'analytics':
 
     # Build query based on filters
     query = {}
-    if selected_bid_month:
-        bid_period_ids = [bp['_id'] for bp in db.bid_periods.find({'bid_month_year': selected_bid_month}, {'_id': 1})]
-        if bid_period_ids:
-            query['bid_period_id'] = {'$in': bid_period_ids}
+    bid_periods = bid_period_filter(selected_bid_month)
+    if bid_periods:
+        query['bid_period_id'] = bid_periods
 
     if selected_fleet and selected_fleet != 'All':
         query['fleet'] = selected_fleet